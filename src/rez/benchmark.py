@@ -0,0 +1,444 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the Rez Project
+
+
+"""
+Micro-benchmarks of rez internals, used by the rez-benchmark tool.
+
+Each benchmark group times a set of cases (small, repeatable operations such as
+parsing a batch of versions, or scanning a package repository), and records
+the peak memory allocated while running them. Results are plain dicts, so they
+can be stored as json and compared against a later run, to catch performance
+regressions.
+"""
+from __future__ import annotations
+
+import gc
+import os
+import os.path
+import random
+import time
+import tracemalloc
+
+from typing import Any, Callable, Iterator
+
+
+# group name -> (description, function that yields (case name, callable))
+_groups: dict[str, tuple[str, Callable[[BenchmarkEnv], Iterator[tuple[str, Callable]]]]] = {}
+
+
+def benchmark_group(name: str, description: str):
+    """Decorator that registers a benchmark group."""
+    def decorator(func):
+        _groups[name] = (description, func)
+        return func
+    return decorator
+
+
+def get_benchmark_groups() -> dict[str, str]:
+    """Get the available benchmark groups.
+
+    Returns:
+        dict: Group name -> description.
+    """
+    return dict((k, v[0]) for k, v in _groups.items())
+
+
+def make_synthetic_repository(path: str,
+                              num_families: int = 100,
+                              num_versions: int = 10,
+                              num_requires: int = 3,
+                              seed: int = 0) -> list[str]:
+    """Create a filesystem package repository of generated packages.
+
+    Family 'pkgN' requires up to `num_requires` families with a lower N, so
+    a request for the last family pulls in much of the repository. Requires
+    only have lower bounds, so that every request is solvable without
+    excessive backtracking. Package definition files are written directly,
+    rather than via package installs, so that large repositories can be
+    created quickly.
+
+    Args:
+        path (str): Repository directory. Created if it does not exist.
+        num_families (int): Number of package families.
+        num_versions (int): Number of versions per family.
+        num_requires (int): Max number of requirements per package.
+        seed (int): Random seed. The same arguments always result in the
+            same repository.
+
+    Returns:
+        list of str: The family names.
+    """
+    rand = random.Random(seed)
+    names = ["pkg%d" % i for i in range(num_families)]
+
+    for i, name in enumerate(names):
+        for j in range(num_versions):
+            version = "%d.%d.%d" % (1 + j // 5, j % 5, rand.randint(0, 3))
+
+            requires = []
+            for k in sorted(rand.sample(range(i), min(i, num_requires))):
+                major = rand.randint(1, max(1, num_versions // 5))
+                requires.append("%s-%d+" % (names[k], major))
+
+            pkg_path = os.path.join(path, name, version)
+            os.makedirs(pkg_path, exist_ok=True)
+
+            with open(os.path.join(pkg_path, "package.py"), 'w') as f:
+                f.write(
+                    "name = %r\n"
+                    "version = %r\n"
+                    "requires = %r\n"
+                    "\n"
+                    "def commands():\n"
+                    "    env.PATH.append('{root}/bin')\n"
+                    "    env.%s_ROOT = '{root}'\n"
+                    % (name, version, requires, name.upper())
+                )
+
+    return names
+
+
+class BenchmarkEnv(object):
+    """Shared state of a benchmark run.
+
+    The synthetic repository and a resolved context are created on first use,
+    and shared by the groups that need them.
+    """
+    def __init__(self, working_dir: str, num_families: int = 100,
+                 num_versions: int = 10, seed: int = 0) -> None:
+        """Create a benchmark environment.
+
+        Args:
+            working_dir (str): Directory to create the synthetic repository in.
+            num_families (int): Number of families in the synthetic repository.
+            num_versions (int): Number of versions per family.
+            seed (int): Random seed.
+        """
+        self.working_dir = working_dir
+        self.num_families = num_families
+        self.num_versions = num_versions
+        self.seed = seed
+        self._families: list[str] | None = None
+        self._context = None
+
+    @property
+    def repo_path(self) -> str:
+        return os.path.join(self.working_dir, "packages")
+
+    @property
+    def families(self) -> list[str]:
+        if self._families is None:
+            self._families = make_synthetic_repository(
+                self.repo_path,
+                num_families=self.num_families,
+                num_versions=self.num_versions,
+                seed=self.seed
+            )
+        return self._families
+
+    @property
+    def requests(self) -> list[list[str]]:
+        """Requests to resolve against the synthetic repository."""
+        families = self.families
+        n = len(families)
+        return [
+            [families[-1]],
+            [families[n // 2], families[n // 4]],
+            families[-5:]
+        ]
+
+    def resolve(self, request: list[str]):
+        from rez.resolved_context import ResolvedContext
+
+        return ResolvedContext(
+            request,
+            package_paths=[self.repo_path],
+            add_implicit_packages=False,
+            caching=False
+        )
+
+    @property
+    def context(self):
+        """A context resolved from the synthetic repository."""
+        if self._context is None:
+            self._context = self.resolve(self.requests[0])
+        return self._context
+
+
+def run_benchmarks(env: BenchmarkEnv,
+                   groups: list[str] | None = None,
+                   repeat: int = 5,
+                   track_memory: bool = True,
+                   callback: Callable[[str, str], Any] | None = None) -> dict[str, Any]:
+    """Run benchmark groups.
+
+    Each case is run `repeat` times, and its min and mean run times recorded.
+    If `track_memory` is True, every case is then run once more with memory
+    tracing enabled (which is slow, so is not timed), to find the peak memory
+    allocated by the group.
+
+    Args:
+        env (`BenchmarkEnv`): Benchmark environment.
+        groups (list of str): Groups to run, defaults to all.
+        repeat (int): Number of times to run each case.
+        track_memory (bool): Record peak memory use per group.
+        callback (callable): Called with (group, case) before each case runs.
+
+    Returns:
+        dict: Results, as {group: {"cases": {case: {"min", "mean"}},
+        "peak_memory": int}}.
+    """
+    from rez.exceptions import RezError
+
+    if groups is None:
+        groups = list(_groups.keys())
+
+    for name in groups:
+        if name not in _groups:
+            raise RezError("Unknown benchmark group: %r" % name)
+
+    results = {}
+
+    for name in groups:
+        _, func = _groups[name]
+        cases = list(func(env))
+        case_results = {}
+
+        for case_name, case_func in cases:
+            if callback:
+                callback(name, case_name)
+
+            times = []
+            for _ in range(repeat):
+                gc.collect()
+                t = time.perf_counter()
+                case_func()
+                times.append(time.perf_counter() - t)
+
+            case_results[case_name] = {
+                "min": min(times),
+                "mean": sum(times) / len(times)
+            }
+
+        group_result: dict[str, Any] = {"cases": case_results}
+
+        if track_memory:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                for _, case_func in cases:
+                    case_func()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            group_result["peak_memory"] = peak
+
+        results[name] = group_result
+
+    return results
+
+
+def compare_results(base: dict[str, Any], new: dict[str, Any],
+                    max_regression: float = 10.0,
+                    max_memory_regression: float | None = None
+                    ) -> list[dict[str, Any]]:
+    """Find regressions between two sets of benchmark results.
+
+    Case run times are compared using the min time, as this is the least
+    affected by other load on the machine. Cases and groups that are not
+    present in both results are ignored.
+
+    Args:
+        base (dict): Results to compare against, as returned by `run_benchmarks`.
+        new (dict): New results.
+        max_regression (float): Percentage increase in run time above which a
+            case is considered to have regressed.
+        max_memory_regression (float): Percentage increase in a group's peak
+            memory above which it is considered to have regressed. If None,
+            memory is not compared.
+
+    Returns:
+        list of dict: Regressions, each with keys "group", "case" (None for
+        memory regressions), "metric", "base", "new" and "change" (percent).
+    """
+    regressions = []
+
+    def _check(group, case, metric, base_value, new_value, limit):
+        if limit is None or not base_value:
+            return
+
+        change = 100.0 * (new_value - base_value) / base_value
+        if change > limit:
+            regressions.append({
+                "group": group,
+                "case": case,
+                "metric": metric,
+                "base": base_value,
+                "new": new_value,
+                "change": change
+            })
+
+    for group, new_result in new.items():
+        base_result = base.get(group)
+        if base_result is None:
+            continue
+
+        for case, new_case in new_result["cases"].items():
+            base_case = base_result["cases"].get(case)
+            if base_case is not None:
+                _check(group, case, "time", base_case["min"], new_case["min"],
+                       max_regression)
+
+        if "peak_memory" in base_result and "peak_memory" in new_result:
+            _check(group, None, "peak_memory", base_result["peak_memory"],
+                   new_result["peak_memory"], max_memory_regression)
+
+    return regressions
+
+
+# -- benchmark groups
+
+@benchmark_group("version", "Version parsing, comparison and sorting")
+def _version_group(env: BenchmarkEnv) -> Iterator[tuple[str, Callable]]:
+    from rez.version import Version
+
+    rand = random.Random(env.seed)
+    version_strs = [
+        "%d.%d.%d%s" % (rand.randint(0, 20), rand.randint(0, 20),
+                        rand.randint(0, 50), rand.choice(["", "", "a", "-beta"]))
+        for _ in range(5000)
+    ]
+    versions = [Version(x) for x in version_strs]
+
+    yield "parse", lambda: [Version(x) for x in version_strs]
+    yield "compare", lambda: [a < b for a, b in zip(versions, versions[1:])]
+    yield "sort", lambda: sorted(versions)
+
+
+@benchmark_group("requirement", "Requirement and version range parsing")
+def _requirement_group(env: BenchmarkEnv) -> Iterator[tuple[str, Callable]]:
+    from rez.version import Requirement, VersionRange, clear_parse_caches
+
+    rand = random.Random(env.seed)
+    range_strs = [
+        "%d.%d+<%d" % (rand.randint(0, 10), rand.randint(0, 10),
+                       rand.randint(11, 20))
+        for _ in range(2000)
+    ]
+    request_strs = [
+        "%sfoo%d-%s" % (rand.choice(["", "", "~", "!"]), rand.randint(0, 200), x)
+        for x in range_strs
+    ]
+
+    def _parse_ranges():
+        clear_parse_caches()
+        return [VersionRange(x) for x in range_strs]
+
+    def _parse_requirements():
+        clear_parse_caches()
+        return [Requirement(x) for x in request_strs]
+
+    def _parse_requirements_cached():
+        return [Requirement(x) for x in request_strs]
+
+    yield "parse_range", _parse_ranges
+    yield "parse_requirement", _parse_requirements
+    yield "parse_requirement_cached", _parse_requirements_cached
+
+
+@benchmark_group("package_load", "Loading of package.py files")
+def _package_load_group(env: BenchmarkEnv) -> Iterator[tuple[str, Callable]]:
+    from rez.serialise import load_from_file, clear_file_caches, FileFormat
+
+    filepaths = []
+    for name in env.families[:50]:
+        family_path = os.path.join(env.repo_path, name)
+        for version in sorted(os.listdir(family_path)):
+            filepaths.append(os.path.join(family_path, version, "package.py"))
+
+    def _load():
+        clear_file_caches()
+        return [
+            load_from_file(x, FileFormat.py, disable_memcache=True)
+            for x in filepaths
+        ]
+
+    yield "load_package_py", _load
+
+
+@benchmark_group("repo_scan", "Scans of a synthetic filesystem repository")
+def _repo_scan_group(env: BenchmarkEnv) -> Iterator[tuple[str, Callable]]:
+    from rezplugins.package_repository.filesystem import \
+        FileSystemPackageRepository
+    from rez.utils.resources import ResourcePool
+
+    path = env.repo_path
+    env.families  # creates the repository
+
+    def _new_repo():
+        pool = ResourcePool(cache_size=None)
+        return FileSystemPackageRepository(path, pool, disable_memcache=True)
+
+    def _list_families():
+        return list(_new_repo().iter_package_families())
+
+    def _list_packages():
+        repo = _new_repo()
+        return [
+            list(repo.iter_packages(x))
+            for x in repo.iter_package_families()
+        ]
+
+    def _load_variants():
+        repo = _new_repo()
+        return [
+            list(repo.iter_variants(pkg))
+            for fam in repo.iter_package_families()
+            for pkg in repo.iter_packages(fam)
+        ]
+
+    yield "list_families", _list_families
+    yield "list_packages", _list_packages
+    yield "load_variants", _load_variants
+
+
+@benchmark_group("resolve", "Resolves against a synthetic repository")
+def _resolve_group(env: BenchmarkEnv) -> Iterator[tuple[str, Callable]]:
+    from rez.package_repository import package_repository_manager
+
+    requests = env.requests
+
+    def _resolve_cold():
+        package_repository_manager.clear_caches()
+        return [env.resolve(x) for x in requests]
+
+    def _resolve_warm():
+        return [env.resolve(x) for x in requests]
+
+    yield "resolve_cold", _resolve_cold
+    yield "resolve_warm", _resolve_warm
+
+
+@benchmark_group("rex", "Rex interpretation and shell code generation")
+def _rex_group(env: BenchmarkEnv) -> Iterator[tuple[str, Callable]]:
+    context = env.context
+    parent_environ = {"PATH": "/usr/bin:/bin"}
+
+    yield "get_actions", lambda: context.get_actions(parent_environ=parent_environ)
+    yield "get_environ", lambda: context.get_environ(parent_environ=parent_environ)
+    yield "shell_code_bash", lambda: context.get_shell_code(
+        shell="bash", parent_environ=parent_environ)
+
+
+@benchmark_group("context_io", "Saving and loading of .rxt files")
+def _context_io_group(env: BenchmarkEnv) -> Iterator[tuple[str, Callable]]:
+    from rez.resolved_context import ResolvedContext
+
+    context = env.context
+    filepath = os.path.join(env.working_dir, "context.rxt")
+    context.save(filepath)
+
+    yield "save", lambda: context.save(filepath)
+    yield "load", lambda: ResolvedContext.load(filepath)
@@ -10,7 +10,7 @@ from rez.exceptions import BuildProcessError, BuildContextResolveError, \
     ReleaseHookCancellingError, RezError, ReleaseError, BuildError, \
     ReleaseVCSError, _NeverError
 from rez.utils.logging_ import print_warning
-from rez.utils.colorize import heading, Printer
+from rez.utils.colorize import heading, Printer, stream_is_tty
 from rez.resolved_context import ResolvedContext
 from rez.release_hook import create_release_hooks
 from rez.resolver import ResolverStatus
@@ -19,8 +19,10 @@ from contextlib import contextmanager
 from enum import Enum
 from shlex import quote
 import getpass
+import logging
 import os.path
 import sys
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -33,6 +35,11 @@ if TYPE_CHECKING:
 debug_print = config.debug_printer("package_release")
 
 
+# The log file that build output of the current thread is written to, if any.
+# See `capture_build_output`.
+_build_log = threading.local()
+
+
 def get_build_process_types():
     """Returns the available build process implementations."""
     from rez.plugin_managers import plugin_manager
@@ -74,6 +81,127 @@ def create_build_process(process_type: str,
                quiet=quiet)
 
 
+def get_build_log():
+    """Get the log file that build output of the current thread is written to.
+
+    Returns:
+        File object, or None if build output is not being captured.
+    """
+    return getattr(_build_log, "file", None)
+
+
+@contextmanager
+def capture_build_output(filepath: str):
+    """Capture build output of the current thread to a log file.
+
+    Python output (ie writes to sys.stdout/stderr, and rez log messages) is
+    only captured while `thread_routed_output` is active. Build commands are captured if the build
+    system runs them with `BuildSystem.get_command_output_args`.
+
+    Args:
+        filepath (str): Log file to write to. It is overwritten if it exists.
+    """
+    with open(filepath, 'w', buffering=1) as f:
+        _build_log.file = f
+        try:
+            yield f
+        finally:
+            _build_log.file = None
+
+
+class _ThreadRoutedStream(object):
+    """A stream that writes to the build log of the current thread, if any.
+    """
+    def __init__(self, stream) -> None:
+        self._stream = stream
+
+    def _target(self):
+        return get_build_log() or self._stream
+
+    def write(self, txt: str) -> int:
+        return self._target().write(txt)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return bool(stream_is_tty(self._target()))
+
+    def fileno(self) -> int:
+        return self._target().fileno()
+
+    def __getattr__(self, attr):
+        return getattr(self._stream, attr)
+
+
+class _BuildLogHandler(logging.Handler):
+    """A log handler that writes to the build log of the current thread, if any.
+    """
+    def emit(self, record: logging.LogRecord) -> None:
+        f = get_build_log()
+        if f is None:
+            return
+
+        try:
+            f.write(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
+
+
+def _not_capturing_build_output(record: logging.LogRecord) -> bool:
+    return get_build_log() is None
+
+
+def _get_rez_log_handlers() -> list[logging.Handler]:
+    # the handlers that rez log messages are sent to (see Logger.callHandlers)
+    handlers = []
+    logger = logging.getLogger("rez")
+
+    while logger:
+        handlers.extend(logger.handlers)
+        if not logger.propagate:
+            break
+        logger = logger.parent
+
+    return handlers
+
+
+@contextmanager
+def thread_routed_output():
+    """Route writes to sys.stdout/stderr, and rez log messages, to the build
+    log of each thread.
+
+    Threads that are not capturing their output (see `capture_build_output`)
+    write to the original streams and log handlers.
+    """
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = _ThreadRoutedStream(stdout)
+    sys.stderr = _ThreadRoutedStream(stderr)
+
+    # log handlers hold onto the original streams, so log messages are
+    # filtered out of them, and written by a separate handler instead
+    logger = logging.getLogger("rez")
+    log_handlers = _get_rez_log_handlers()
+    build_log_handler = _BuildLogHandler()
+
+    if log_handlers:
+        build_log_handler.setFormatter(log_handlers[0].formatter)
+        build_log_handler.setLevel(log_handlers[0].level)
+
+    for handler in log_handlers:
+        handler.addFilter(_not_capturing_build_output)
+    logger.addHandler(build_log_handler)
+
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+        logger.removeHandler(build_log_handler)
+        for handler in log_handlers:
+            handler.removeFilter(_not_capturing_build_output)
+
+
 class BuildType(Enum):
     """ Enum to represent the type of build."""
     local = 0
@@ -145,7 +273,8 @@ class BuildProcess(object):
         return self.build_system.working_dir
 
     def build(self, install_path: str | None = None, clean: bool = False,
-              install: bool = False, variants: list[int] | None = None) -> int:
+              install: bool = False, variants: list[int] | None = None,
+              jobs: int = 1) -> int:
         """Perform the build process.
 
         Iterates over the package's variants, resolves the environment for
@@ -159,6 +288,7 @@ class BuildProcess(object):
                 rebuild over the top of a previous build.
             install (bool): If True, install the build.
             variants (list of int): Indexes of variants to build, all if None.
+            jobs (int): Number of variants to build at once.
 
         Raises:
             `BuildError`: If the build failed.
@@ -208,8 +338,12 @@ class BuildProcessHelper(BuildProcess):
             print_warning("THE FOLLOWING ERROR WAS SKIPPED:\n%s" % str(e))
 
     def visit_variants(self, func, variants: list[int] | None = None,
-                       **kwargs) -> tuple[int, list[str | None]]:
-        """Iterate over variants and call a function on each."""
+                       jobs: int = 1, **kwargs) -> tuple[int, list[str | None]]:
+        """Iterate over variants and call a function on each.
+
+        If `jobs` is greater than one, variants are visited concurrently. See
+        `_visit_variants_parallel`.
+        """
         if variants:
             resolved, invalid = resolve_variant_indices(
                 variants, self.package.num_variants
@@ -221,8 +355,7 @@ class BuildProcessHelper(BuildProcess):
             variants = sorted(resolved)
 
         # iterate over variants
-        results = []
-        num_visited = 0
+        visit_variants = []
 
         for variant in self.package.iter_variants():
             if variants and variant.index not in variants:
@@ -231,12 +364,88 @@ class BuildProcessHelper(BuildProcess):
                     % (variant.index, self._n_of_m(variant)))
                 continue
 
-            # visit the variant
-            result = func(variant, **kwargs)
-            results.append(result)
-            num_visited += 1
+            visit_variants.append(variant)
+
+        if jobs > 1 and len(visit_variants) > 1:
+            results = self._visit_variants_parallel(
+                func, visit_variants, jobs, **kwargs)
+        else:
+            # visit each variant
+            results = [func(variant, **kwargs) for variant in visit_variants]
+
+        return len(visit_variants), results
+
+    def _visit_variants_parallel(self, func, variants: list[Variant],
+                                 jobs: int, **kwargs) -> list:
+        """Call a function on each variant, several variants at a time.
+
+        Each variant is visited in its own thread, with its output captured to
+        a log file in the build directory. Logs are printed in variant order,
+        as soon as that variant and all variants before it are done.
+
+        If any variant fails, variants that have not yet started are skipped,
+        and the error of the first failed variant is raised once the others
+        have finished.
+        """
+        from concurrent.futures import ThreadPoolExecutor, CancelledError
+
+        os.makedirs(self.build_path, exist_ok=True)
 
-        return num_visited, results
+        def _visit(variant, log_filepath):
+            with capture_build_output(log_filepath):
+                return func(variant, **kwargs)
+
+        self._print(
+            "\nProcessing %d variants, %d at a time. Output of each is logged to %s",
+            len(variants), jobs, self.build_path
+        )
+
+        results = []
+        error = None
+
+        with thread_routed_output():
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = []
+                for variant in variants:
+                    log_filepath = self.get_variant_log_filepath(variant)
+                    future = executor.submit(_visit, variant, log_filepath)
+                    futures.append((future, log_filepath))
+
+                for future, log_filepath in futures:
+                    try:
+                        result = future.result()
+                    except CancelledError:
+                        continue
+                    except Exception as e:
+                        if error is None:
+                            error = e
+                            for future_, _ in futures:
+                                future_.cancel()
+                    else:
+                        results.append(result)
+
+                    with open(log_filepath) as f:
+                        sys.stdout.write(f.read())
+                    sys.stdout.flush()
+
+        if error is not None:
+            raise error
+
+        return results
+
+    def get_variant_build_path(self, variant: Variant) -> str:
+        """Return the directory that the given variant is built in."""
+        if variant.index is None:
+            return self.build_path
+
+        subpath = variant._non_shortlinked_subpath
+        return os.path.join(self.build_path, subpath)
+
+    def get_variant_log_filepath(self, variant: Variant) -> str:
+        """Return the log file that the given variant's output is captured to,
+        when variants are built in parallel.
+        """
+        return os.path.join(self.build_path, "variant-%s.log" % variant.index)
 
     def get_package_install_path(self, path: str) -> str:
         """Return the installation path for a package (where its payload goes).
@@ -288,7 +497,7 @@ class BuildProcessHelper(BuildProcess):
                                   package_filter=package_filter,
                                   building=True)
         if self.verbose:
-            context.print_info()
+            context.print_info(buf=sys.stdout)
 
         # save context before possible fail, so user can debug
         rxt_filepath = os.path.join(build_path, "build.rxt")
@@ -6,11 +6,12 @@ from __future__ import annotations
 
 import argparse
 import os.path
-from typing import Sequence, TypedDict, TYPE_CHECKING
+import subprocess
+from typing import Any, Sequence, TypedDict, TYPE_CHECKING
 
 
 from rez.rex import literal
-from rez.build_process import BuildType
+from rez.build_process import BuildType, get_build_log
 from rez.exceptions import BuildSystemError
 from rez.packages import get_developer_package
 from rez.rex_bindings import VariantBinding
@@ -238,6 +239,25 @@ class BuildSystem(object):
         """
         raise NotImplementedError
 
+    def get_command_output_args(self) -> dict[str, Any]:
+        """Get the output arguments to run a build command with.
+
+        Build systems should pass these to `ResolvedContext.execute_shell` when
+        running build commands. When variants are built in parallel, this
+        redirects the command's output to the log of the variant being built.
+        Otherwise, this is empty, and output goes to the terminal as usual.
+
+        Returns:
+            dict: Extra keyword arguments for `ResolvedContext.execute_shell`.
+        """
+        f = get_build_log()
+        if f is None:
+            return {}
+
+        # so python output written so far precedes the command's output
+        f.flush()
+        return {"stdout": f, "stderr": subprocess.STDOUT}
+
     @classmethod
     def set_standard_vars(cls, executor: RexExecutor, context: ResolvedContext,
                           variant: Variant, build_type: BuildType, install: bool, build_path: str,
@@ -88,6 +88,12 @@ def run_rez_complete():
 @scriptname("_rez_fwd")
 def run_rez_fwd():
     check_production_install()
+
+    # suite tools are run directly from their launch record when possible,
+    # which avoids importing most of rez
+    from rez.utils.launch_record import try_launch
+    try_launch()
+
     from rez.cli._main import run
     return run("forward")
 
@@ -279,6 +285,7 @@ def run_rez_benchmark():
 
     settings = {
         "memcached_uri": [],
+        "cache_backend": "memcached",
         "package_filter": [],
         "package_orderers": [],
         "allow_unversioned_packages": False,
@@ -302,6 +309,13 @@ def run_rez_pkg_ignore():
     return run("pkg-ignore")
 
 
+@scriptname("rez-pkg-index")
+def run_rez_pkg_index():
+    check_production_install()
+    from rez.cli._main import run
+    return run("pkg-index")
+
+
 @scriptname("rez-mv")
 def run_rez_mv():
     check_production_install()
@@ -9,6 +9,7 @@ import sys
 import signal
 from argparse import _SubParsersAction, ArgumentParser, SUPPRESS, \
     ArgumentError
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from typing import Any
 
 
@@ -21,7 +22,7 @@ from typing import Any
 #   The '--' arg is not treated as a special case.
 # * missing: Native python argparse behavior.
 #
-subcommands: dict[str, dict[str, Any]] = {
+_builtin_subcommands: dict[str, dict[str, Any]] = {
     "bind": {},
     "build": {
         "arg_mode": "grouped"
@@ -68,6 +69,7 @@ subcommands: dict[str, dict[str, Any]] = {
     "bundle": {},
     "benchmark": {},
     "pkg-ignore": {},
+    "pkg-index": {},
     "mv": {},
     "rm": {}
 }
@@ -121,7 +123,65 @@ def load_plugin_cmd():
     return ext_plugins
 
 
-subcommands.update(load_plugin_cmd())
+class _Subcommands(Mapping):
+    """Mapping of subcommand name to behavior.
+
+    Command plugins are only loaded when the mapping is first accessed, rather
+    than when this module is imported. A command plugin takes precedence over
+    a builtin command of the same name.
+    """
+    def __init__(self, builtins: dict[str, dict[str, Any]]) -> None:
+        self.builtins = builtins
+        self._all: dict[str, dict[str, Any]] | None = None
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        return self._get_all()[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._get_all()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_all())
+
+    def __len__(self) -> int:
+        return len(self._get_all())
+
+    def _get_all(self) -> dict[str, dict[str, Any]]:
+        if self._all is None:
+            self._all = self.builtins.copy()
+            self._all.update(load_plugin_cmd())
+        return self._all
+
+
+subcommands = _Subcommands(_builtin_subcommands)
+
+
+class LazyChoices(Sequence):
+    """Argument choices that are only determined when first needed.
+
+    This is used for choices that are expensive to determine, such as the
+    available shell types (which requires loading the shell plugins), so
+    that this cost is only paid when the choices are actually checked. Note
+    that argparse formats the choices into the usage string when the argument
+    is added, unless a metavar is given.
+    """
+    def __init__(self, func: Callable[[], list[str]]) -> None:
+        self.func = func
+        self._choices: list[str] | None = None
+
+    def __getitem__(self, i):
+        return self._get_choices()[i]
+
+    def __len__(self) -> int:
+        return len(self._get_choices())
+
+    def __contains__(self, value) -> bool:
+        return value in self._get_choices()
+
+    def _get_choices(self) -> list[str]:
+        if self._choices is None:
+            self._choices = list(self.func())
+        return self._choices
 
 
 class LazySubParsersAction(_SubParsersAction):
@@ -3,7 +3,8 @@
 
 
 '''
-Run a benchmarking suite for runtime resolves.
+Run a benchmarking suite for runtime resolves, or micro-benchmarks of rez
+internals.
 '''
 from __future__ import annotations
 
@@ -42,6 +43,52 @@ def setup_parser(parser, completions: bool = False) -> None:
         "'mean_delta' is negative, then RESULTS_DIR resolves are faster on "
         "average than those in --out dir"
     )
+    parser.add_argument(
+        "--max-regression", type=float, metavar="PCT",
+        help="With --compare, exit with a nonzero code if RESULTS_DIR is more "
+        "than PCT percent slower than --out (for resolves, in mean resolve "
+        "time; for micro-benchmarks, in any case). Defaults to 10 for "
+        "micro-benchmarks, and no check for resolves"
+    )
+    parser.add_argument(
+        "--max-memory-regression", type=float, metavar="PCT",
+        help="With --compare, exit with a nonzero code if the peak memory of "
+        "any micro-benchmark group in RESULTS_DIR is more than PCT percent "
+        "higher than in --out"
+    )
+
+    micro_group = parser.add_argument_group("micro-benchmarks")
+    micro_group.add_argument(
+        "--micro", action="store_true",
+        help="Run micro-benchmarks of rez internals, rather than the resolve "
+        "benchmark"
+    )
+    micro_group.add_argument(
+        "--groups", nargs='+', metavar="GROUP",
+        help="Micro-benchmark groups to run (default: all). Use --list-groups "
+        "to list them"
+    )
+    micro_group.add_argument(
+        "--list-groups", action="store_true",
+        help="List the micro-benchmark groups"
+    )
+    micro_group.add_argument(
+        "--families", type=int, default=100, metavar="N",
+        help="Number of package families in the synthetic package repository "
+        "(default: %(default)s)"
+    )
+    micro_group.add_argument(
+        "--repeat", type=int, default=5, metavar="N",
+        help="Run each micro-benchmark N times (default: %(default)s)"
+    )
+    micro_group.add_argument(
+        "--no-memory", action="store_true",
+        help="Don't record peak memory use (this makes the run faster)"
+    )
+    micro_group.add_argument(
+        "--json", action="store_true",
+        help="Print micro-benchmark results as json"
+    )
 
 
 def load_packages() -> None:
@@ -113,6 +160,20 @@ def get_system_info():
     return info
 
 
+def get_parse_cache_info():
+    """Get hit rates of the requirement and version range parse caches.
+    """
+    from rez.version import parse_cache_stats
+
+    info = parse_cache_stats()
+
+    for stats in info.values():
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] / float(total)) if total else 0.0
+
+    return info
+
+
 def do_resolves() -> None:
     from rez import module_root_path
     from rez.resolved_context import ResolvedContext
@@ -207,6 +268,7 @@ def do_resolves() -> None:
     }
 
     stats.update(get_system_info())
+    stats["parse_cache"] = get_parse_cache_info()
 
     if resolve_times:
         resolve_times = sorted(resolve_times)
@@ -260,6 +322,73 @@ def run_benchmark() -> None:
     do_resolves()
 
 
+def do_micro_benchmarks() -> None:
+    from rez.benchmark import BenchmarkEnv, run_benchmarks
+
+    def callback(group, case):
+        print("Running %s: %s..." % (group, case), file=sys.stderr)
+
+    env = BenchmarkEnv(out_dir, num_families=_opts.families)
+    t_start = time.time()
+
+    results = run_benchmarks(
+        env,
+        groups=_opts.groups,
+        repeat=_opts.repeat,
+        track_memory=(not _opts.no_memory),
+        callback=callback
+    )
+
+    doc = {
+        "groups": results,
+        "total_run_time": time.time() - t_start,
+        "num_families": _opts.families,
+        "repeat": _opts.repeat
+    }
+    doc.update(get_system_info())
+
+    with open(os.path.join(out_dir, "micro.json"), 'w') as f:
+        f.write(json.dumps(doc, indent=2))
+
+    if _opts.json:
+        print(json.dumps(doc, indent=2))
+    else:
+        print_micro_results(results)
+
+
+def run_micro_benchmark() -> None:
+    if os.path.exists(out_dir):
+        print(
+            "Dir specified by --out (%s) must not exist" % out_dir,
+            file=sys.stderr
+        )
+        sys.exit(1)
+
+    os.mkdir(out_dir)
+    print("Writing results to %s..." % out_dir, file=sys.stderr)
+    do_micro_benchmarks()
+
+
+def print_micro_results(results) -> None:
+    from rez.utils.formatting import columnise
+
+    rows = [("GROUP", "CASE", "MIN", "MEAN", "PEAK MEMORY"),
+            ("-----", "----", "---", "----", "-----------")]
+
+    for group, result in results.items():
+        peak = result.get("peak_memory")
+        peak_str = "%.1fMb" % (peak / (1024.0 * 1024)) if peak is not None else ''
+
+        for case, case_result in result["cases"].items():
+            rows.append((group, case,
+                         "%.4fs" % case_result["min"],
+                         "%.4fs" % case_result["mean"],
+                         peak_str))
+            group = peak_str = ''
+
+    print('\n'.join(columnise(rows)))
+
+
 def print_histogram() -> None:
     n_rows = 40
     n_columns = 40
@@ -309,9 +438,48 @@ def print_histogram() -> None:
         start_t = end_t
 
 
+def compare_micro() -> None:
+    from rez.benchmark import compare_results
+
+    out_dir2 = _opts.compare
+
+    with open(os.path.join(out_dir, "micro.json")) as f:
+        results1 = json.loads(f.read())["groups"]
+    with open(os.path.join(out_dir2, "micro.json")) as f:
+        results2 = json.loads(f.read())["groups"]
+
+    max_regression = _opts.max_regression
+    if max_regression is None:
+        max_regression = 10.0
+
+    regressions = compare_results(
+        results1, results2,
+        max_regression=max_regression,
+        max_memory_regression=_opts.max_memory_regression
+    )
+
+    if _opts.json:
+        print(json.dumps(regressions, indent=2))
+    else:
+        for r in regressions:
+            what = r["group"] if r["case"] is None else \
+                "%s: %s" % (r["group"], r["case"])
+            print("REGRESSION in %s (%s): %r -> %r (%+.2f%%)"
+                  % (what, r["metric"], r["base"], r["new"], r["change"]),
+                  file=sys.stderr)
+
+    if regressions:
+        sys.exit(1)
+
+
 def compare() -> None:
     out_dir2 = _opts.compare
 
+    if os.path.exists(os.path.join(out_dir, "micro.json")) \
+            and os.path.exists(os.path.join(out_dir2, "micro.json")):
+        compare_micro()
+        return
+
     with open(os.path.join(out_dir, "resolves.json")) as f:
         summaries1 = json.loads(f.read())
     with open(os.path.join(out_dir2, "resolves.json")) as f:
@@ -357,6 +525,16 @@ def compare() -> None:
 
     print(json.dumps(delta_summary, indent=2))
 
+    if _opts.max_regression is not None:
+        mean_pct = 100.0 * (summary2["mean"] - summary1["mean"]) / summary1["mean"]
+        if mean_pct > _opts.max_regression:
+            print(
+                "REGRESSION: mean resolve time is %.2f%% slower (max is %.2f%%)"
+                % (mean_pct, _opts.max_regression),
+                file=sys.stderr
+            )
+            sys.exit(1)
+
 
 def command(opts, parser, extra_arg_groups=None) -> None:
     global _opts
@@ -367,9 +545,16 @@ def command(opts, parser, extra_arg_groups=None) -> None:
     out_dir = os.path.abspath(opts.out)
     pkg_repo_dir = os.path.join(out_dir, "packages")
 
-    if opts.histogram:
+    if opts.list_groups:
+        from rez.benchmark import get_benchmark_groups
+
+        for name, description in get_benchmark_groups().items():
+            print("%-15s%s" % (name, description))
+    elif opts.histogram:
         print_histogram()
     elif opts.compare:
         compare()
+    elif opts.micro:
+        run_micro_benchmark()
     else:
         run_benchmark()
@@ -85,6 +85,8 @@ def setup_parser_common(parser) -> None:
 
 
 def setup_parser(parser, completions: bool = False) -> None:
+    from rez.config import config
+
     parser.add_argument(
         "-c", "--clean", action="store_true",
         help="clear the current build before rebuilding.")
@@ -104,6 +106,12 @@ def setup_parser(parser, completions: bool = False) -> None:
         help="create build scripts rather than performing the full build. "
         "Running these scripts will place you into a build environment, where "
         "you can invoke the build system directly.")
+    parser.add_argument(
+        "-j", "--jobs", type=int, metavar="N",
+        default=config.build_variant_jobs,
+        help="number of variants to build at once (default: %(default)s). "
+        "The output of each variant is logged to the build directory, and "
+        "printed in order as each variant completes.")
     parser.add_argument(
         "--view-pre", action="store_true",
         help="just view the preprocessed package definition, and exit.")
@@ -165,7 +173,8 @@ def command(opts, parser, extra_arg_groups=None) -> None:
         builder.build(install_path=opts.prefix,
                       clean=opts.clean,
                       install=opts.install,
-                      variants=opts.variants)
+                      variants=opts.variants,
+                      jobs=opts.jobs)
     except BuildContextResolveError as e:
         print(str(e), file=sys.stderr)
 
@@ -21,6 +21,9 @@ def setup_parser(parser, completions: bool = False) -> None:
     parser.add_argument(
         "--source-list", dest="source_list", action="store_true",
         help="list the config files sourced")
+    parser.add_argument(
+        "--profile-settings", dest="profile_settings", action="store_true",
+        help="list the time taken to evaluate each setting, slowest first")
     FIELD_action = parser.add_argument(
         "FIELD", type=str, nargs='?',
         help="print the value of a specific setting")
@@ -45,6 +48,16 @@ def command(opts, parser, extra_arg_groups=None):
             print(filepath)
         return
 
+    if opts.profile_settings:
+        from rez.utils.formatting import columnise
+
+        times = config._profile()
+        rows = [("SETTING", "TIME (ms)"), ("-------", "---------")]
+        rows.extend((key, "%.3f" % (t * 1000)) for key, t in times)
+        rows.append(("(total)", "%.3f" % (sum(x[1] for x in times) * 1000)))
+        print('\n'.join(columnise(rows)))
+        return
+
     data = config.data
     if opts.FIELD:
         keys = opts.FIELD.split('.')
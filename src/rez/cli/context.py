@@ -24,18 +24,20 @@ os.environ.update({
     "REZ_WRITE_PACKAGE_CACHE": "False"
 })
 
-from rez.rex import OutputStyle  # noqa
-
 
 def setup_parser(parser, completions: bool = False) -> None:
-    from rez.system import system
-    from rez.shells import get_shell_types
+    from rez.cli._util import LazyChoices
 
-    formats = get_shell_types() + ['dict', 'table']
-    if json is not None:
-        formats.append('json')
+    def _get_formats():
+        from rez.shells import get_shell_types
+        formats = get_shell_types() + ['dict', 'table']
+        if json is not None:
+            formats.append('json')
+        return formats
 
-    output_styles = [e.name for e in OutputStyle]
+    def _get_output_styles():
+        from rez.rex import OutputStyle
+        return [e.name for e in OutputStyle]
 
     parser.add_argument(
         "--req", "--print-request", dest="print_request",
@@ -79,12 +81,15 @@ def setup_parser(parser, completions: bool = False) -> None:
         "-i", "--interpret", action="store_true",
         help="interpret the context and print the resulting code")
     parser.add_argument(
-        "-f", "--format", type=str, choices=formats, default=system.shell,
-        help="print interpreted output in the given format. Ignored if "
-        "--interpret is not present (default: %(default)s). If one of "
-        "table, dict or json, the environ dict is printed.")
+        "-f", "--format", type=str, choices=LazyChoices(_get_formats),
+        metavar="FORMAT",
+        help="print interpreted output in the given format, either a shell "
+        "type, or one of table, dict or json. Ignored if --interpret is not "
+        "present (default: the current shell). If one of table, dict or json, "
+        "the environ dict is printed.")
     parser.add_argument(
-        "-s", "--style", type=str, default="file", choices=output_styles,
+        "-s", "--style", type=str, default="file",
+        choices=LazyChoices(_get_output_styles), metavar="STYLE",
         help="Set code output style. Ignored if --interpret is not present "
         "(default: %(default)s)")
     parser.add_argument(
@@ -111,7 +116,9 @@ def setup_parser(parser, completions: bool = False) -> None:
 
 def command(opts, parser, extra_arg_groups=None) -> None:
     from rez.cli._util import print_items
+    from rez.rex import OutputStyle
     from rez.status import status
+    from rez.system import system
     from rez.utils.formatting import columnise, PackageRequest
     from rez.resolved_context import ResolvedContext
     from rez.utils.graph_utils import save_graph, view_graph, prune_graph
@@ -191,7 +198,7 @@ def command(opts, parser, extra_arg_groups=None) -> None:
         else:  # json
             print(json.dumps(env, sort_keys=True, indent=4))
     else:
-        code = rc.get_shell_code(shell=opts.format,
+        code = rc.get_shell_code(shell=(opts.format or system.shell),
                                  parent_environ=parent_env,
                                  style=OutputStyle[opts.style])
         print(code)
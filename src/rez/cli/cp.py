@@ -57,30 +57,151 @@ def setup_parser(parser, completions: bool = False) -> None:
     parser.add_argument(
         "--variant-uri", metavar="URI",
         help="copy variant with the given URI. Ignores --variants.")
+    parser.add_argument(
+        "--bulk", action="store_true",
+        help="bulk mode. Copy every package matching the given PKG requests, or "
+        "every package in the search path if no PKG is given. Packages are "
+        "copied concurrently.")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=4, metavar="N",
+        help="number of packages to copy at once in bulk mode (default: %(default)s)")
+    parser.add_argument(
+        "--journal", metavar="FILE",
+        help="record progress of a bulk copy to FILE. If the copy is rerun with "
+        "the same journal, variants that were already copied are skipped.")
     pkg_action = parser.add_argument(
-        "PKG", nargs='?',
-        help="package to copy")
+        "PKG", nargs='*',
+        help="package to copy. Any number of package requests can be given in "
+        "bulk mode")
 
     if completions:
         from rez.cli._complete_util import PackageCompleter
         pkg_action.completer = PackageCompleter
 
 
-def command(opts, parser, extra_arg_groups=None) -> None:
+def get_search_paths(opts):
     import os
-    import sys
-
     from rez.config import config
+
+    if opts.paths:
+        paths = opts.paths.split(os.pathsep)
+        return [x for x in paths if x]
+    elif opts.no_local:
+        return config.nonlocal_packages_path
+    else:
+        return None
+
+
+def get_dest_repository(opts):
+    import sys
     from rez.package_repository import package_repository_manager
+
+    dest_pkg_repo = package_repository_manager.get_repository(opts.dest_path)
+
+    if (not opts.allow_empty) and dest_pkg_repo.is_empty():
+        print((
+            "Attempting to copy a package into an EMPTY repository. Are you "
+            "sure that --dest-path is the correct path? This should not "
+            "include package name and/or version."
+            "\n\n"
+            "If this is a valid new package repository, use the "
+            "--allow-empty flag to continue."
+        ), file=sys.stderr)
+        sys.exit(1)
+
+    return dest_pkg_repo
+
+
+def bulk_copy(opts, parser) -> None:
+    import sys
+
+    from rez.package_copy import copy_packages
+    from rez.packages import iter_packages, iter_package_families
+    from rez.utils.formatting import PackageRequest, readable_memory_size, \
+        readable_time_duration
+    from rez.utils.logging_ import print_error
+
+    if opts.variant_uri or opts.variants or opts.rename or opts.reversion:
+        parser.error("--bulk cannot be used with --variant-uri, --variants, "
+                     "--rename or --reversion.")
+
+    if not opts.dest_path:
+        parser.error("--dest-path must be specified in bulk mode.")
+
+    paths = get_search_paths(opts)
+    dest_pkg_repo = get_dest_repository(opts)
+
+    def _iter_packages():
+        if opts.PKG:
+            for pkg_str in opts.PKG:
+                req = PackageRequest(pkg_str)
+                for package in iter_packages(req.name, range_=req.range_, paths=paths):
+                    yield package
+        else:
+            for family in iter_package_families(paths=paths):
+                for package in family.iter_packages():
+                    yield package
+
+    verb = "would be" if opts.dry_run else "were"
+
+    def _callback(src_variant, key, value):
+        if key == "failed":
+            print_error("Failed to copy %s: %s", src_variant.uri, value)
+        elif opts.verbose or key == "copied":
+            print("%s %s" % (key, src_variant.uri))
+
+    result = copy_packages(
+        packages=_iter_packages(),
+        dest_repository=dest_pkg_repo,
+        jobs=opts.jobs,
+        journal_filepath=opts.journal,
+        callback=_callback,
+        overwrite=opts.overwrite,
+        shallow=opts.shallow,
+        follow_symlinks=opts.follow_symlinks,
+        keep_timestamp=opts.keep_timestamp,
+        force=opts.force,
+        dry_run=opts.dry_run
+    )
+
+    num_copied = len(result["copied"])
+    secs = result["seconds"]
+
+    print("\n%d variants %s copied, %d %s skipped (target exists), "
+          "%d %s skipped (journaled), %d failed."
+          % (num_copied, verb, len(result["skipped"]), verb,
+             len(result["journaled"]), verb, len(result["failed"])))
+
+    if num_copied and not opts.dry_run:
+        print("Copied %s in %s (%s/s, %.2f variants/s)" % (
+            readable_memory_size(result["size"]),
+            readable_time_duration(int(round(secs))),
+            readable_memory_size(result["size"] / secs if secs else 0),
+            num_copied / secs if secs else 0
+        ))
+
+    if result["failed"]:
+        sys.exit(1)
+
+
+def command(opts, parser, extra_arg_groups=None) -> None:
+    import sys
+
     from rez.package_copy import copy_package
     from rez.utils.formatting import PackageRequest
     from rez.packages import iter_packages, get_variant_from_uri
 
+    if opts.bulk:
+        bulk_copy(opts, parser)
+        return
+
     if opts.variant_uri:
         if opts.PKG:
             parser.error("Supply PKG or --variant-uri, not both.")
     elif not opts.PKG:
         parser.error("Expected PKG.")
+    elif len(opts.PKG) > 1:
+        parser.error("Only one PKG can be copied, unless --bulk is used.")
 
     if (not opts.dest_path) and not (opts.rename or opts.reversion):
         parser.error("--dest-path must be specified unless --rename or "
@@ -99,15 +220,8 @@ def command(opts, parser, extra_arg_groups=None) -> None:
         variant_indexes = [variant.index]
 
     else:
-        if opts.paths:
-            paths = opts.paths.split(os.pathsep)
-            paths = [x for x in paths if x]
-        elif opts.no_local:
-            paths = config.nonlocal_packages_path
-        else:
-            paths = None
-
-        req = PackageRequest(opts.PKG)
+        paths = get_search_paths(opts)
+        req = PackageRequest(opts.PKG[0])
 
         it = iter_packages(
             name=req.name,
@@ -136,18 +250,7 @@ def command(opts, parser, extra_arg_groups=None) -> None:
     # into a nested location within an existing package.
     #
     if opts.dest_path:
-        dest_pkg_repo = package_repository_manager.get_repository(opts.dest_path)
-
-        if (not opts.allow_empty) and dest_pkg_repo.is_empty():
-            print((
-                "Attempting to copy a package into an EMPTY repository. Are you "
-                "sure that --dest-path is the correct path? This should not "
-                "include package name and/or version."
-                "\n\n"
-                "If this is a valid new package repository, use the "
-                "--allow-empty flag to continue."
-            ), file=sys.stderr)
-            sys.exit(1)
+        dest_pkg_repo = get_dest_repository(opts)
     else:
         dest_pkg_repo = src_pkg.repository
 
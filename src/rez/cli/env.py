@@ -11,15 +11,24 @@ from __future__ import annotations
 def setup_parser(parser, completions: bool = False) -> None:
     from argparse import SUPPRESS
     from rez.config import config
-    from rez.system import system
-    from rez.shells import get_shell_types
+    from rez.cli._util import LazyChoices
     import os
 
-    shells = get_shell_types()
+    def _get_shells():
+        from rez.shells import get_shell_types
+        return get_shell_types()
+
+    # determining the current shell is slow, and not needed for completions
+    if completions:
+        default_shell = None
+    else:
+        from rez.system import system
+        default_shell = config.default_shell or system.shell
 
     parser.add_argument(
-        "--shell", dest="shell", type=str, choices=shells,
-        default=config.default_shell or system.shell,
+        "--shell", dest="shell", type=str, choices=LazyChoices(_get_shells),
+        metavar=("SHELL" if completions else None),
+        default=default_shell,
         help="target shell type (default: %(default)s)")
     parser.add_argument(
         "--rcfile", type=str,
@@ -94,6 +103,12 @@ def setup_parser(parser, completions: bool = False) -> None:
     parser.add_argument(
         "--patch-rank", type=int, metavar="N", default=0,
         help="patch rank. Ignored if --patch is not present")
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="resolve the patched request starting from the current resolve, "
+        "which is much faster for large contexts. Packages that are not "
+        "patched and have had no releases since stay at their current "
+        "version where possible. Ignored if --patch is not present")
     parser.add_argument(
         "--no-cache", dest="no_cache", action="store_true",
         help="do not fetch cached resolves")
@@ -117,6 +132,11 @@ def setup_parser(parser, completions: bool = False) -> None:
     parser.add_argument(
         "--stats", action="store_true",
         help="print advanced solver stats")
+    parser.add_argument(
+        "--profile-solve", action="store_true",
+        help="profile the solve, and print time spent per solver operation "
+        "and per package family load. The profile is also stored in the "
+        "context (see --output)")
     parser.add_argument(
         "--no-pkg-cache", action="store_true",
         help="Disable package caching")
@@ -125,6 +145,24 @@ def setup_parser(parser, completions: bool = False) -> None:
         help="If provided, override the rezconfig's package_cache_async key. "
              "If 'sync', the process will block until packages are cached. "
              "If 'async', the process will not block while packages are cached.")
+    batch_action = parser.add_argument(
+        "--batch", type=str, metavar="FILE",
+        help="resolve each request listed in FILE (one per line, '-' to read "
+        "from stdin) and store the results, instead of starting a shell. "
+        "Resolves share loaded packages, which is much faster than resolving "
+        "each request separately")
+    parser.add_argument(
+        "--batch-dir", type=str, metavar="DIR", default=".",
+        help="directory to store batch results in, as <N>.rxt or <N>.json "
+        "where N is the request index (default: %(default)s)")
+    parser.add_argument(
+        "--batch-format", choices=["rxt", "json"], default="rxt",
+        help="format of batch results; 'json' stores a summary of each "
+        "resolve rather than the full context (default: %(default)s)")
+    parser.add_argument(
+        "--batch-procs", type=int, metavar="N", default=1,
+        help="number of processes to resolve batch requests in "
+        "(default: %(default)s)")
     parser.add_argument(
         "--pre-command", type=str, help=SUPPRESS)
     PKG_action = parser.add_argument(
@@ -139,6 +177,7 @@ def setup_parser(parser, completions: bool = False) -> None:
             ExecutablesCompleter, AndCompleter, SequencedCompleter
         command_action.completer = AndCompleter(ExecutablesCompleter, FilesCompleter())
         input_action.completer = FilesCompleter(dirs=False, file_patterns=["*.rxt"])
+        batch_action.completer = FilesCompleter()
         PKG_action.completer = PackageCompleter
         extra_0_action.completer = SequencedCompleter(
             "extra_0", ExecutablesCompleter, FilesCompleter())
@@ -162,6 +201,7 @@ def command(opts, parser, extra_arg_groups=None) -> None:
         command = extra_arg_groups[0] or None
 
     context = None
+    seed_context = None
     request = opts.PKG
     t = get_epoch_time_from_str(opts.time) if opts.time else None
 
@@ -172,6 +212,10 @@ def command(opts, parser, extra_arg_groups=None) -> None:
         pkg_paths = opts.paths.split(os.pathsep)
         pkg_paths = [os.path.expanduser(x) for x in pkg_paths if x]
 
+    if opts.batch:
+        if opts.PKG or opts.input or opts.patch:
+            parser.error("Cannot use --batch with PKG(s), --input or --patch.")
+
     if opts.input:
         if opts.PKG and not opts.patch:
             parser.error("Cannot use --input and provide PKG(s), unless patching.")
@@ -190,6 +234,8 @@ def command(opts, parser, extra_arg_groups=None) -> None:
         request = context.get_patched_request(request,
                                               strict=opts.strict,
                                               rank=opts.patch_rank)
+        if opts.incremental:
+            seed_context = context
         context = None
 
     if context is None:
@@ -214,6 +260,22 @@ def command(opts, parser, extra_arg_groups=None) -> None:
         else:
             package_cache_mode = None
 
+        if opts.batch:
+            returncode = _resolve_batch(
+                opts,
+                timestamp=t,
+                package_paths=pkg_paths,
+                building=opts.build,
+                package_filter=package_filter,
+                add_implicit_packages=(not opts.no_implicit),
+                max_fails=opts.max_fails,
+                time_limit=opts.time_limit,
+                caching=(not opts.no_cache),
+                package_caching=(not opts.no_pkg_cache),
+                package_cache_async=package_cache_mode,
+            )
+            sys.exit(returncode)
+
         # perform the resolve
         context = ResolvedContext(
             package_requests=request,
@@ -230,8 +292,13 @@ def command(opts, parser, extra_arg_groups=None) -> None:
             print_stats=opts.stats,
             package_caching=(not opts.no_pkg_cache),
             package_cache_async=package_cache_mode,
+            seed_context=seed_context,
+            profile_solve=opts.profile_solve,
         )
 
+        if opts.profile_solve:
+            context.print_solve_profile(buf=sys.stderr)
+
     success = (context.status == ResolverStatus.solved)
 
     if not success:
@@ -277,3 +344,58 @@ def command(opts, parser, extra_arg_groups=None) -> None:
         block=True)
 
     sys.exit(returncode)
+
+
+def _resolve_batch(opts, **kwargs) -> int:
+    from rez.resolve_batch import read_batch_requests, iter_resolve_batch
+    from rez.resolver import ResolverStatus
+    import json
+    import os
+    import os.path
+    import sys
+
+    if opts.batch == '-':
+        requests = read_batch_requests(sys.stdin)
+    else:
+        with open(opts.batch) as f:
+            requests = read_batch_requests(f)
+
+    os.makedirs(opts.batch_dir, exist_ok=True)
+    width = len(str(max(len(requests) - 1, 0)))
+    num_failed = 0
+
+    contexts = iter_resolve_batch(requests, processes=opts.batch_procs, **kwargs)
+
+    for i, (request, context) in enumerate(zip(requests, contexts)):
+        filename = "%0*d.%s" % (width, i, opts.batch_format)
+        filepath = os.path.join(opts.batch_dir, filename)
+        success = (context.status == ResolverStatus.solved)
+
+        if opts.batch_format == "rxt":
+            context.save(filepath)
+        else:
+            doc = {
+                "request": request,
+                "status": context.status.name,
+                "resolved_packages": [
+                    x.qualified_name
+                    for x in (context.resolved_packages or [])
+                ],
+                "failure_description": context.failure_description,
+                "solve_time": context.solve_time,
+                "load_time": context.load_time,
+                "from_cache": context.from_cache
+            }
+            with open(filepath, 'w') as f:
+                json.dump(doc, f, indent=4)
+
+        if not success:
+            num_failed += 1
+            print("request %d failed: %s" % (i, ' '.join(request)),
+                  file=sys.stderr)
+
+    print("%d of %d requests resolved, results written to %s"
+          % (len(requests) - num_failed, len(requests), opts.batch_dir),
+          file=sys.stderr)
+
+    return 1 if num_failed else 0
@@ -3,7 +3,7 @@
 
 
 """
-Manage and query memcache server(s).
+Manage and query memcache server(s), or the local cache store.
 """
 from __future__ import annotations
 
@@ -79,12 +79,12 @@ def command(opts, parser, extra_arg_groups=None) -> None:
     from rez.config import config
     from rez.packages import iter_package_families, iter_packages
     from rez.utils.yaml import dump_yaml
-    from rez.utils.memcached import Client
+    from rez.utils.memcached import Client, get_cache_servers
     from rez.utils.formatting import columnise, readable_time_duration, \
         readable_memory_size
     import sys
 
-    memcache_client = Client(servers=config.memcached_uri,
+    memcache_client = Client(servers=get_cache_servers(),
                              debug=config.debug_memcache)
 
     if not memcache_client:
@@ -18,7 +18,10 @@ def setup_parser(parser, completions: bool = False) -> None:
         "package",
         "variant_uri",
         "orig_path",
-        "cache_path"
+        "cache_path",
+        "requests",
+        "size",
+        "eta"
     )
 
     group = parser.add_mutually_exclusive_group()
@@ -39,6 +42,10 @@ def setup_parser(parser, completions: bool = False) -> None:
         "--clean", action="store_true",
         help="Remove unused variants and other cache files pending deletion"
     )
+    group.add_argument(
+        "--rebuild-index", action="store_true",
+        help="Rebuild the index of cached variants from the cache contents"
+    )
     # run as a daemon that adds pending variants to the cache, then exits
     group.add_argument(
         "--daemon", action="store_true", help=SUPPRESS
@@ -145,7 +152,8 @@ def view_logs(pkgcache, opts) -> None:
 def command(opts, parser, extra_arg_groups=None) -> None:
     from rez.config import config
     from rez.package_cache import PackageCache
-    from rez.utils.formatting import print_colored_columns
+    from rez.utils.formatting import print_colored_columns, \
+        readable_memory_size, readable_time_duration
     from rez.utils import colorize
 
     statuses = {
@@ -178,6 +186,12 @@ def command(opts, parser, extra_arg_groups=None) -> None:
     elif opts.clean:
         pkgcache.clean()
 
+    elif opts.rebuild_index:
+        if not config.package_cache_index:
+            parser.error("The package cache index is disabled (see "
+                         "'package_cache_index' setting)")
+        pkgcache.rebuild_index()
+
     elif opts.logs:
         view_logs(pkgcache, opts)
 
@@ -188,9 +202,16 @@ def command(opts, parser, extra_arg_groups=None) -> None:
         if tty:
             print("Package cache at %s:\n" % cachepath)
 
+        # pending variants are listed in the order they will be cached
+        queue = {}
+        for i, (variant, count, size, eta) in enumerate(pkgcache.get_pending_queue()):
+            queue[variant] = (i, count, size, eta)
+
         def _sort(entry):
             variant, _, status = entry
-            return (statuses[status][-1], variant.name)
+            if variant in queue:
+                return (statuses[status][-1], queue[variant][0], '')
+            return (statuses[status][-1], 0, variant.name)
 
         entries = sorted(pkgcache.get_variants(), key=_sort)
 
@@ -217,6 +238,14 @@ def command(opts, parser, extra_arg_groups=None) -> None:
                     row.append(variant.uri)
                 elif c == "orig_path":
                     row.append(variant.root)
+                elif c in ("requests", "size", "eta"):
+                    _, count, size, eta = queue.get(variant, (None, None, None, None))
+                    if c == "requests":
+                        row.append(count or '-')
+                    elif c == "size":
+                        row.append('-' if size is None else readable_memory_size(size))
+                    else:
+                        row.append('-' if eta is None else readable_time_duration(eta))
                 else:  # cached_path
                     row.append(rootpath or '-')
 
@@ -225,3 +254,10 @@ def command(opts, parser, extra_arg_groups=None) -> None:
 
         pr = colorize.Printer()
         print_colored_columns(pr, rows)
+
+        if tty and queue:
+            etas = [x[-1] for x in queue.values() if x[-1] is not None]
+            msg = "\n%d variants pending" % len(queue)
+            if etas:
+                msg += ", estimated time to cache: %s" % readable_time_duration(max(etas))
+            print(msg)
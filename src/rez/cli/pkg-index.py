@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the Rez Project
+
+
+'''
+Rebuild the metadata index of filesystem package repositories.
+'''
+from __future__ import annotations
+
+
+def setup_parser(parser, completions: bool = False) -> None:
+    parser.add_argument(
+        "PATH", nargs='*',
+        help="Repositories to rebuild the index of. If not specified, the "
+        "index of every repository in the package search path is rebuilt.")
+
+
+def command(opts, parser, extra_arg_groups=None) -> None:
+    from rez.config import config
+    from rez.package_repository import package_repository_manager
+    from rez.utils.logging_ import print_warning
+
+    if not config.plugins.package_repository.filesystem.use_metadata_index:
+        print_warning("The metadata index is not used unless the "
+                      "'use_metadata_index' filesystem repository setting "
+                      "is enabled.")
+
+    for path in (opts.PATH or config.packages_path):
+        repo = package_repository_manager.get_repository(path)
+
+        if not hasattr(repo, "rebuild_index"):
+            print("Skipped %s: repository type has no index" % repo)
+            continue
+
+        num_families = repo.rebuild_index()
+        print("Indexed %d package families in %s" % (num_families, repo))
@@ -8,21 +8,21 @@ from rez import __version__
 from rez.utils.data_utils import AttrDictWrapper, RO_AttrDictWrapper, \
     convert_dicts, cached_property, cached_class_property, LazyAttributeMeta, \
     deep_update, ModifyList, DelayLoad
-from rez.utils.formatting import expandvars, expanduser
+from rez.utils.formatting import expandvars, expanduser, ENV_VAR_REGEX, \
+    FORMAT_VAR_REGEX
 from rez.utils.logging_ import get_debug_printer
 from rez.utils.scope import scoped_format
 from rez.exceptions import ConfigurationError
 from rez import module_root_path
-from rez.system import system
 from rez.vendor.schema.schema import Schema, SchemaError, And, Or, Use
-from rez.vendor import yaml
-from rez.vendor.yaml.error import YAMLError
 import rez.deprecations
 from contextlib import contextmanager
 from functools import lru_cache
 from inspect import ismodule
+import __future__
 import os
 import re
+import sys
 import copy
 from typing import Any, Protocol, TypeVar, TYPE_CHECKING
 
@@ -332,6 +332,14 @@ class ExecutableScriptMode_(Str):
         return Or(*(x.name for x in ExecutableScriptMode))
 
 
+class CacheBackend_(Str):
+    schema = Or("memcached", "local")
+
+
+class PackageCacheEvictionPolicy_(Str):
+    schema = Or("none", "lru", "lfu", "lru_size")
+
+
 class OptionalStrOrFunction(Setting):
     schema = Or(None, str, callable)
 
@@ -401,6 +409,8 @@ config_schema = Schema({
     "ephemeral_styles":                             OptionalStrList,
     "alias_styles":                                 OptionalStrList,
     "memcached_uri":                                OptionalStrList,
+    "cache_backend":                                CacheBackend_,
+    "local_cache_path":                             Str,
     "pip_extra_args":                               OptionalStrList,
     "pip_install_remaps":                           PipInstallRemaps,
     "local_packages_path":                          Str,
@@ -410,11 +420,14 @@ config_schema = Schema({
     "default_build_process":                        Str,
     "documentation_url":                            Str,
     "suite_visibility":                             SuiteVisibility_,
+    "suite_prebaked_shells":                        StrList,
+    "suite_tool_launch_records":                    Bool,
     "rez_tools_visibility":                         RezToolsVisibility_,
     "create_executable_script_mode":                ExecutableScriptMode_,
     "suite_alias_prefix_char":                      Char,
     "cache_packages_path":                          OptionalStr,
     "package_definition_python_path":               OptionalStr,
+    "plugin_cache_path":                            OptionalStr,
     "tmpdir":                                       OptionalStr,
     "context_tmpdir":                               OptionalStr,
     "default_shell":                                OptionalStr,
@@ -449,28 +462,41 @@ config_schema = Schema({
     "context_tracking_host":                        OptionalStr,
     "variant_shortlinks_dirname":                   OptionalStr,
     "build_thread_count":                           BuildThreadCount_,
+    "build_variant_jobs":                           Int,
     "resource_caching_maxsize":                     Int,
+    "solver_prefetch_threads":                      Int,
     "max_package_changelog_chars":                  Int,
     "max_package_changelog_revisions":              Int,
     "memcached_package_file_min_compress_len":      Int,
     "memcached_context_file_min_compress_len":      Int,
     "memcached_listdir_min_compress_len":           Int,
     "memcached_resolve_min_compress_len":           Int,
+    "local_cache_max_size":                         Int,
     "shell_error_truncate_cap":                     Int,
     "package_cache_log_days":                       Int,
     "package_cache_max_variant_days":               Int,
     "package_cache_space_buffer":                   Int,
     "package_cache_used_threshold":                 Int,
+    "package_cache_eviction_high_watermark":        Int,
+    "package_cache_eviction_low_watermark":         Int,
+    "package_cache_eviction_min_idle":              Int,
+    "package_cache_eviction_policy":                PackageCacheEvictionPolicy_,
     "package_cache_clean_limit":                    Float,
+    "package_cache_max_concurrent_variants":        Int,
+    "package_cache_copy_threads":                   Int,
+    "package_cache_copy_chunk_size":                Int,
     "allow_unversioned_packages":                   Bool,
     "package_cache_during_build":                   Bool,
     "package_cache_local":                          Bool,
     "package_cache_same_device":                    Bool,
     "package_cache_async":                          Bool,
+    "package_cache_index":                          Bool,
+    "package_cache_dedup":                          Bool,
     "color_enabled":                                ForceOrBool,
     "resolve_caching":                              Bool,
     "cache_package_files":                          Bool,
     "cache_listdir":                                Bool,
+    "cache_rex_actions":                            Bool,
     "prune_failed_graph":                           Bool,
     "all_parent_variables":                         Bool,
     "all_resetting_variables":                      Bool,
@@ -744,6 +770,12 @@ class Config(object, metaclass=LazyAttributeMeta):
         self.__dict__, other.__dict__ = other.__dict__, self.__dict__
 
     def _validate_key(self, key, value, key_schema):
+        snapshot = self._snapshot
+        if snapshot and key in snapshot["values"] \
+                and key not in self.overrides \
+                and self.locked == snapshot["locked"]:
+            return copy.deepcopy(snapshot["values"][key])
+
         if isinstance(value, DelayLoad):
             value = value.get_value()
 
@@ -756,9 +788,178 @@ class Config(object, metaclass=LazyAttributeMeta):
 
     @cached_property
     def _data_without_overrides(self):
+        snapshot = self._snapshot
+        if snapshot:
+            self._sourced_filepaths = snapshot["sourced_filepaths"]
+            data = snapshot["data"]
+
+            # settings that could not be snapshotted, such as functions
+            reload_keys = snapshot["reload_keys"]
+            if reload_keys:
+                data_, _ = _load_config_from_filepaths(self.filepaths)
+                data = data.copy()
+                data.update((k, data_[k]) for k in reload_keys)
+
+            return data
+
         data, self._sourced_filepaths = _load_config_from_filepaths(self.filepaths)
         return data
 
+    @cached_property
+    def _snapshot(self) -> dict[str, Any] | None:
+        """The compiled config snapshot, if enabled.
+
+        The snapshot contains the merged config data, and the validated value
+        of each setting that doesn't depend on anything other than the config
+        files and environment variables that the snapshot is checked against.
+        See :envvar:`REZ_CONFIG_SNAPSHOT_PATH`.
+        """
+        path = os.getenv("REZ_CONFIG_SNAPSHOT_PATH")
+        if not path:
+            return None
+
+        # note that hashlib is avoided here, as it is slow to import
+        import zlib
+
+        key = _get_snapshot_key(self)
+        filename = "%08x.snapshot" % zlib.crc32(key.encode("utf-8"))
+        filepath = os.path.join(path, filename)
+        snapshot = _load_config_snapshot(filepath, key)
+
+        if snapshot is None:
+            # validating settings can import modules that use this config, so
+            # guard against reentry
+            self._snapshot = None
+            snapshot = self._create_snapshot(filepath, key)
+
+        return snapshot
+
+    def _create_snapshot(self, snapshot_filepath: str,
+                         snapshot_key: str) -> dict[str, Any] | None:
+        """Create the config snapshot, and save it to `snapshot_filepath`."""
+        data, sourced_filepaths = _load_config_from_filepaths(self.filepaths)
+
+        # loading files that set deprecated settings emits warnings, which
+        # would be skipped when loading from the snapshot
+        root_config = get_module_root_config()
+        for filepath in sourced_filepaths:
+            if filepath != root_config:
+                loader = _load_config_py if filepath.endswith(".py") \
+                    else _load_config_yaml
+                if set(loader(filepath)) & set(_deprecated_settings):
+                    return None
+
+        other = Config(self.filepaths, locked=self.locked)
+        other._snapshot = None
+        other._data_without_overrides = data
+        other._sourced_filepaths = sourced_filepaths
+        debug_print = other.debug_printer("file_loads")
+
+        environ_keys = set()
+        if not self.locked:
+            for key in self._schema_keys:
+                if isinstance(key, str):
+                    environ_keys.add("REZ_%s" % key.upper())
+                    environ_keys.add("REZ_%s_JSON" % key.upper())
+
+        values = {}
+        for key in self._schema_keys:
+            if not isinstance(key, str) or key in _deprecated_settings:
+                continue
+
+            value = data.get(key)
+            if value is None and hasattr(self, "_get_%s" % key):
+                continue  # programmatic default
+
+            inputs = [value]
+            if not self.locked:
+                inputs.append(os.getenv("REZ_%s" % key.upper()))
+                inputs.append(os.getenv("REZ_%s_JSON" % key.upper()))
+
+            varnames = _get_expansion_vars(inputs)
+            if varnames is None:
+                continue
+
+            try:
+                values[key] = getattr(other, key)
+            except ConfigurationError:
+                continue  # raised on use instead
+            environ_keys.update(varnames)
+
+        # Values that can't be marshalled, such as functions, are left out.
+        # Settings with such values are loaded from the config files instead,
+        # and evaluated as normal.
+        #
+        reload_keys = []
+        snapshot_data = {}
+
+        for key, value in data.items():
+            if _can_marshal(value):
+                snapshot_data[key] = value
+            else:
+                debug_print("Config setting %r is not snapshotted, as its value "
+                            "cannot be marshalled", key)
+                reload_keys.append(key)
+                values.pop(key, None)
+
+        for key in list(values):
+            if not _can_marshal(values[key]):
+                del values[key]
+
+        files = {}
+        for filepath in self.filepaths:
+            for filepath_ in (filepath, os.path.splitext(filepath)[0] + ".py"):
+                files[filepath_] = _get_file_stat(filepath_)
+
+        snapshot = {
+            "version": _snapshot_version,
+            "key": snapshot_key,
+            "files": files,
+            "environ": dict((x, os.getenv(x)) for x in environ_keys),
+            "locked": self.locked,
+            "data": snapshot_data,
+            "reload_keys": reload_keys,
+            "sourced_filepaths": sourced_filepaths,
+            "values": values
+        }
+
+        _save_config_snapshot(snapshot_filepath, snapshot, debug_print)
+        return snapshot
+
+    def _profile(self) -> list[tuple[str, float]]:
+        """Time the evaluation of each setting.
+
+        Note that the first setting to need a given module pays the cost of
+        importing it, so this is best done in a fresh process.
+
+        Returns:
+            List of (str, float): Settings, and the time in seconds taken to
+            evaluate them, slowest first. The first entry is the time taken to
+            load the config files, with the key '(load)'.
+        """
+        import time
+
+        other = Config(self.filepaths, overrides=self.overrides,
+                       locked=self.locked)
+        other._snapshot = None
+
+        t = time.perf_counter()
+        _load_config_py.cache_clear()
+        _load_config_yaml.cache_clear()
+        _ = other._data  # noqa
+        times = [("(load)", time.perf_counter() - t)]
+
+        for key in sorted(x for x in self._schema_keys if isinstance(x, str)):
+            t = time.perf_counter()
+            try:
+                getattr(other, key)
+            except ConfigurationError:
+                pass
+            times.append((key, time.perf_counter() - t))
+
+        times.sort(key=lambda x: x[1], reverse=True)
+        return times
+
     @cached_property
     def _data(self):
         data = copy.deepcopy(self._data_without_overrides)
@@ -915,6 +1116,10 @@ def expand_system_vars(data: T) -> T:
         if isinstance(value, str):
             str_value = expandvars(value)
             str_value = expanduser(str_value)
+            if '{' not in str_value and '}' not in str_value:
+                return str_value  # nothing to format, skip importing system
+
+            from rez.system import system
             return scoped_format(str_value, system=system)
         elif isinstance(value, (list, tuple, set)):
             return [_expanded(x) for x in value]
@@ -960,6 +1165,126 @@ def _replace_config(other):
         config._swap(other)  # revert config
 
 
+_snapshot_version = 2
+
+# system properties that only vary by host and user, see `_get_snapshot_key`
+_snapshot_system_properties = frozenset([
+    "platform", "arch", "os", "user", "home", "fqdn", "hostname", "domain",
+    "rez_version"
+])
+
+
+def _get_snapshot_key(config_: Config) -> str:
+    import getpass
+
+    if os.name == "nt":
+        host = os.getenv("COMPUTERNAME", "")
+    else:
+        host = os.uname().nodename
+
+    t = (__version__, sys.version, host, getpass.getuser(),
+         config_.filepaths, config_.locked)
+    return repr(t)
+
+
+def _get_expansion_vars(value) -> set[str] | None:
+    """Get the environment variables that a setting value's expansion reads.
+
+    Returns:
+        set of str: Variable names, or None if the value can't be snapshotted,
+        because its expansion depends on something else.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return set()
+
+    if isinstance(value, str):
+        varnames = set(m.group(1).strip("{}") for m in ENV_VAR_REGEX.finditer(value))
+        if '~' in value:
+            varnames.update(("HOME", "USERPROFILE", "HOMEDRIVE", "HOMEPATH"))
+
+        for m in FORMAT_VAR_REGEX.finditer(value):
+            toks = m.group("var").split('.')
+            if len(toks) != 2 or toks[0] != "system" \
+                    or toks[1] not in _snapshot_system_properties:
+                return None
+        return varnames
+
+    if isinstance(value, dict):
+        items = list(value.keys()) + list(value.values())
+    elif isinstance(value, (list, tuple, set)):
+        items = value
+    else:
+        return None  # eg functions, DelayLoad
+
+    varnames = set()
+    for item in items:
+        varnames_ = _get_expansion_vars(item)
+        if varnames_ is None:
+            return None
+        varnames.update(varnames_)
+    return varnames
+
+
+def _get_file_stat(filepath: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_config_snapshot(filepath: str, key: str) -> dict[str, Any] | None:
+    # marshal is used rather than pickle, as it is faster to import and load.
+    # Snapshots are keyed on the python version, so its format is stable
+    import marshal
+
+    try:
+        with open(filepath, "rb") as f:
+            snapshot = marshal.load(f)
+    except Exception:
+        return None
+
+    if snapshot.get("version") != _snapshot_version \
+            or snapshot.get("key") != key:
+        return None
+
+    for filepath_, stat in snapshot["files"].items():
+        if _get_file_stat(filepath_) != stat:
+            return None
+
+    for key, value in snapshot["environ"].items():
+        if os.getenv(key) != value:
+            return None
+
+    return snapshot
+
+
+def _can_marshal(value) -> bool:
+    import marshal
+
+    try:
+        marshal.dumps(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _save_config_snapshot(filepath: str, snapshot: dict[str, Any], debug_print) -> None:
+    import marshal
+    from rez.vendor.atomicwrites import atomic_write
+
+    try:
+        content = marshal.dumps(snapshot)
+
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with atomic_write(filepath, mode="wb", overwrite=True) as f:
+            f.write(content)
+    except Exception as e:
+        debug_print("Could not save config snapshot %s: %s", filepath, e)
+    else:
+        debug_print("Saved config snapshot %s", filepath)
+
+
 @lru_cache()
 def _load_config_py(filepath: str) -> dict[str, Any]:
     reserved = dict(
@@ -988,6 +1313,7 @@ def _load_config_py(filepath: str) -> dict[str, Any]:
     for k, v in g.items():
         if k != '__builtins__' \
                 and not ismodule(v) \
+                and not isinstance(v, __future__._Feature) \
                 and k not in reserved:
             result[k] = v
 
@@ -996,6 +1322,9 @@ def _load_config_py(filepath: str) -> dict[str, Any]:
 
 @lru_cache()
 def _load_config_yaml(filepath: str) -> dict[str, Any]:
+    from rez.vendor import yaml
+    from rez.vendor.yaml.error import YAMLError
+
     with open(filepath) as f:
         content = f.read()
     try:
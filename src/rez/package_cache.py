@@ -8,7 +8,7 @@ import json
 import os
 import os.path
 import errno
-from hashlib import sha1
+from hashlib import sha1, sha256
 from uuid import uuid4
 import shutil
 import stat
@@ -18,9 +18,8 @@ import platform
 import time
 import logging
 import logging.config
-import random
 import threading
-from contextlib import contextmanager
+from contextlib import closing, contextmanager, nullcontext
 
 from rez.config import config
 from rez.exceptions import PackageCacheError
@@ -31,9 +30,293 @@ from rez.utils.colorize import ColorizedStreamHandler
 from rez.utils.logging_ import print_warning
 from rez.packages import get_variant, Variant
 from rez.system import system
-from rez.utils.filesystem import rename
+from rez.utils.filesystem import rename, parallel_copytree
 
-from typing import Iterable, Iterator
+from typing import Any, Iterable, Iterator
+
+try:
+    import sqlite3
+except ImportError:  # python built without sqlite support
+    sqlite3 = None
+
+
+class _PackageCacheIndex(object):
+    """Index of the variants stored in a package cache.
+
+    The index is an sqlite database stored in the cache's system dir. It records
+    each cached variant's root (relative to the cache root), handle, payload
+    size, status (`PackageCache.VARIANT_COPYING` or `VARIANT_FOUND`), last-use
+    time and use count. It is updated by
+    `PackageCache.add_variant` and `PackageCache.remove_variant`, so that
+    listing and cleaning the cache does not have to walk the cache directory
+    and parse every variant's json file.
+
+    The cache directory structure remains the source of truth - the index is
+    rebuilt from it whenever the index is missing or out of date (see
+    `PackageCache.rebuild_index`).
+
+    The index also stores the sizes of source variant payloads, so that
+    repeated space checks on the same variant don't have to walk its payload;
+    how many times each pending variant has been requested; and the sizes and
+    durations of recent payload copies. The latter two are used to prioritise
+    pending variants, and estimate when they will be cached.
+    """
+
+    # this version should be changed if and when the table layout changes
+    format_version = 3
+
+    # number of recent payload copies used to estimate copy throughput
+    num_copies_kept = 20
+
+    def __init__(self, filepath: str, timeout: float) -> None:
+        self.filepath = filepath
+        self.timeout = timeout
+
+    @contextmanager
+    def transaction(self) -> Iterator[Any]:
+        conn = sqlite3.connect(self.filepath, timeout=self.timeout)
+
+        with closing(conn):
+            # the cache is on local disk; in WAL mode, this avoids a sync on
+            # every commit, which matters for last-use updates on resolve
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+
+    def is_current(self) -> bool:
+        """Returns True if the index exists, and has the current layout."""
+        if not os.path.exists(self.filepath):
+            return False
+
+        try:
+            with self.transaction() as conn:
+                row = conn.execute("PRAGMA user_version").fetchone()
+        except sqlite3.DatabaseError:
+            return False
+
+        return row[0] == self.format_version
+
+    def create(self, entries: Iterable[tuple[str, dict, int, int, float]]) -> None:
+        """(Re)create the index.
+
+        Args:
+            entries: Iterable of (rootpath, handle_dict, size, status, last_used).
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("DROP TABLE IF EXISTS variants")
+                conn.execute("DROP TABLE IF EXISTS payload_sizes")
+                conn.execute("DROP TABLE IF EXISTS requests")
+                conn.execute("DROP TABLE IF EXISTS copies")
+        except sqlite3.DatabaseError:
+            # not a database, or corrupted
+            safe_remove(self.filepath)
+
+        with self.transaction() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE variants ("
+                "rootpath TEXT PRIMARY KEY, handle TEXT, size INTEGER, "
+                "status INTEGER, last_used REAL, use_count INTEGER)"
+            )
+            conn.execute(
+                "CREATE TABLE payload_sizes ("
+                "root TEXT PRIMARY KEY, mtime REAL, size INTEGER)"
+            )
+            conn.execute(
+                "CREATE TABLE requests ("
+                "handle TEXT PRIMARY KEY, count INTEGER, first_requested REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE copies (time REAL, size INTEGER, secs REAL)"
+            )
+
+            for rootpath, handle_dict, size, status, last_used in entries:
+                conn.execute(
+                    "INSERT OR REPLACE INTO variants VALUES (?, ?, ?, ?, ?, 0)",
+                    (rootpath, json.dumps(handle_dict), size, status, last_used)
+                )
+
+            conn.execute("PRAGMA user_version=%d" % self.format_version)
+
+    def add(self, rootpath: str, handle_dict: dict, status: int,
+            size: int = 0) -> None:
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO variants VALUES (?, ?, ?, ?, ?, 0)",
+                (rootpath, json.dumps(handle_dict), size, status, time.time())
+            )
+
+    def update(self, rootpath: str, status: int, size: int) -> None:
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE variants SET status=?, size=?, last_used=? "
+                "WHERE rootpath=?",
+                (status, size, time.time(), rootpath)
+            )
+
+    def touch(self, rootpath: str) -> None:
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE variants SET last_used=?, use_count=use_count+1 "
+                "WHERE rootpath=?",
+                (time.time(), rootpath)
+            )
+
+    def remove(self, rootpath: str) -> None:
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM variants WHERE rootpath=?", (rootpath,))
+
+    def get_entries(self) -> list[tuple[str, dict, int, int, float]]:
+        """Get all indexed variants.
+
+        Returns:
+            List of (rootpath, handle_dict, size, status, last_used), in order
+            of least recently used first.
+        """
+        with self.transaction() as conn:
+            rows = conn.execute(
+                "SELECT rootpath, handle, size, status, last_used FROM variants "
+                "ORDER BY last_used"
+            ).fetchall()
+
+        return [
+            (rootpath, json.loads(handle), size, status, last_used)
+            for rootpath, handle, size, status, last_used in rows
+        ]
+
+    def get_eviction_candidates(self, policy: str,
+                                max_last_used: float) -> list[tuple[str, dict, int]]:
+        """Get cached variants in the order they should be evicted.
+
+        Args:
+            policy (str): Eviction policy, see `config.package_cache_eviction_policy`.
+            max_last_used (float): Only variants last used before this time
+                are returned.
+
+        Returns:
+            List of (rootpath, handle_dict, size).
+        """
+        if policy == "lfu":
+            order_by = "use_count, last_used"
+        elif policy == "lru_size":
+            order_by = "(%f - last_used) * size DESC" % time.time()
+        else:
+            order_by = "last_used"
+
+        with self.transaction() as conn:
+            rows = conn.execute(
+                "SELECT rootpath, handle, size FROM variants "
+                "WHERE status=? AND last_used<? ORDER BY " + order_by,
+                (PackageCache.VARIANT_FOUND, max_last_used)
+            ).fetchall()
+
+        return [
+            (rootpath, json.loads(handle), size)
+            for rootpath, handle, size in rows
+        ]
+
+    def add_requests(self, handle_dicts: Iterable[dict]) -> None:
+        """Record requests to cache the given variants."""
+        now = time.time()
+
+        with self.transaction() as conn:
+            for handle_dict in handle_dicts:
+                handle = json.dumps(handle_dict, sort_keys=True)
+                conn.execute(
+                    "INSERT OR IGNORE INTO requests VALUES (?, 0, ?)", (handle, now))
+                conn.execute(
+                    "UPDATE requests SET count=count+1 WHERE handle=?", (handle,))
+
+    def remove_request(self, handle_dict: dict) -> None:
+        with self.transaction() as conn:
+            conn.execute(
+                "DELETE FROM requests WHERE handle=?",
+                (json.dumps(handle_dict, sort_keys=True),)
+            )
+
+    def get_requests(self) -> dict[str, tuple[int, float]]:
+        """Get variant requests.
+
+        Returns:
+            dict: Variant handle (as sorted json) -> (count, first_requested).
+        """
+        with self.transaction() as conn:
+            rows = conn.execute(
+                "SELECT handle, count, first_requested FROM requests").fetchall()
+
+        return {handle: (count, first) for handle, count, first in rows}
+
+    def get_queue_data(self, roots: Iterable[str]
+                       ) -> tuple[dict[str, tuple[int, float]], dict[str, tuple[float, int]]]:
+        """Get variant requests, and the payload sizes of the given roots.
+
+        These are read with a single connection, to prioritise pending variants.
+
+        Returns:
+            2-tuple:
+            - dict: Variant handle (as sorted json) -> (count, first_requested);
+            - dict: Variant root -> (mtime, size), for roots of known size.
+        """
+        roots = list(roots)
+        sizes = {}
+
+        with self.transaction() as conn:
+            rows = conn.execute(
+                "SELECT handle, count, first_requested FROM requests").fetchall()
+            requests = {handle: (count, first) for handle, count, first in rows}
+
+            # stay within sqlite's limit on the number of query parameters
+            for i in range(0, len(roots), 500):
+                roots_ = roots[i:i + 500]
+                rows = conn.execute(
+                    "SELECT root, mtime, size FROM payload_sizes WHERE root IN (%s)"
+                    % ", ".join('?' * len(roots_)),
+                    roots_
+                ).fetchall()
+                sizes.update((root, (mtime, size)) for root, mtime, size in rows)
+
+        return requests, sizes
+
+    def add_copy(self, size: int, secs: float) -> None:
+        """Record a payload copy."""
+        with self.transaction() as conn:
+            conn.execute("INSERT INTO copies VALUES (?, ?, ?)", (time.time(), size, secs))
+            conn.execute(
+                "DELETE FROM copies WHERE time NOT IN "
+                "(SELECT time FROM copies ORDER BY time DESC LIMIT ?)",
+                (self.num_copies_kept,)
+            )
+
+    def get_copy_throughput(self) -> float | None:
+        """Get the throughput of recent payload copies, in bytes per second."""
+        with self.transaction() as conn:
+            row = conn.execute("SELECT SUM(size), SUM(secs) FROM copies").fetchone()
+
+        size, secs = row
+        if not size or not secs:
+            return None
+        return size / secs
+
+    def get_total_size(self) -> int:
+        with self.transaction() as conn:
+            row = conn.execute("SELECT SUM(size) FROM variants").fetchone()
+        return row[0] or 0
+
+    def get_payload_size(self, root: str, mtime: float) -> int | None:
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT size FROM payload_sizes WHERE root=? AND mtime=?",
+                (root, mtime)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_payload_size(self, root: str, mtime: float, size: int) -> None:
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO payload_sizes VALUES (?, ?, ?)",
+                (root, mtime, size)
+            )
 
 
 class PackageCache(object):
@@ -109,6 +392,9 @@ class PackageCache(object):
         os.makedirs(self._pending_dir, exist_ok=True)
         os.makedirs(self._remove_dir, exist_ok=True)
 
+        # True once the index has been verified (or rebuilt) by this instance
+        self._index_verified = False
+
     def get_cached_root(self, variant: Variant) -> str | None:
         """Get location of variant payload copy.
 
@@ -134,11 +420,24 @@ class PackageCache(object):
             else:
                 raise
 
+        # Record the use in the index also. Note that a missing index is not
+        # created here - that is left to cache updates, rather than resolves.
+        index = self._get_index(create=False)
+        if index is not None and os.path.exists(index.filepath):
+            try:
+                index.touch(os.path.relpath(rootpath, self.path))
+            except sqlite3.Error:
+                pass  # eg index is locked, or not writable by this user
+
         return rootpath
 
     def get_variant_size(self, free, variant_root):
         """Get the size of the variant root.
 
+        If the size of this payload has already been determined in full (either
+        by a previous call, or because the variant was cached), the size stored
+        in the cache index is returned instead.
+
         Args:
             free: The available free cache space.
             variant_root: The rez resolved variant root.
@@ -146,9 +445,97 @@ class PackageCache(object):
         Returns:
             int: The size in bytes of the variant root (may exceed buffer slightly).
         """
+        index = self._get_index()
+        mtime = None
+
+        if index is not None:
+            try:
+                mtime = os.stat(variant_root).st_mtime
+            except (OSError, TypeError):
+                pass
+            else:
+                variant_size = index.get_payload_size(variant_root, mtime)
+                if variant_size is not None:
+                    return variant_size
+
+        # Bail out early if variant size will overtake the buffer set by
+        # config.package_cache_space_buffer.
+        variant_size, complete = self._get_payload_size(
+            variant_root, max_size=(free - config.package_cache_space_buffer))
+
+        if complete and mtime is not None:
+            index.set_payload_size(variant_root, mtime, variant_size)
+
+        return variant_size
+
+    def get_cached_size(self) -> int | None:
+        """Get the total size of the variant payloads in the cache.
+
+        This is determined from the cache index, so does not include variants
+        cached by rez versions that predate the index (until the index is
+        rebuilt, see `rebuild_index`).
+
+        Returns:
+            int: Size in bytes, or None if the cache index is disabled.
+        """
+        index = self._get_index()
+        if index is None:
+            return None
+
+        return index.get_total_size()
+
+    def rebuild_index(self) -> None:
+        """Rebuild the cache index from the contents of the cache directory.
+
+        This happens automatically if the index is missing. Use it if the cache
+        has been modified by means other than this class (eg by an older rez
+        version, or by deleting payloads manually).
+        """
+        index = self._get_index(create=False)
+        if index is None:
+            return
+
+        with self._lock():
+            entries = []
+
+            for rootpath, handle_dict in self._walk_variants():
+                try:
+                    last_used = os.stat(rootpath + ".json").st_mtime
+                except OSError:
+                    continue  # maybe got cleaned up by other process
+
+                status = self._get_copying_status(rootpath)
+                if status == self.VARIANT_FOUND:
+                    size, _ = self._get_payload_size(rootpath)
+                else:
+                    status = self.VARIANT_COPYING
+                    size = 0
+
+                entries.append((
+                    os.path.relpath(rootpath, self.path),
+                    handle_dict, size, status, last_used
+                ))
+
+            index.create(entries)
+
+        self._index_verified = True
+
+    def _get_payload_size(self, root: str,
+                          max_size: int | None = None) -> tuple[int, bool]:
+        """Get the size of a variant payload.
+
+        Args:
+            root (str): Payload root directory.
+            max_size (int): If provided, stop once the size exceeds this.
+
+        Returns:
+            2-tuple:
+            - int: The size in bytes of the payload;
+            - bool: False if the walk was stopped because of `max_size`.
+        """
         variant_size = 0
         seen_inodes = set()
-        stack = [variant_root]
+        stack = [root]
 
         while stack:
             current = stack.pop()
@@ -166,10 +553,8 @@ class PackageCache(object):
 
                             if stat.S_ISREG(st.st_mode):
                                 variant_size += st.st_size
-                                # Bail out early if variant size will overtake the buffer
-                                # set by config.package_cache_space_buffer.
-                                if (free - variant_size) < config.package_cache_space_buffer:
-                                    return variant_size
+                                if max_size is not None and variant_size > max_size:
+                                    return variant_size, False
                             elif stat.S_ISDIR(st.st_mode):
                                 stack.append(entry.path)
                         except OSError:
@@ -177,7 +562,7 @@ class PackageCache(object):
             except OSError:
                 continue
 
-        return variant_size
+        return variant_size, True
 
     def cache_near_full(self):
         """ Get the cache available space
@@ -358,6 +743,10 @@ class PackageCache(object):
             # just added for debugging purposes
             data["data"] = package.data["variants"][variant.index]
 
+        # note that this has to happen before the lock is acquired, as it may
+        # need to (re)build the index, which itself takes the lock
+        index = self._get_index()
+
         # 2. + 5.
         with self._lock():
             # Check if variant exists again, another proc could have created it
@@ -388,6 +777,11 @@ class PackageCache(object):
             with open(json_filepath, 'w') as f:
                 f.write(json.dumps(data))
 
+            rootpath = os.path.join(path, incname)
+            if index is not None:
+                index.add(os.path.relpath(rootpath, self.path), data["handle"],
+                          self.VARIANT_COPYING)
+
         # 6.
         #
         # Here we continually update mtime on the .copying file, to indicate
@@ -404,20 +798,48 @@ class PackageCache(object):
                 except:
                     pass
 
-        rootpath = os.path.join(path, incname)
         th = threading.Thread(target=_while_copying)
         th.daemon = True
         th.start()
 
+        t = time.time()
+
+        if config.package_cache_dedup:
+            # files have to be read whole to be hashed, so aren't chunked
+            copy_kwargs = dict(chunk_size=None, copy_function=self._copy_file_dedup)
+        else:
+            copy_kwargs = dict(chunk_size=config.package_cache_copy_chunk_size)
+
         try:
-            shutil.copytree(variant_root, rootpath)
+            size = parallel_copytree(
+                variant_root, rootpath,
+                threads=config.package_cache_copy_threads,
+                **copy_kwargs
+            )
         finally:
             still_copying = False
 
+        secs = time.time() - t
+
         # 7.
         th.join()
         os.remove(copying_filepath)
 
+        if logger:
+            logger.info(
+                "Copied %.2fMB payload of %s in %.2f seconds (%.2fMB/s)",
+                size / 1024**2, variant.qualified_name, secs,
+                (size / 1024**2) / secs if secs else 0.0
+            )
+
+        if index is not None:
+            index.update(os.path.relpath(rootpath, self.path), self.VARIANT_FOUND, size)
+            index.add_copy(size, secs)
+
+            # released payloads don't change, so this also saves a payload walk
+            # when checking space requirements for this variant again
+            index.set_payload_size(variant_root, os.stat(variant_root).st_mtime, size)
+
         return (rootpath, self.VARIANT_CREATED)
 
     def remove_variant(self, variant: Variant) -> int:
@@ -440,6 +862,8 @@ class PackageCache(object):
         if status in (self.VARIANT_NOT_FOUND, self.VARIANT_COPYING):
             return status
 
+        index = self._get_index()
+
         # If we got here, it's either a cached variant, or is stalled. In either
         # case, we get the lock, and remove all associated files. The payload
         # itself is moved into the system delete dir, ready for actual deletion
@@ -465,6 +889,9 @@ class PackageCache(object):
                     return self.VARIANT_NOT_FOUND
                 raise
 
+            if index is not None:
+                index.remove(os.path.relpath(rootpath, self.path))
+
             # delete json file
             path, incname = os.path.split(rootpath)
             filepath = os.path.join(path, incname + ".json")
@@ -538,6 +965,17 @@ class PackageCache(object):
         if not variants_ and config.package_cache_clean_limit < 0:
             return
 
+        # record demand for these variants, this prioritises pending variants.
+        # Note that the index is not created here, to keep resolves fast - the
+        # caching daemon does that.
+        #
+        index = self._get_index(create=False)
+        if variants_ and index is not None and os.path.exists(index.filepath):
+            try:
+                index.add_requests(x.handle.to_dict() for x in variants_)
+            except sqlite3.Error:
+                pass  # eg index is locked, or not writable by this user
+
         # Write each variant out to a file in the 'pending' dir in the cache. A
         # separate proc reads these files and then performs the actual variant
         # copy. Note that these files are unique, in case two rez procs attempt
@@ -653,30 +1091,16 @@ class PackageCache(object):
         seen_variants = set()
 
         # find variants in cache
-        for pkg_name in safe_listdir(self.path):
-            if pkg_name.startswith('.'):
-                continue  # dirs for internal cache use
-
-            path1 = os.path.join(self.path, pkg_name)
-
-            for ver_str in safe_listdir(path1):
-                path2 = os.path.join(path1, ver_str)
-
-                for hash_str in safe_listdir(path2):
-                    path3 = os.path.join(path2, hash_str)
-
-                    for name in safe_listdir(path3):
-                        if name.endswith(".json"):
-                            with open(os.path.join(path3, name)) as f:
-                                data = json.loads(f.read())
+        for rootpath, handle_dict, status, _ in self._iter_cached_variants():
+            if status not in statuses:
+                continue
 
-                            handle = data["handle"]
-                            variant = get_variant(handle)
+            if not os.path.exists(rootpath + ".json"):
+                continue  # maybe got cleaned up by other process
 
-                            status, rootpath = self._get_cached_root(variant)
-                            if status in statuses:
-                                results.append((variant, rootpath, status))
-                                seen_variants.add(variant)
+            variant = get_variant(handle_dict)
+            results.append((variant, rootpath, status))
+            seen_variants.add(variant)
 
         # find pending variants
         pending_filenames = os.listdir(self._pending_dir)
@@ -697,6 +1121,45 @@ class PackageCache(object):
 
         return results
 
+    def get_pending_queue(self) -> list[tuple[Variant, int, int | None, float | None]]:
+        """Get pending variants, in the order they will be cached.
+
+        Pending variants are prioritised by demand - how many times they have
+        been requested (see `add_variants`) - divided by their payload size, so
+        that small, frequently requested variants are cached first. Payload
+        sizes are only known for variants whose size has been determined
+        previously; the average known size is assumed for the rest.
+
+        Returns:
+            list of 4-tuple:
+            - `Variant`: The pending variant;
+            - int: Number of times the variant has been requested;
+                - int: Payload size in bytes, or None if not known;
+            - float: Estimated number of seconds until the variant is cached,
+              based on recent copy throughput. None if there is no copy
+              history yet, or no payload sizes are known.
+        """
+        index = self._get_index()
+        throughput = index.get_copy_throughput() if index is not None else None
+
+        result = []
+        total_size = 0
+
+        for _, variant, count, size, est_size in self._get_pending_queue():
+            if est_size is None:
+                throughput = None
+            else:
+                total_size += est_size
+
+            if throughput:
+                eta = total_size / throughput
+            else:
+                eta = None
+
+            result.append((variant, count, size, eta))
+
+        return result
+
     def run_daemon(self) -> None:
         """Run as daemon and copy pending variants.
 
@@ -731,15 +1194,29 @@ class PackageCache(object):
 
         # somewhere for the daemon to store stateful info
         state = {
-            "logger": logger
+            "logger": logger,
+            "lock": threading.Lock()
         }
 
-        # copy variants into cache
-        try:
+        def _copy_variants():
             while True:
                 keep_running = self._run_caching_step(state, wait_for_copying=wait_for_copying)
                 if not keep_running:
                     break
+
+        # copy variants into cache, several at a time if configured
+        num_workers = max(1, config.package_cache_max_concurrent_variants)
+
+        try:
+            if num_workers == 1:
+                _copy_variants()
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                    futures = [executor.submit(_copy_variants) for _ in range(num_workers)]
+                    for future in futures:
+                        future.result()
         except Exception:
             logger.exception("An error occurred while adding variants to the cache")
             raise
@@ -760,7 +1237,12 @@ class PackageCache(object):
 
         - Variants that have not been used in more than 'config.package_cache_max_variant_days' days;
         - Variants that have stalled;
-        - Variants that are already pending deletion (remove_variant() was used).
+        - Variants that are already pending deletion (remove_variant() was used);
+        - File contents in the deduplicated store that are no longer used (see
+          `config.package_cache_dedup`).
+
+        If an eviction policy is configured and the cache is over its high
+        watermark, variants are also evicted (see `evict`).
 
         Args:
             time_limit (float): Perform cleaning operations only up until this
@@ -780,13 +1262,19 @@ class PackageCache(object):
             )
 
         # find variants to delete
-        for variant, rootpath, status in self.get_variants():
+        max_secs = config.package_cache_max_variant_days * 3600 * 24
+
+        for rootpath, handle_dict, status, last_used in self._iter_cached_variants():
             if status == self.VARIANT_FOUND:
-                max_secs = config.package_cache_max_variant_days * 3600 * 24
                 if max_secs == 0:
                     continue  # 0 means no age limit on unused variants
 
                 # determine how long since cached variant has been used
+                if (now - last_used) <= max_secs:
+                    continue
+
+                # the variant's json file is touched on use also, and is what
+                # older rez versions sharing this cache will update
                 json_filepath = rootpath + ".json"
                 try:
                     st = os.stat(json_filepath)
@@ -794,12 +1282,12 @@ class PackageCache(object):
                     # may have just been deleted
                     continue
 
-                since = int(now - st.st_mtime)
+                since = int(now - max(last_used, st.st_mtime))
                 if since > max_secs:
-                    unused_variants.append(variant)
+                    unused_variants.append(get_variant(handle_dict))
 
             elif status == self.VARIANT_COPY_STALLED:
-                stalled_variants.append(variant)
+                stalled_variants.append(get_variant(handle_dict))
 
         # remove unused variants. This puts them in our to_delete dir
         for variant in unused_variants:
@@ -823,7 +1311,116 @@ class PackageCache(object):
                     logger.info(
                         "Removed stalled variant %s from cache", variant.uri)
 
+        # evict variants if the cache is over its high watermark
+        if self._eviction_needed():
+            self.evict(logger=logger)
+
         # delete everything in to_delete dir
+        self._purge_removed(logger, should_exit)
+
+    def evict(self, required_space: int = 0, logger: logging.Logger | None = None) -> int:
+        """Evict cached variants to free disk space.
+
+        Variants are evicted in the order given by
+        `config.package_cache_eviction_policy`, until disk usage drops below
+        `config.package_cache_eviction_low_watermark`, and there is room for
+        `required_space` bytes on top of `config.package_cache_space_buffer`.
+        Variants used within the last `config.package_cache_eviction_min_idle`
+        seconds are never evicted.
+
+        The caching daemon calls this automatically once disk usage exceeds
+        `config.package_cache_eviction_high_watermark`, or to make room for a
+        pending variant.
+
+        Args:
+            required_space (int): Space in bytes needed for a variant about
+                to be cached.
+            logger (None | logging.Logger): Logger to log evictions to.
+
+        Returns:
+            int: Number of bytes freed, as measured by disk usage.
+        """
+        policy = config.package_cache_eviction_policy
+        if policy == "none":
+            return 0
+
+        index = self._get_index()
+        if index is None:
+            return 0
+
+        if logger is None:
+            logger = self._init_logging()
+
+        def get_space_to_free():
+            total, used, free = shutil.disk_usage(self.path)
+            low_used = total * config.package_cache_eviction_low_watermark / 100.0
+
+            to_free = max(
+                used - low_used,
+                required_space + config.package_cache_space_buffer - free
+            )
+            return to_free, used
+
+        to_free, initial_used = get_space_to_free()
+        if to_free <= 0:
+            return 0
+
+        used = initial_used
+        max_last_used = time.time() - config.package_cache_eviction_min_idle
+        candidates = iter(index.get_eviction_candidates(policy, max_last_used))
+
+        # Payload sizes in the index overestimate the space freed when file
+        # contents are shared with other cached variants (see
+        # `config.package_cache_dedup`). So, evict until the estimated size
+        # is met, then measure disk usage again and repeat if necessary.
+        #
+        while to_free > 0:
+            estimated = 0
+
+            for _, handle_dict, size in candidates:
+                variant = get_variant(handle_dict)
+
+                status = self.remove_variant(variant)
+                if status == self.VARIANT_REMOVED:
+                    logger.info("Evicted variant %s from cache (%s policy)",
+                                variant.uri, policy)
+                    estimated += size
+
+                    if estimated >= to_free:
+                        break
+
+            if not estimated:
+                break  # no candidates left
+
+            # evicted payloads have to actually be deleted to free any space
+            self._purge_removed(logger)
+            to_free, used = get_space_to_free()
+
+        freed = max(initial_used - used, 0)
+
+        if to_free > 0:
+            logger.warning(
+                "Could only evict %.2fMB of the %.2fMB required from cache",
+                freed / 1024**2, (freed + to_free) / 1024**2
+            )
+
+        return freed
+
+    def _eviction_needed(self) -> bool:
+        if config.package_cache_eviction_policy == "none":
+            return False
+
+        total, used, free = shutil.disk_usage(self.path)
+        used_percentage = (used / total) * 100 if total else 0.0
+
+        return (
+            free < config.package_cache_space_buffer
+            or used_percentage > config.package_cache_eviction_high_watermark
+        )
+
+    def _purge_removed(self, logger: logging.Logger, should_exit=None) -> None:
+        """Delete the payloads of removed variants, and any file contents in
+        the deduplicated store that are no longer used as a result."""
         for name in os.listdir(self._remove_dir):
             path = os.path.join(self._remove_dir, name)
 
@@ -834,9 +1431,100 @@ class PackageCache(object):
                 continue
 
             logger.info("Deleted %s", path)
-            if should_exit():
+            if should_exit and should_exit():
+                return
+
+        self._purge_blobs(logger, should_exit)
+
+    def _purge_blobs(self, logger: logging.Logger, should_exit=None) -> None:
+        """Delete unreferenced file contents from the deduplicated store.
+
+        Cached files are hardlinks to their contents in the store, so the link
+        count of a blob is its reference count. A blob with a link count of 1
+        is referenced only by the store itself. Note that this is done even if
+        `config.package_cache_dedup` is disabled, as it may have been enabled
+        previously.
+        """
+        num_deleted = 0
+        size_deleted = 0
+
+        for dirname in safe_listdir(self._blobs_dir):
+            path = os.path.join(self._blobs_dir, dirname)
+
+            for name in safe_listdir(path):
+                filepath = os.path.join(path, name)
+
+                try:
+                    st = os.stat(filepath)
+                    if st.st_nlink > 1:
+                        continue
+
+                    # If another proc links to the blob just before this, then
+                    # only the store's reference is lost. The cached file keeps
+                    # the contents, it just isn't deduplicated against.
+                    os.remove(filepath)
+                except OSError:
+                    continue
+
+                num_deleted += 1
+                size_deleted += st.st_size
+
+            if should_exit and should_exit():
+                break
+
+        if num_deleted:
+            logger.info("Deleted %d unused file contents (%.2fMB) from deduplicated store",
+                        num_deleted, size_deleted / 1024**2)
+
+    def _copy_file_dedup(self, src: str, dst: str) -> None:
+        """Copy a file, then deduplicate it against the store.
+
+        The store holds a single copy of each file's contents (and mode, since
+        hardlinks share it), named by digest. If the contents of `dst` are
+        already in the store, `dst` is replaced by a hardlink to them.
+        Otherwise `dst` is added to the store.
+        """
+        h = sha256()
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            while True:
+                buf = fsrc.read(1024 * 1024)
+                if not buf:
+                    break
+                h.update(buf)
+                fdst.write(buf)
+
+        shutil.copystat(src, dst)
+
+        mode = stat.S_IMODE(os.stat(dst).st_mode)
+        blob_name = "%s-%o" % (h.hexdigest(), mode)
+        blob_dir = os.path.join(self._blobs_dir, blob_name[:2])
+        blob_path = os.path.join(blob_dir, blob_name)
+
+        os.makedirs(blob_dir, exist_ok=True)
+
+        # the blob may get deleted by a clean in another proc, between it being
+        # found to exist and linked to; hence the retries
+        for _ in range(3):
+            try:
+                os.link(dst, blob_path)
+                return  # new contents, dst is now in the store
+            except FileExistsError:
+                pass
+            except OSError:
+                return  # eg hardlinks not supported, leave dst as a plain copy
+
+            tmp_path = "%s.%s" % (dst, uuid4().hex)
+            try:
+                os.link(blob_path, tmp_path)
+            except FileNotFoundError:
+                continue
+            except OSError:
                 return
 
+            os.replace(tmp_path, dst)
+            return
+
     @contextmanager
     def _lock(self) -> Iterator[None]:
         lock_filepath = os.path.join(self._sys_dir, ".lock")
@@ -853,6 +1541,12 @@ class PackageCache(object):
 
     def _run_caching_step(self, state, wait_for_copying: bool = False) -> bool:
         logger = state["logger"]
+        state.setdefault("lock", threading.Lock())
+
+        # make room by evicting variants, if an eviction policy is configured
+        with state["lock"]:
+            if self._eviction_needed():
+                self.evict(logger=logger)
 
         # Keep the cache daemon alive until the cache size reaches its min threshold.
         if self.cache_near_full():
@@ -862,15 +1556,39 @@ class PackageCache(object):
             )
             return False
 
-        # pick a random pending variant to copy
-        pending_filenames = set(os.listdir(self._pending_dir))
-        if not wait_for_copying:
-            pending_filenames -= set(state.get("copying", set()))
-        if not pending_filenames:
-            return False
+        # pick the highest priority pending variant to copy, that isn't already
+        # being copied by another thread of this proc. Pending variants are
+        # loaded once per proc (see `_get_pending_queue`), and without holding
+        # the lock, as this reads from the variants' repositories.
+        #
+        queue = self._get_pending_queue(
+            entries=state.setdefault("pending", {}),
+            lock=state["lock"]
+        )
+
+        with state["lock"]:
+            skip_filenames = set(state.setdefault("claimed", set()))
+            if not wait_for_copying:
+                skip_filenames |= state.setdefault("copying", set())
+
+            pending_filenames = [
+                x[0] for x in queue
+                if x[0] not in skip_filenames
+            ]
+            if not pending_filenames:
+                return False
 
-        i = random.randint(0, len(pending_filenames) - 1)
-        filename = list(pending_filenames)[i]
+            filename = pending_filenames[0]
+            state["claimed"].add(filename)
+
+        try:
+            return self._cache_pending_variant(state, filename, wait_for_copying)
+        finally:
+            with state["lock"]:
+                state["claimed"].discard(filename)
+
+    def _cache_pending_variant(self, state, filename: str, wait_for_copying: bool) -> bool:
+        logger = state["logger"]
         filepath = os.path.join(self._pending_dir, filename)
 
         try:
@@ -885,10 +1603,18 @@ class PackageCache(object):
         variant_root = getattr(variant, "root")
 
         if not self.variant_meets_space_requirements(variant_root):
-            # variant cannot be cached due to its size, so remove as a pending variant.
-            logger.info(f"Variant {variant_root} is too big to be cached due to remaining cache space.")
-            safe_remove(filepath)
-            return True
+            # try to make room for the variant
+            total, _, _ = shutil.disk_usage(self.path)
+            variant_size = self.get_variant_size(total, variant_root)
+
+            with state["lock"]:
+                evicted = self.evict(required_space=variant_size, logger=logger)
+
+            if not (evicted and self.variant_meets_space_requirements(variant_root)):
+                # variant cannot be cached due to its size, so remove as a pending variant.
+                logger.info(f"Variant {variant_root} is too big to be cached due to remaining cache space.")
+                self._remove_pending(filepath, variant_handle_dict)
+                return True
 
         # copy the variant and log activity
         logger.info("Started caching of variant %s...", variant.uri)
@@ -904,17 +1630,17 @@ class PackageCache(object):
         except PackageCacheError as e:
             # variant cannot be cached, so remove as a pending variant
             logger.warning(str(e))
-            safe_remove(filepath)
+            self._remove_pending(filepath, variant_handle_dict)
             return True
 
         except Exception:
-            # This is probably an error during shutil.copytree (eg a perms fail).
+            # This is probably an error during the payload copy (eg a perms fail).
             # In this case, the variant will be in VARIANT_COPYING status, and
             # will shortly transition to VARIANT_COPY_STALLED. Thus we can
             # remove the pending variant, as there's nothing more we can do.
             #
             logger.exception("Failed to add variant to the cache")
-            safe_remove(filepath)
+            self._remove_pending(filepath, variant_handle_dict)
             return True
 
         secs = time.time() - t
@@ -933,12 +1659,20 @@ class PackageCache(object):
             # variant, so it's responsible); but we also have to ignore this
             # variant from now on.
             #
-            state.setdefault("copying", set()).add(filename)
+            with state["lock"]:
+                state.setdefault("copying", set()).add(filename)
         else:
-            safe_remove(filepath)
+            self._remove_pending(filepath, variant_handle_dict)
 
         return True
 
+    def _remove_pending(self, filepath: str, handle_dict: dict) -> None:
+        safe_remove(filepath)
+
+        index = self._get_index()
+        if index is not None:
+            index.remove_request(handle_dict)
+
     def _init_logging(self) -> logging.Logger:
         """
         Creates logger that logs to file and stdout. Used for:
@@ -997,6 +1731,242 @@ class PackageCache(object):
     def _remove_dir(self) -> str:
         return os.path.join(self.path, ".sys", "to_delete")
 
+    @property
+    def _blobs_dir(self) -> str:
+        return os.path.join(self.path, ".sys", "blobs")
+
+    def _get_pending_queue(self, entries: dict | None = None,
+                           lock: threading.Lock | None = None
+                           ) -> list[tuple[str, Variant, int, int | None, int]]:
+        """Get pending variants, highest priority first.
+
+        Args:
+            entries (dict): Pending variants loaded by previous calls, by
+                filename. If provided, only pending files that are not in
+                `entries` are loaded, and `entries` is updated. This is used by
+                the caching daemon, which gets the queue for every variant it
+                caches.
+            lock (`threading.Lock`): Lock to hold while accessing `entries`,
+                if it is shared between threads.
+
+        Returns:
+            list of 5-tuple:
+            - str: Pending filename;
+            - `Variant`: The pending variant;
+            - int: Number of times the variant has been requested;
+            - int: Payload size in bytes, or None if not known;
+            - int: Estimated payload size in bytes, or None if no payload
+              sizes are known.
+        """
+        if entries is None:
+            entries = {}
+        if lock is None:
+            lock = nullcontext()
+
+        index = self._get_index()
+        filenames = os.listdir(self._pending_dir)
+
+        with lock:
+            new_filenames = [x for x in filenames if x not in entries]
+
+        # load new pending variants
+        new_entries = {}
+
+        for filename in new_filenames:
+            filepath = os.path.join(self._pending_dir, filename)
+
+            try:
+                with open(filepath) as f:
+                    variant_handle_dict = json.loads(f.read())
+                queued = os.stat(filepath).st_mtime
+            except (IOError, OSError, ValueError):
+                continue  # maybe file was just deleted
+
+            variant = get_variant(variant_handle_dict)
+
+            try:
+                root_mtime = os.stat(variant.root).st_mtime
+            except (OSError, TypeError):
+                root_mtime = None
+
+            new_entries[filename] = (
+                variant,
+                json.dumps(variant_handle_dict, sort_keys=True),
+                root_mtime,
+                queued
+            )
+
+        # get request counts, and the known sizes of new pending variants
+        requests = {}
+        sizes = {}
+
+        if index is not None:
+            requests, sizes = index.get_queue_data(
+                x[0].root for x in new_entries.values() if x[2] is not None)
+
+        with lock:
+            for filename, (variant, request_key, root_mtime, queued) in new_entries.items():
+                size = sizes.get(variant.root)
+                if size is not None and size[0] == root_mtime:
+                    size = size[1]
+                else:
+                    size = None
+
+                entries[filename] = (variant, request_key, size, queued)
+
+            filenames_ = set(filenames)
+            for filename in list(entries.keys()):
+                if filename not in filenames_:
+                    entries.pop(filename, None)
+
+            entries_ = [
+                [filename, variant, request_key, size, queued]
+                for filename, (variant, request_key, size, queued) in entries.items()
+            ]
+
+        for entry in entries_:
+            count, first_requested = requests.get(entry[2], (1, entry[4]))
+            entry[2] = max(count, 1)
+            entry[4] = first_requested
+
+        # assume the average known size for variants of unknown size
+        known_sizes = [x[3] for x in entries_ if x[3] is not None]
+        if known_sizes:
+            default_size = sum(known_sizes) // len(known_sizes)
+        else:
+            default_size = None
+
+        # prioritise by demand per MB, then by how long they have been waiting
+        def _key(entry):
+            _, _, count, size, first_requested = entry
+            if size is None:
+                size = default_size or 0
+            size_mb = max(size / 1024**2, 1.0)
+            return (-count / size_mb, first_requested)
+
+        entries_.sort(key=_key)
+
+        return [
+            (filename, variant, count, size, default_size if size is None else size)
+            for filename, variant, count, size, _ in entries_
+        ]
+
+    def _get_index(self, create: bool = True) -> _PackageCacheIndex | None:
+        """Get the cache index.
+
+        Args:
+            create (bool): If True, build the index if it is missing or out of
+                date.
+
+        Returns:
+            `_PackageCacheIndex`: The index, or None if the index is disabled.
+        """
+        if sqlite3 is None or not config.package_cache_index:
+            return None
+
+        index = _PackageCacheIndex(
+            os.path.join(self._sys_dir, "index.db"),
+            timeout=self._FILELOCK_TIMEOUT
+        )
+
+        if create and not self._index_verified:
+            if index.is_current():
+                self._index_verified = True
+            else:
+                self.rebuild_index()
+
+        return index
+
+    def _iter_cached_variants(self) -> Iterator[tuple[str, dict, int, float]]:
+        """Iterate over the variants in the cache (ie, not pending variants).
+
+        Variants come from the cache index, in least recently used order, if the
+        index is enabled.
+
+        Yields:
+            4-tuple:
+            - str: Cached variant root;
+            - dict: Variant handle;
+            - int: One of VARIANT_FOUND, VARIANT_COPYING, VARIANT_COPY_STALLED;
+            - float: Last time the cached variant was used.
+        """
+        index = self._get_index()
+
+        if index is not None:
+            for rootpath, handle_dict, _, status, last_used in index.get_entries():
+                rootpath = os.path.join(self.path, rootpath)
+                if status == self.VARIANT_COPYING:
+                    status = self._get_copying_status(rootpath)
+
+                yield (rootpath, handle_dict, status, last_used)
+            return
+
+        for rootpath, handle_dict in self._walk_variants():
+            try:
+                last_used = os.stat(rootpath + ".json").st_mtime
+            except OSError:
+                continue  # maybe got cleaned up by other process
+
+            status = self._get_copying_status(rootpath)
+            yield (rootpath, handle_dict, status, last_used)
+
+    def _walk_variants(self) -> Iterator[tuple[str, dict]]:
+        """Find variants by walking the cache directory.
+
+        Yields:
+            2-tuple:
+            - str: Cached variant root;
+            - dict: Variant handle.
+        """
+        for pkg_name in safe_listdir(self.path):
+            if pkg_name.startswith('.'):
+                continue  # dirs for internal cache use
+
+            path1 = os.path.join(self.path, pkg_name)
+
+            for ver_str in safe_listdir(path1):
+                path2 = os.path.join(path1, ver_str)
+
+                for hash_str in safe_listdir(path2):
+                    path3 = os.path.join(path2, hash_str)
+
+                    for name in safe_listdir(path3):
+                        if name.endswith(".json"):
+                            try:
+                                with open(os.path.join(path3, name)) as f:
+                                    data = json.loads(f.read())
+                            except IOError as e:
+                                if e.errno == errno.ENOENT:
+                                    # maybe got cleaned up by other process
+                                    continue
+                                raise
+
+                            rootpath = os.path.join(path3, os.path.splitext(name)[0])
+                            yield (rootpath, data["handle"])
+
+    def _get_copying_status(self, rootpath: str) -> int:
+        """Get the status of a variant, based on its .copying file.
+
+        Returns:
+            int: One of VARIANT_FOUND, VARIANT_COPYING, VARIANT_COPY_STALLED.
+        """
+        path, incname = os.path.split(rootpath)
+        copying_filepath = os.path.join(path, ".copying-" + incname)
+
+        if not os.path.exists(copying_filepath):
+            return self.VARIANT_FOUND
+
+        try:
+            st = os.stat(copying_filepath)
+            secs = time.time() - st.st_mtime
+            if secs > self._COPYING_TIME_MAX:
+                return self.VARIANT_COPY_STALLED
+        except:
+            # maybe .copying file was deleted just now
+            pass
+
+        return self.VARIANT_COPYING
+
     def _get_cached_root(self, variant: Variant) -> tuple[int, str]:
         path = self._get_hash_path(variant)
         if not os.path.exists(path):
@@ -1009,7 +1979,6 @@ class PackageCache(object):
                 incname = os.path.splitext(name)[0]
                 json_filepath = os.path.join(path, name)
                 rootpath = os.path.join(path, incname)
-                copying_filepath = os.path.join(path, ".copying-" + incname)
 
                 try:
                     with open(json_filepath) as f:
@@ -1022,19 +1991,7 @@ class PackageCache(object):
                         raise
 
                 if data.get("handle") == handle_dict:
-                    if os.path.exists(copying_filepath):
-                        try:
-                            st = os.stat(copying_filepath)
-                            secs = time.time() - st.st_mtime
-                            if secs > self._COPYING_TIME_MAX:
-                                return (self.VARIANT_COPY_STALLED, rootpath)
-                        except:
-                            # maybe .copying file was deleted just now
-                            pass
-
-                        return (self.VARIANT_COPYING, rootpath)
-                    else:
-                        return (self.VARIANT_FOUND, rootpath)
+                    return (self._get_copying_status(rootpath), rootpath)
 
         return (self.VARIANT_NOT_FOUND, '')
 
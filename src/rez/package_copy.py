@@ -4,9 +4,12 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from functools import partial
+import json
 import os.path
 import shutil
+import threading
 import time
 
 from rez.config import config
@@ -22,7 +25,7 @@ from rez.utils.logging_ import print_info, print_warning
 from rez.utils.filesystem import replacing_symlink, replacing_copy, \
     additive_copytree, make_path_writable, get_existing_path
 
-from typing import TYPE_CHECKING
+from typing import Any, Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from rez.version import Version
@@ -41,7 +44,8 @@ def copy_package(package: Package,
                  keep_timestamp: bool = False,
                  skip_payload: bool = False,
                  overrides=None,
-                 verbose: bool = False) -> dict[str, list[tuple[Variant, Variant]]]:
+                 verbose: bool = False,
+                 lock=None) -> dict[str, list[tuple[Variant, Variant]]]:
     """Copy a package from one package repository to another.
 
     This copies the package definition and payload. The package can also be
@@ -101,6 +105,9 @@ def copy_package(package: Package,
         verbose (bool): Verbose mode.
         dry_run (bool): Dry run mode. Dest variants in the result will be None
             in this case.
+        lock (context manager): If provided, this is held during operations
+            on the destination repository (but not while copying payloads).
+            This is used to copy packages concurrently, see `copy_packages`.
 
     Returns:
         Dict: See comments above.
@@ -126,6 +133,9 @@ def copy_package(package: Package,
     else:
         dest_pkg_repo = dest_repository
 
+    if lock is None:
+        lock = nullcontext()
+
     # cannot copy package over the top of itself
     if package.repository == dest_pkg_repo and \
             (dest_name is None or dest_name == package.name) and \
@@ -166,11 +176,12 @@ def copy_package(package: Package,
     new_src_variants = []
 
     for src_variant in src_variants:
-        existing_variant_resource = dest_pkg_repo.install_variant(
-            src_variant.resource,
-            overrides=overrides,
-            dry_run=True
-        )
+        with lock:
+            existing_variant_resource = dest_pkg_repo.install_variant(
+                src_variant.resource,
+                overrides=overrides,
+                dry_run=True
+            )
 
         if existing_variant_resource:
             existing_variant = Variant(existing_variant_resource)
@@ -205,20 +216,21 @@ def copy_package(package: Package,
             dest_variant = None
         else:
             if not skip_payload:
-                # Perform pre-install steps. For eg, a "building" marker file is
-                # created in the filesystem pkg repo, so that the package dir
-                # (which doesn't have variants copied into it yet) is not picked
-                # up as a valid package.
-                #
-                dest_pkg_repo.pre_variant_install(src_variant.resource)
-
-                # copy include modules before the first variant install
-                if i == 0:
-                    _copy_package_include_modules(
-                        src_variant.parent,
-                        dest_pkg_repo,
-                        overrides=overrides
-                    )
+                with lock:
+                    # Perform pre-install steps. For eg, a "building" marker file is
+                    # created in the filesystem pkg repo, so that the package dir
+                    # (which doesn't have variants copied into it yet) is not picked
+                    # up as a valid package.
+                    #
+                    dest_pkg_repo.pre_variant_install(src_variant.resource)
+
+                    # copy include modules before the first variant install
+                    if i == 0:
+                        _copy_package_include_modules(
+                            src_variant.parent,
+                            dest_pkg_repo,
+                            overrides=overrides
+                        )
 
                 # copy the variant's payload
                 _copy_variant_payload(
@@ -237,10 +249,11 @@ def copy_package(package: Package,
                 overrides_["timestamp"] = int(time.time())
 
             # install the variant into the package definition
-            dest_variant_resource = dest_pkg_repo.install_variant(
-                variant_resource=src_variant.resource,
-                overrides=overrides_
-            )
+            with lock:
+                dest_variant_resource = dest_pkg_repo.install_variant(
+                    variant_resource=src_variant.resource,
+                    overrides=overrides_
+                )
 
             dest_variant = Variant(dest_variant_resource)
 
@@ -253,6 +266,193 @@ def copy_package(package: Package,
     return finalize()
 
 
+def copy_packages(packages: Iterable[Package],
+                  dest_repository: PackageRepository | str,
+                  jobs: int = 4,
+                  journal_filepath: str | None = None,
+                  callback=None,
+                  **kwargs) -> dict[str, Any]:
+    """Copy many packages from one or more package repositories to another.
+
+    This is intended for bulk migrations between repositories. Packages are
+    copied concurrently, on a pool of `jobs` threads. The variants of a package
+    are copied one after another, since they share a payload directory on the
+    destination. Payloads are copied in parallel, but operations on the
+    destination repository (such as updating package definitions) happen one
+    at a time.
+
+    If `journal_filepath` is provided, each variant is recorded to this file
+    once it has been copied (or skipped because it already exists in the
+    destination). If the copy is interrupted and run again with the same
+    journal, variants already recorded are skipped without being checked
+    against the destination repository.
+
+    The result is a dict like so:
+
+    .. code-block:: text
+
+       {
+           "copied": [(`Variant`, `Variant`)],
+           "skipped": [(`Variant`, `Variant`)],
+           "journaled": [`Variant`],
+           "failed": [(`Variant`, `Exception`)],
+           "size": int,
+           "seconds": float
+       }
+
+    The 'copied' and 'skipped' lists are as per `copy_package`. The
+    'journaled' list contains source variants skipped due to the journal, and
+    'failed' lists source variants that could not be copied, along with the
+    error. Failed variants are not journaled, so are retried on a rerun. 'size'
+    is the total size in bytes of the copied payloads, and 'seconds' is how long
+    the copy took.
+
+    Args:
+        packages (list of `Package`): Packages to copy.
+        dest_repository (PackageRepository or str): The package repository, or
+            a package repository path, to copy the packages into.
+        jobs (int): Number of packages to copy at once.
+        journal_filepath (str): Path of journal file to record progress to.
+        callback (callable): If provided, this is called with the source
+            variant, the result key ('copied', 'skipped', 'journaled' or
+            'failed'), and the destination variant (or error if failed), as
+            each variant is completed. It is called from the calling thread,
+            once all variants of the variant's package are completed.
+        kwargs: Passed to `copy_package`. Note that `variants`, `dest_name`,
+            `dest_version` and `lock` are not supported.
+
+    Returns:
+        Dict: See comments above.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    for key in ("variants", "dest_name", "dest_version", "lock"):
+        if key in kwargs:
+            raise PackageCopyError("'%s' is not supported by copy_packages" % key)
+
+    if isinstance(dest_repository, str):
+        dest_pkg_repo = package_repository_manager.get_repository(dest_repository)
+    else:
+        dest_pkg_repo = dest_repository
+
+    result = {
+        "copied": [],
+        "skipped": [],
+        "journaled": [],
+        "failed": [],
+        "size": 0,
+        "seconds": 0.0
+    }
+
+    # load variants that were completed by a previous run
+    journaled_uris = set()
+    if journal_filepath and os.path.exists(journal_filepath):
+        with open(journal_filepath) as f:
+            for line in f:
+                try:
+                    journaled_uris.add(json.loads(line)["src"])
+                except (ValueError, KeyError):
+                    pass  # eg last line partially written when interrupted
+
+    journal_lock = threading.Lock()
+    repo_lock = threading.Lock()
+
+    def _journal(src_variant, dest_variant, key, size) -> None:
+        if not journal_filepath or kwargs.get("dry_run"):
+            return
+
+        entry = {
+            "src": src_variant.uri,
+            "dest": dest_variant.uri if dest_variant else None,
+            "result": key,
+            "size": size
+        }
+
+        with journal_lock:
+            with open(journal_filepath, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+
+    def _copy_variant(src_variant):
+        r = copy_package(
+            package=src_variant.parent,
+            dest_repository=dest_pkg_repo,
+            variants=[src_variant.index],
+            lock=repo_lock,
+            **kwargs
+        )
+
+        if r["copied"]:
+            key = "copied"
+            dest_variant = r["copied"][0][1]
+        else:
+            key = "skipped"
+            dest_variant = r["skipped"][0][1]
+
+        size = 0
+        if key == "copied" and dest_variant is not None \
+                and not kwargs.get("shallow") and not kwargs.get("skip_payload"):
+            size = _get_dir_size(dest_variant.root)
+
+        _journal(src_variant, dest_variant, key, size)
+        return key, dest_variant, size
+
+    def _copy_variants(src_variants):
+        results = []
+        for src_variant in src_variants:
+            try:
+                key, dest_variant, size = _copy_variant(src_variant)
+            except Exception as e:
+                results.append((src_variant, "failed", e, 0))
+            else:
+                results.append((src_variant, key, dest_variant, size))
+        return results
+
+    t = time.time()
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = {}
+
+        for package in packages:
+            src_variants = []
+
+            for src_variant in package.iter_variants():
+                if src_variant.uri in journaled_uris:
+                    result["journaled"].append(src_variant)
+                    if callback:
+                        callback(src_variant, "journaled", None)
+                else:
+                    src_variants.append(src_variant)
+
+            if src_variants:
+                future = executor.submit(_copy_variants, src_variants)
+                futures[future] = src_variants
+
+        for future in as_completed(futures):
+            for src_variant, key, value, size in future.result():
+                if key == "failed":
+                    result["failed"].append((src_variant, value))
+                else:
+                    result[key].append((src_variant, value))
+                    result["size"] += size
+
+                if callback:
+                    callback(src_variant, key, value)
+
+    result["seconds"] = time.time() - t
+    return result
+
+
+def _get_dir_size(path: str) -> int:
+    size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                size += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                pass
+    return size
+
+
 def _copy_variant_payload(src_variant: Variant,
                           dest_pkg_repo: PackageRepository,
                           shallow: bool = False,
@@ -9,6 +9,7 @@ from rez.exceptions import ConfigurationError
 from rez.config import config
 from rez.utils.data_utils import cached_property, cached_class_property
 from rez.version import VersionedObject, VersionRange, Requirement
+from functools import lru_cache
 from hashlib import sha1
 from typing import Any, Iterator, Pattern, TYPE_CHECKING, ClassVar
 import fnmatch
@@ -114,26 +115,26 @@ class PackageFilter(PackageFilterBase):
         if not self._excludes:
             return None  # quick out
 
-        def _match(rules: list[Rule] | None) -> Rule | None:
+        def _match(rules: _CompiledRules | None) -> Rule | None:
             if rules:
-                for rule in rules:
-                    if rule.match(package):
-                        return rule
+                return rules.match(package)
             return None
 
-        excludes = self._excludes.get(package.name)
+        compiled_excludes, compiled_includes = self._compiled
+
+        excludes = compiled_excludes.get(package.name)
         excl = _match(excludes)
         if not excl:
-            excludes = self._excludes.get(None)
+            excludes = compiled_excludes.get(None)
             excl = _match(excludes)
 
         if excl:
-            includes = self._includes.get(package.name)
+            includes = compiled_includes.get(package.name)
             incl = _match(includes)
             if incl:
                 excl = None
             else:
-                includes = self._includes.get(None)
+                includes = compiled_includes.get(None)
                 if _match(includes):
                     excl = None
 
@@ -185,6 +186,14 @@ class PackageFilter(PackageFilterBase):
             total += cost
         return total
 
+    @cached_property
+    def _compiled(self) -> tuple[dict[str | None, _CompiledRules],
+                                 dict[str | None, _CompiledRules]]:
+        return (
+            dict((k, _CompiledRules(v)) for k, v in self._excludes.items()),
+            dict((k, _CompiledRules(v)) for k, v in self._includes.items())
+        )
+
     @classmethod
     def from_pod(cls, data: dict) -> PackageFilter:
         """Convert from POD types to equivalent package filter.
@@ -219,6 +228,7 @@ class PackageFilter(PackageFilterBase):
         rules_ = rules_dict.get(family, [])
         rules_dict[family] = sorted(rules_ + [rule], key=lambda x: x.cost())
         cached_property.uncache(self, "cost")  # type: ignore[attr-defined]
+        cached_property.uncache(self, "_compiled")  # type: ignore[attr-defined]
 
     def __str__(self) -> str:
         def sortkey(rule_items: tuple[str | None, list[Rule]]) -> tuple[str, list[Rule]]:
@@ -248,11 +258,13 @@ class PackageFilterList(PackageFilterBase):
         """
         filters = self.filters + [package_filter]
         self.filters = sorted(filters, key=lambda x: x.cost)
+        self._uncache()
 
     def add_exclusion(self, rule: Rule) -> None:
         if self.filters:
             f = self.filters[-1]
             f.add_exclusion(rule)
+            self._uncache()
         else:
             f = PackageFilter()
             f.add_exclusion(rule)
@@ -268,18 +280,43 @@ class PackageFilterList(PackageFilterBase):
         """
         for f in self.filters:
             f.add_inclusion(rule)
+        self._uncache()
 
     def excludes(self, package: Package) -> Rule | None:
         """Returns the first rule that excludes ``package``, if any.
 
+        Results are cached per package name and version, and are shared by
+        all filter lists with the same rules (see `sha1`). Results for
+        packages that timestamp rules apply to are not cached, since these
+        depend on the package itself.
+
         Returns:
             Rule:
         """
+        if not self.filters:
+            return None
+
+        results = self._results
+        key = (package.name, package.version)
+
+        try:
+            return results[key]
+        except KeyError:
+            pass
+
+        result = None
         for f in self.filters:
             rule = f.excludes(package)
             if rule:
-                return rule
-        return None
+                result = rule
+                break
+
+        timestamped_families = self._timestamped_families
+        if None not in timestamped_families \
+                and package.name not in timestamped_families:
+            results[key] = result
+
+        return result
 
     def copy(self) -> PackageFilterList:
         """Return a copy of the filter list.
@@ -290,6 +327,24 @@ class PackageFilterList(PackageFilterBase):
         other.filters = [x.copy() for x in self.filters]
         return other
 
+    @cached_property
+    def _results(self) -> dict[tuple[str, Any], Rule | None]:
+        return _get_excludes_results(self.sha1)
+
+    @cached_property
+    def _timestamped_families(self) -> set[str | None]:
+        families = set()
+        for f in self.filters:
+            for rules_dict in (f._excludes, f._includes):
+                for family, rules in rules_dict.items():
+                    if any(isinstance(x, TimestampRule) for x in rules):
+                        families.add(family)
+        return families
+
+    def _uncache(self) -> None:
+        cached_property.uncache(self, "_results")  # type: ignore[attr-defined]
+        cached_property.uncache(self, "_timestamped_families")  # type: ignore[attr-defined]
+
     @classmethod
     def from_pod(cls, data: list[dict]) -> PackageFilterList:
         """Convert from POD types to equivalent package filter.
@@ -330,6 +385,77 @@ class PackageFilterList(PackageFilterBase):
 no_filter = PackageFilterList()
 
 
+@lru_cache(maxsize=16)
+def _get_excludes_results(sha1: str) -> dict[tuple[str, Any], Rule | None]:
+    # results of `PackageFilterList.excludes`, shared by filter lists with
+    # the same rules, and kept across resolves
+    return {}
+
+
+class _CompiledRules(object):
+    """The rules of a package filter for one package family, compiled so that
+    they can be matched against a package in one step.
+
+    Regex and glob rules are combined into a single regex, and range rules
+    into a single version range. A package that matches neither is only
+    tested against the remaining rules.
+    """
+    # patterns containing backreferences, or global inline flags (such as
+    # '(?i)'), can't be combined with others
+    _uncombinable_regex = re.compile(r"\\[1-9]|\(\?P=")
+    _default_flags = re.compile("").flags
+
+    def __init__(self, rules: list[Rule]) -> None:
+        self.rules = rules
+        self.regex: Pattern[str] | None = None
+        self.range: VersionRange | None = None
+
+        regex_rules = [
+            x for x in rules
+            if isinstance(x, RegexRuleBase)
+            and x.regex.flags == self._default_flags
+            and not self._uncombinable_regex.search(x.regex.pattern)
+        ]
+        range_rules = [
+            x for x in rules
+            if isinstance(x, RangeRule) and not x._requirement.conflict
+        ]
+
+        if len(regex_rules) > 1:
+            pattern = '|'.join("(?:%s)" % x.regex.pattern for x in regex_rules)
+            try:
+                self.regex = re.compile(pattern)
+            except re.error:
+                regex_rules = []
+
+        if len(range_rules) > 1:
+            ranges = [x._requirement.range for x in range_rules]
+            self.range = ranges[0].union(ranges[1:])
+
+        combined = set()
+        if self.regex is not None:
+            combined.update(map(id, regex_rules))
+        if self.range is not None:
+            combined.update(map(id, range_rules))
+
+        self.other_rules = [x for x in rules if id(x) not in combined]
+
+    def match(self, package: Package) -> Rule | None:
+        """Returns the first rule that matches ``package``, if any."""
+        rules = self.other_rules
+
+        # the rule that matched is still needed, so if the combined regex or
+        # range matches, fall back to testing each rule
+        if (self.regex is not None and self.regex.match(package.qualified_name)) \
+                or (self.range is not None and package.version in self.range):
+            rules = self.rules
+
+        for rule in rules:
+            if rule.match(package):
+                return rule
+        return None
+
+
 class Rule(object):
     """Base package filter rule"""
 
@@ -430,6 +430,22 @@ class PackageRepository(object):
         """
         return 0
 
+    def get_generation(self) -> Hashable | None:
+        """Get a value that changes whenever the repository changes.
+
+        This is used for resolve caching. If the generation of every repository
+        in a cached resolve is unchanged, the resolve is known to still be valid,
+        and the (much more expensive) per-variant and per-family checks are
+        skipped. The value must change on any package install, removal or
+        ignore.
+
+        This may not be applicable to your repository type, leave as-is if so.
+
+        Returns:
+            A hashable value, or None if the generation is unknown.
+        """
+        return None
+
     def make_resource_handle(self, resource_key: str, **variables: Any) -> ResourceHandle:
         """Create a `ResourceHandle`
 
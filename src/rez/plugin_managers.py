@@ -13,18 +13,17 @@ from rez.utils.schema import dict_to_schema
 from rez.utils.data_utils import LazySingleton, cached_property, deep_update
 from rez.utils.logging_ import print_debug, print_warning
 from rez.exceptions import RezPluginError
+from rez.vendor.atomicwrites import atomic_write
+from collections.abc import Iterator, MutableMapping
+from hashlib import sha1
 from zipimport import zipimporter
 from typing import overload, Any, Literal, TypeVar, TYPE_CHECKING
 import pkgutil
+import pickle
 import os.path
 import sys
 import types
 
-if sys.version_info[:2] >= (3, 8):
-    from importlib.metadata import entry_points
-else:
-    from rez.vendor.importlib_metadata import entry_points
-
 if TYPE_CHECKING:
     from rez.shells import Shell
     from rez.release_vcs import ReleaseVCS
@@ -95,11 +94,57 @@ def extend_path(path, name):
     return path
 
 
+def _get_mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def uncache_rezplugins_module_paths(instance=None) -> None:
     instance = instance or plugin_manager
     cached_property.uncache(instance, "rezplugins_module_paths")  # type: ignore[attr-defined]
 
 
+class _LazyPluginDict(MutableMapping):
+    """Dict of plugin name to plugin class or module.
+
+    Plugins that were loaded from the plugin cache are only imported when
+    their class or module is first accessed (see
+    `RezPluginType.load_plugins_from_cache`).
+    """
+    def __init__(self, plugin_type: RezPluginType) -> None:
+        self.plugin_type = plugin_type
+        self.data: dict[str, Any] = {}
+
+    def __getitem__(self, plugin_name: str) -> Any:
+        if plugin_name not in self.data \
+                and plugin_name in self.plugin_type._cached_plugins:
+            self.plugin_type._load_cached_plugin(plugin_name)
+        return self.data[plugin_name]
+
+    def __setitem__(self, plugin_name: str, value: Any) -> None:
+        self.data[plugin_name] = value
+
+    def __delitem__(self, plugin_name: str) -> None:
+        del self.data[plugin_name]
+
+    def __contains__(self, plugin_name) -> bool:
+        return plugin_name in self.data \
+            or plugin_name in self.plugin_type._cached_plugins
+
+    def __iter__(self) -> Iterator[str]:
+        names = list(self.plugin_type._cached_plugins)
+        names.extend(x for x in self.data if x not in names)
+        return iter(names)
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class RezPluginType(object):
     """An abstract base class representing a single type of plugin.
 
@@ -113,10 +158,17 @@ class RezPluginType(object):
             raise TypeError("Subclasses of RezPluginType must provide a "
                             "'type_name' attribute")
         self.pretty_type_name = self.type_name.replace('_', ' ')
-        self.plugin_classes: dict[str, type] = {}
+        self.plugin_classes: MutableMapping[str, type] = _LazyPluginDict(self)
         self.failed_plugins: dict[str, str] = {}
-        self.plugin_modules: dict[str, types.ModuleType] = {}
+        self.plugin_modules: MutableMapping[str, types.ModuleType] = _LazyPluginDict(self)
         self.config_data = {}
+
+        # plugins loaded from the plugin cache, that are not yet imported
+        self._cached_plugins: dict[str, dict[str, Any]] = {}
+
+        # info about each discovered plugin, written to the plugin cache
+        self._plugin_records: dict[str, dict[str, Any]] = {}
+
         self.load_plugins()
 
     def __repr__(self) -> str:
@@ -130,8 +182,12 @@ class RezPluginType(object):
         self.plugin_modules[plugin_name] = plugin_module
 
     def load_plugins(self) -> None:
+        if self.load_plugins_from_cache():
+            return
+
         self.load_plugins_from_namespace()
         self.load_plugins_from_entry_points()
+        self.save_plugins_cache()
 
     def load_plugins_from_namespace(self):
         import pkgutil
@@ -187,10 +243,16 @@ class RezPluginType(object):
 
                     self.register_plugin_module(plugin_name, plugin_module, path)
                     self.load_config_from_plugin(plugin_module)
+                    self._record_plugin(plugin_name, plugin_module, path)
                 except Exception as e:
                     self.print_log_plugins_error(modname, e)
 
     def load_plugins_from_entry_points(self):
+        if sys.version_info[:2] >= (3, 8):
+            from importlib.metadata import entry_points
+        else:
+            from rez.vendor.importlib_metadata import entry_points
+
         entry_point_name = f"rez.plugins.{self.type_name}"
         if config.debug("plugins"):
             print_debug("searching plugin for entry point %r...", entry_point_name)
@@ -206,13 +268,166 @@ class RezPluginType(object):
                             % (self.type_name, f"{plugin.name} = {plugin.value!r}"))
             try:
                 plugin_name = plugin.name
+                entry_point = plugin.value
                 plugin = plugin.load()
                 plugin_path = os.path.dirname(plugin.__file__)
                 self.register_plugin_module(plugin_name, plugin, plugin_path)
                 self.load_config_from_plugin(plugin)
+                self._record_plugin(plugin_name, plugin, plugin_path,
+                                    entry_point=entry_point)
             except Exception as e:
                 self.print_log_plugins_error(plugin.__name__, e)
 
+    def load_plugins_from_cache(self) -> bool:
+        """Load plugins from the plugin cache, if it is enabled and valid.
+
+        Plugins loaded this way are not imported until they are used. See
+        :data:`plugin_cache_path`.
+
+        Returns:
+            bool: True if plugins were loaded from the cache.
+        """
+        filepath = self._plugin_cache_filepath
+        if not filepath:
+            return False
+
+        try:
+            with open(filepath, "rb") as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            if config.debug("plugins"):
+                print_debug("Failed to read plugin cache %s: %s", filepath, e)
+            return False
+
+        for path, mtime in data["files"].items():
+            if _get_mtime(path) != mtime:
+                if config.debug("plugins"):
+                    print_debug("Plugin cache %s is stale, %s has changed",
+                                filepath, path)
+                return False
+
+        if config.debug("plugins"):
+            print_debug("loading %s plugins from cache %s...",
+                        self.type_name, filepath)
+
+        self._cached_plugins = dict((x["name"], x) for x in data["plugins"])
+        self.config_data = data["config_data"]
+        return True
+
+    def save_plugins_cache(self) -> None:
+        """Write the discovered plugins to the plugin cache, if enabled."""
+        filepath = self._plugin_cache_filepath
+        if not filepath:
+            return
+
+        # plugins that failed to load are retried (and reported) next time
+        if self.failed_plugins:
+            if config.debug("plugins"):
+                print_debug("Not writing plugin cache %s, some %s plugins "
+                            "failed to load", filepath, self.type_name)
+            return
+
+        type_module_name = 'rezplugins.' + self.type_name
+        package = sys.modules[type_module_name]
+
+        # the cache is invalidated by changes to any of these files
+        paths = list(sys.path)
+        paths.extend(package.__path__)
+
+        for dir_ in config.plugin_path + plugin_manager.rezplugins_module_paths:
+            paths.append(os.path.join(dir_, *type_module_name.split('.')))
+
+        for record in self._plugin_records.values():
+            paths.append(record["filepath"])
+            dir_ = os.path.dirname(record["filepath"])
+            paths.extend(os.path.join(dir_, "rezconfig" + x)
+                         for x in ("", ".py", ".yaml"))
+
+        data = {
+            "files": dict((x, _get_mtime(x)) for x in paths),
+            "plugins": [
+                x for x in self._plugin_records.values()
+                if x["name"] in self.plugin_classes.data
+            ],
+            "config_data": self.config_data
+        }
+
+        try:
+            content = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with atomic_write(filepath, mode="wb", overwrite=True) as f:
+                f.write(content)
+        except Exception as e:
+            if config.debug("plugins"):
+                print_debug("Failed to write plugin cache %s: %s", filepath, e)
+
+    @cached_property
+    def _plugin_cache_filepath(self) -> str | None:
+        if not config.plugin_cache_path:
+            return None
+
+        from rez import __version__
+
+        # the plugins found depend on the search paths, so these are hashed
+        # into the filename
+        t = (__version__, self.type_name, sys.executable, sys.path,
+             config.plugin_path)
+        h = sha1(repr(t).encode("utf-8")).hexdigest()
+
+        filename = "%s-%s.pickle" % (self.type_name, h)
+        return os.path.join(config.plugin_cache_path, filename)
+
+    def _record_plugin(self, plugin_name: str, plugin_module: types.ModuleType,
+                       plugin_path: str, entry_point: str | None = None) -> None:
+        plugin_class = self.plugin_classes.data.get(plugin_name)
+        if plugin_class is None:
+            return
+
+        self._plugin_records[plugin_name] = {
+            "name": plugin_name,
+            "module_name": plugin_module.__name__,
+            "filepath": plugin_module.__file__,
+            "path": plugin_path,
+            "entry_point": entry_point,
+            "schema_dict": getattr(plugin_class, "schema_dict", None)
+        }
+
+    def _load_cached_plugin(self, plugin_name: str) -> None:
+        """Import a plugin that was loaded from the plugin cache."""
+        from importlib import import_module
+
+        record = self._cached_plugins.pop(plugin_name)
+        modname = record["module_name"]
+
+        if config.debug("plugins"):
+            print_debug("importing cached %s plugin %s...", self.type_name, modname)
+
+        try:
+            plugin_module = sys.modules.get(modname)
+
+            if plugin_module is None:
+                if record["entry_point"]:
+                    plugin_module = import_module(modname)
+                else:
+                    # the plugin type package is imported first, as plugins
+                    # may import from it
+                    import_module('rezplugins.' + self.type_name)
+                    importer = pkgutil.get_importer(record["path"])
+                    loader = importer.find_spec(modname)
+                    plugin_module = loader.loader.load_module(modname)
+
+            self.register_plugin_module(plugin_name, plugin_module, record["path"])
+        except Exception as e:
+            raise RezPluginError("Failed to load %s plugin '%s': %s"
+                                 % (self.pretty_type_name, plugin_name, e))
+
+        if plugin_name not in self.plugin_classes.data:
+            raise RezPluginError("Failed to load %s plugin '%s'"
+                                 % (self.pretty_type_name, plugin_name))
+
     def print_log_plugins_error(self, module_name, error):
         nameish = module_name.split('.')[-1]
         self.failed_plugins[nameish] = str(error)
@@ -285,10 +500,15 @@ class RezPluginType(object):
         from rez.config import _plugin_config_dict
         d = _plugin_config_dict.get(self.type_name, {})
 
-        for name, plugin_class in self.plugin_classes.items():
-            if hasattr(plugin_class, "schema_dict") \
-                    and plugin_class.schema_dict:
-                d_ = {name: plugin_class.schema_dict}
+        for name in self.plugin_classes:
+            # use the cached schema of plugins that are not yet imported
+            if name in self._cached_plugins:
+                schema_dict = self._cached_plugins[name]["schema_dict"]
+            else:
+                schema_dict = getattr(self.plugin_classes[name], "schema_dict", None)
+
+            if schema_dict:
+                d_ = {name: schema_dict}
                 deep_update(d, d_)
         return dict_to_schema(d, required=True, modifier=expand_system_vars)
 
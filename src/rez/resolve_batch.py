@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the Rez Project
+
+
+"""
+Resolve many package requests at once.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import shlex
+
+from rez.resolved_context import ResolvedContext
+from rez.solver import PackageVariantCachePool
+
+from typing import Any, Iterable, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rez.utils.typing import SupportsRead
+
+
+# the variant cache pool of a batch worker process
+_worker_cache_pool: PackageVariantCachePool | None = None
+
+
+def read_batch_requests(buf: SupportsRead[str]) -> list[list[str]]:
+    """Read package requests, one per line.
+
+    Blank lines and lines starting with '#' are skipped.
+
+    Args:
+        buf (file-like object): Buffer to read from.
+
+    Returns:
+        list of list of str: Package requests.
+    """
+    requests = []
+
+    for line in buf.read().splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            requests.append(shlex.split(line))
+
+    return requests
+
+
+def iter_resolve_batch(package_requests: Iterable[Iterable[str]],
+                       processes: int = 1,
+                       chunk_size: int | None = None,
+                       **kwargs) -> Iterator[ResolvedContext]:
+    """Resolve a list of package requests.
+
+    The resolves share package variant caches (see `PackageVariantCachePool`),
+    so a package family used by many of the requests is loaded and filtered
+    only once. This is much faster than creating each `ResolvedContext`
+    separately, when the requests have packages in common.
+
+    Note that packages released during the batch may not be visible to its
+    later resolves.
+
+    Args:
+        package_requests (list of list of str): Requests to resolve.
+        processes (int): Number of processes to resolve in. If greater than
+            one, chunks of requests are resolved in a process pool, and caches
+            are shared within each process.
+        chunk_size (int): Number of requests sent to a process at a time.
+            Defaults to an even split of requests over four chunks per process.
+        kwargs: Arguments passed to each `ResolvedContext`. If `processes` is
+            greater than one, these must be picklable (so callbacks are not
+            supported).
+
+    Returns:
+        Iterator of `ResolvedContext`: Contexts, in the same order as the
+        requests.
+    """
+    package_requests = [list(x) for x in package_requests]
+
+    if processes > 1 and len(package_requests) > 1:
+        for d in _iter_resolve_in_processes(package_requests, processes,
+                                            chunk_size, kwargs):
+            yield ResolvedContext.from_dict(d)
+        return
+
+    pool = PackageVariantCachePool()
+
+    for request in package_requests:
+        yield ResolvedContext(request, package_cache_pool=pool, **kwargs)
+
+
+def resolve_batch(package_requests: Iterable[Iterable[str]],
+                  processes: int = 1,
+                  chunk_size: int | None = None,
+                  **kwargs) -> list[ResolvedContext]:
+    """Resolve a list of package requests.
+
+    See `iter_resolve_batch` for details.
+
+    Returns:
+        list of `ResolvedContext`: Contexts, in the same order as the requests.
+    """
+    return list(iter_resolve_batch(package_requests,
+                                   processes=processes,
+                                   chunk_size=chunk_size,
+                                   **kwargs))
+
+
+def _iter_resolve_in_processes(package_requests: list[list[str]],
+                               processes: int,
+                               chunk_size: int | None,
+                               kwargs: dict[str, Any]) -> Iterator[dict]:
+    if not chunk_size:
+        nchunks = processes * 4
+        chunk_size = max(1, -(-len(package_requests) // nchunks))
+
+    chunks = [
+        package_requests[i:i + chunk_size]
+        for i in range(0, len(package_requests), chunk_size)
+    ]
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for results in executor.map(_resolve_chunk, chunks, repeat(kwargs)):
+            for d in results:
+                yield d
+
+
+def _resolve_chunk(package_requests: list[list[str]],
+                   kwargs: dict[str, Any]) -> list[dict]:
+    # runs in a worker process. Contexts are passed back in serialized form,
+    # as that is much smaller than a pickled context
+    global _worker_cache_pool
+
+    if _worker_cache_pool is None:
+        _worker_cache_pool = PackageVariantCachePool()
+
+    results = []
+    for request in package_requests:
+        context = ResolvedContext(request,
+                                  package_cache_pool=_worker_cache_pool,
+                                  **kwargs)
+        results.append(context.to_dict())
+
+    return results
@@ -18,14 +18,16 @@ from rez.utils.formatting import columnise, PackageRequest, ENV_VAR_REGEX, \
     header_comment, minor_header_comment
 from rez.utils.data_utils import deep_del
 from rez.utils.filesystem import TempDirs, is_subdirectory, canonical_path
-from rez.utils.memcached import pool_memcached_connections
+from rez.utils.memcached import pool_memcached_connections, memcached_client, \
+    get_cache_servers
 from rez.utils.logging_ import print_debug, print_error, print_warning
 from rez.utils.which import which
 from rez.rex import Action, ActionInterpreter, RexExecutor, Python, OutputStyle, literal
 from rez.rex_bindings import VersionBinding, VariantBinding, \
     VariantsBinding, RequirementsBinding, EphemeralsBinding, intersects
 from rez import package_order
-from rez.packages import get_variant, iter_packages, Package, Variant
+from rez.packages import get_variant, get_last_release_time, iter_packages, \
+    Package, Variant
 from rez.package_filter import PackageFilterList
 from rez.package_order import PackageOrder, PackageOrderList
 from rez.package_cache import PackageCache
@@ -46,6 +48,7 @@ from functools import wraps
 from enum import Enum
 from typing import Any, Callable, Iterable, Iterator, Mapping, NoReturn, Sequence, TypeVar, \
     TYPE_CHECKING, overload
+from hashlib import sha1
 import getpass
 import json
 import socket
@@ -58,7 +61,8 @@ import os.path
 if TYPE_CHECKING:
     from typing import Literal  # not available in typing module until 3.8
     from rez.utils.typing import SupportsWrite, SupportsRead
-    from rez.solver import SolverState
+    from rez.shells import Shell
+    from rez.solver import SolverState, PackageVariantCachePool
     from rez.package_resources import VariantResource
     from rez.vendor.pygraph.classes.digraph import digraph
     from subprocess import Popen
@@ -162,7 +166,7 @@ class ResolvedContext(object):
     command within a configured python namespace, without spawning a child
     shell.
     """
-    serialize_version = (4, 9)
+    serialize_version = (4, 11)
     tmpdir_manager = TempDirs(config.context_tmpdir, prefix="rez_context_")
     context_tracking_payload: dict[str, Any] | None = None
     context_tracking_lock = threading.Lock()
@@ -211,7 +215,10 @@ class ResolvedContext(object):
                  suppress_passive: bool = False,
                  print_stats: bool = False,
                  package_caching: bool | None = None,
-                 package_cache_async: bool | None = None) -> None:
+                 package_cache_async: bool | None = None,
+                 package_cache_pool: PackageVariantCachePool | None = None,
+                 seed_context: ResolvedContext | None = None,
+                 profile_solve: bool = False) -> None:
         """Perform a package resolve, and store the result.
 
         Args:
@@ -252,6 +259,20 @@ class ResolvedContext(object):
                 setting :data:`package_cache_during_build`.
             package_cache_async (bool|None): If True, cache packages asynchronously.
                 If None, use the config setting :data:`package_cache_async`
+            package_cache_pool (PackageVariantCachePool): Package variant
+                caches to share with other resolves. See
+                :func:`rez.resolve_batch.resolve_batch`.
+            seed_context (ResolvedContext): If provided, the resolve starts
+                from this context's resolve, which is much faster than a full
+                solve when the two are similar (as with a patched request).
+                Packages keep the variant they have in ``seed_context`` unless
+                their family has had a release since, or is named in a request
+                that differs from the seed context's. If that does not
+                resolve, a full solve is performed. Note that as a result,
+                packages may not be at the same versions a full solve would
+                choose.
+            profile_solve (bool): If True, profile the solve, and store the
+                result in :attr:`solve_profile`.
         """
         self.load_path: str | None = None
 
@@ -327,6 +348,7 @@ class ResolvedContext(object):
         self.solve_time = 0.0  # total solve time, inclusive of load time
         self.load_time = 0.0  # total time loading packages (disk or memcache)
         self.num_loaded_packages = 0  # num packages loaded (disk or memcache)
+        self.solve_profile: dict[str, Any] | None = None  # see Solver.profile
 
         # the pre-resolve bindings. We store these because @late package.py
         # functions need them, and we cache them to avoid cost
@@ -336,6 +358,9 @@ class ResolvedContext(object):
         self.parent_suite_path: str | None = None
         self.suite_context_name: str | None = None
 
+        # shell name -> prebaked startup script info (see `save`)
+        self.prebaked_shells: dict[str, dict[str, Any]] = {}
+
         # perform the solve
         callback_ = self.Callback(buf=buf,
                                   max_fails=max_fails,
@@ -349,6 +374,10 @@ class ResolvedContext(object):
 
         request = self.requested_packages(include_implicit=True)
 
+        variant_seeds = None
+        if seed_context is not None:
+            variant_seeds = self._get_variant_seeds(seed_context)
+
         resolver = Resolver(context=self,
                             package_requests=request,
                             package_paths=self.package_paths,
@@ -362,7 +391,10 @@ class ResolvedContext(object):
                             verbosity=verbosity,
                             buf=buf,
                             suppress_passive=suppress_passive,
-                            print_stats=print_stats)
+                            print_stats=print_stats,
+                            package_cache_pool=package_cache_pool,
+                            variant_seeds=variant_seeds,
+                            profile=profile_solve)
 
         resolver.solve()
 
@@ -373,6 +405,7 @@ class ResolvedContext(object):
         self.failure_description = resolver.failure_description
         self.graph_ = resolver.graph
         self.from_cache = resolver.from_cache
+        self.solve_profile = resolver.profile
 
         if self.status_ == ResolverStatus.solved:
             self._resolved_packages = []
@@ -499,6 +532,39 @@ class ResolvedContext(object):
         import copy
         return copy.copy(self)
 
+    def _get_variant_seeds(self, seed_context: ResolvedContext
+                           ) -> dict[str, tuple[Version, int | None]] | None:
+        """Get the variants of another context that this resolve can start from.
+        """
+        if not seed_context.success \
+                or seed_context.package_paths != self.package_paths \
+                or seed_context.building != self.building:
+            return None
+
+        old_requests = set(
+            str(x) for x in seed_context.requested_packages(include_implicit=True))
+        new_requests = set(
+            str(x) for x in self.requested_packages(include_implicit=True))
+
+        # reopen families whose requests were added, changed or removed
+        reopened = set(
+            Requirement(x).name for x in (old_requests ^ new_requests))
+
+        seeds = {}
+        for variant in seed_context.resolved_packages:
+            if variant.name in reopened:
+                continue
+
+            # reopen families that have had a release since. Note that a
+            # last release time of zero means that it is unknown
+            release_time = get_last_release_time(variant.name, self.package_paths)
+            if not release_time or release_time > seed_context.timestamp:
+                continue
+
+            seeds[variant.name] = (variant.version, variant.index)
+
+        return seeds
+
     def retargeted(self, package_paths: list[str], package_names: list[str] | None = None,
                    skip_missing: bool = False) -> ResolvedContext:
         """Create a retargeted copy of this context.
@@ -704,9 +770,27 @@ class ResolvedContext(object):
 
         return write_dot(self.graph_)
 
-    def save(self, path: str) -> None:
-        """Save the resolved context to file."""
+    def save(self, path: str, shells: Iterable[str] | None = None) -> None:
+        """Save the resolved context to file.
+
+        Args:
+            path (str): Filepath to save to.
+            shells (list of str): Also write the fully rendered startup script
+                of each of these shells next to the context file. When the
+                loaded context is later run in one of these shells (see
+                `execute_shell`), the script is sourced directly, rather than
+                being generated again, provided that its inputs have not
+                changed. Note that the script reflects the package definitions
+                as they were when saved. Ignored for contexts in bundles, as
+                these are relocatable.
+        """
+        self.prebaked_shells = {}
+
         with self._detect_bundle(path):
+            if shells and self.success and not self._get_bundle_path():
+                for shell in shells:
+                    self._prebake_shell(path, shell)
+
             with open(path, 'w') as f:
                 self.write_to_buffer(f)
 
@@ -851,6 +935,48 @@ class ResolvedContext(object):
             d["removed_packages"] = removed_packages
         return d
 
+    def print_solve_profile(self, buf: SupportsWrite = sys.stdout,
+                            max_families: int = 20) -> None:
+        """Print the solve profile (see :attr:`solve_profile`).
+
+        Args:
+            buf (typing.IO): Where to print the profile to.
+            max_families (int): Print only this many package families, in
+                order of most expensive to load.
+        """
+        _pr = Printer(buf)
+        profile = self.solve_profile
+
+        if not profile:
+            _pr("no solve profile (the solve was not profiled, or the resolve "
+                "was fetched from cache)")
+            return
+
+        operations = sorted(profile["operations"].items(),
+                            key=lambda x: x[1]["time"], reverse=True)
+
+        _pr("solver operations:", heading)
+        rows = [("OPERATION", "COUNT", "TIME"), ("---------", "-----", "----")]
+        for name, data in operations:
+            rows.append((name, str(data["count"]), "%.4fs" % data["time"]))
+        _pr('\n'.join(columnise(rows)))
+        _pr()
+
+        families = sorted(profile["families"].items(),
+                          key=lambda x: x[1]["load_time"], reverse=True)
+
+        _pr("package family loads:", heading)
+        rows = [("FAMILY", "PACKAGES", "TIME"), ("------", "--------", "----")]
+        for name, data in families[:max_families]:
+            rows.append((name, str(data["num_packages"]), "%.4fs" % data["load_time"]))
+        _pr('\n'.join(columnise(rows)))
+        if len(families) > max_families:
+            _pr("(%d more)" % (len(families) - max_families))
+        _pr()
+
+        phases = profile["phases"]
+        _pr("phases pushed: %d, popped: %d" % (phases["pushed"], phases["popped"]))
+
     @pool_memcached_connections
     def print_info(self, buf: SupportsWrite = sys.stdout, verbosity: int = 0,
                    source_order: bool = False, show_resolved_uris: bool = False) -> None:
@@ -1505,34 +1631,53 @@ class ResolvedContext(object):
         context_file = context_filepath or \
             os.path.join(tmpdir, "context.%s" % sh.file_extension())
 
-        # interpret this context and write out the native context (shell script) file
-        executor = self._create_executor(sh, parent_environ)
-        executor.env.REZ_RXT_FILE = rxt_file
-        executor.env.REZ_CONTEXT_FILE = context_file
+        shell_init_vars = {
+            "REZ_SHELL_INIT_TIMESTAMP": str(int(time.time())),
+            "REZ_SHELL_INTERACTIVE": "1" if command is None else "0"
+        }
+
+        # use the prebaked startup script, if there is a valid one
+        prebaked_file = None
+        if not (actions_callback or post_actions_callback or context_filepath):
+            prebaked_file = self._get_prebaked_script(sh, parent_environ)
 
-        if actions_callback:
-            header_comment(executor, "pre-actions-callback")
-            actions_callback(executor)
+        if prebaked_file:
+            if config.debug("shell_startup"):
+                print_debug("Using prebaked context %s" % prebaked_file)
 
-        self._execute(executor)
+            context_file = prebaked_file
+            parent_environ = dict(os.environ if parent_environ is None
+                                  else parent_environ)
+            parent_environ.update(shell_init_vars)
+        else:
+            # interpret this context and write out the native context (shell script) file
+            executor = self._create_executor(sh, parent_environ)
+            executor.env.REZ_RXT_FILE = rxt_file
+            executor.env.REZ_CONTEXT_FILE = context_file
 
-        executor.env.REZ_SHELL_INIT_TIMESTAMP = str(int(time.time()))
-        executor.env.REZ_SHELL_INTERACTIVE = "1" if command is None else "0"
+            if actions_callback:
+                header_comment(executor, "pre-actions-callback")
+                actions_callback(executor)
 
-        if post_actions_callback:
-            header_comment(executor, "post-actions-callback")
-            post_actions_callback(executor)
+            self._execute(executor)
 
-        self._execute_bundle_post_actions_callback(executor)
+            for key, value in shell_init_vars.items():
+                executor.setenv(key, value)
 
-        # write out the native context file
-        context_code = executor.get_output()
+            if post_actions_callback:
+                header_comment(executor, "post-actions-callback")
+                post_actions_callback(executor)
 
-        if config.debug("shell_startup"):
-            print_debug("Writing context to %s" % context_file)
+            self._execute_bundle_post_actions_callback(executor)
 
-        with open(context_file, 'w', encoding="utf-8") as f:
-            f.write(context_code)
+            # write out the native context file
+            context_code = executor.get_output()
+
+            if config.debug("shell_startup"):
+                print_debug("Writing context to %s" % context_file)
+
+            with open(context_file, 'w', encoding="utf-8") as f:
+                f.write(context_code)
 
         quiet = quiet or \
             (RezToolsVisibility[config.rez_tools_visibility] == RezToolsVisibility.never)
@@ -1663,7 +1808,9 @@ class ResolvedContext(object):
             from_cache=self.from_cache,
             solve_time=self.solve_time,
             load_time=self.load_time,
-            num_loaded_packages=self.num_loaded_packages
+            num_loaded_packages=self.num_loaded_packages,
+            solve_profile=self.solve_profile,
+            prebaked_shells=self.prebaked_shells
         ))
 
         if fields:
@@ -1805,6 +1952,14 @@ class ResolvedContext(object):
         # -- SINCE SERIALIZE 4.9
         r.testing = d.get("testing", False)
 
+        # -- SINCE SERIALIZE VERSION 4.10
+
+        r.solve_profile = d.get("solve_profile")
+
+        # -- SINCE SERIALIZE VERSION 4.11
+
+        r.prebaked_shells = d.get("prebaked_shells", {})
+
         # <END SERIALIZATION>
 
         # track context usage
@@ -2056,8 +2211,12 @@ class ResolvedContext(object):
         return self.pre_resolve_bindings
 
     @pool_memcached_connections
-    def _execute(self, executor: RexExecutor) -> None:
+    def _execute(self, executor: RexExecutor) -> dict[str, str]:
         """Bind various info to the execution context
+
+        Returns:
+            dict: Package cache roots of the variants that were remapped to
+            the package cache, keyed by package name.
         """
         def normalized(path: str) -> str:
             return executor.normalize_path(path)
@@ -2110,22 +2269,12 @@ class ResolvedContext(object):
         # the variant has been cached into the package cache
         #
         variant_bindings = {}
-
-        if self.package_caching and \
-                config.cache_packages_path and \
-                config.read_package_cache:
-            pkgcache = self._get_package_cache()
-        else:
-            pkgcache = None
+        cached_roots = self._get_cached_roots()
 
         for pkg in resolved_pkgs:
-            if pkgcache:
-                cached_root = pkgcache.get_cached_root(pkg)
-            else:
-                cached_root = None
-
             variant_binding = VariantBinding(
-                pkg, cached_root=cached_root, interpreter=executor.interpreter
+                pkg, cached_root=cached_roots.get(pkg.name),
+                interpreter=executor.interpreter
             )
             variant_bindings[pkg.name] = variant_binding
 
@@ -2142,10 +2291,6 @@ class ResolvedContext(object):
 
         header_comment(executor, "package variables")
 
-        # TODO this is not having any effect. Below, a RexError is getting
-        # raised on bad commands code, not a SourceCodeError
-        exc_type = SourceCodeError if config.catch_rex_errors else _NeverError
-
         # set basic package variables and create per-package bindings
         for pkg in resolved_pkgs:
             minor_header_comment(executor, "variables for package %s" % pkg.qualified_name)
@@ -2171,6 +2316,76 @@ class ResolvedContext(object):
                 executor.setenv(prefix + "_ROOT", normalized(pkg.root))
 
         # package commands
+        if config.cache_rex_actions and get_cache_servers():
+            self._execute_package_commands_cached(executor, variant_bindings)
+        else:
+            self._execute_package_commands(executor, variant_bindings)
+
+        # set variables per ephemeral
+        # for eph '.foo-1.2' for eg, $REZ_EPH_FOO_REQUEST="1.2"
+        if ephemerals:
+            header_comment(executor, "ephemeral variables")
+
+            for eph_req in ephemerals:
+                uname = eph_req.name[1:].upper().replace('.', '_')
+                varname = "REZ_EPH_" + uname + "_REQUEST"
+                executor.setenv(varname, str(eph_req.range))
+
+        header_comment(executor, "post system setup")
+
+        # append suite paths based on suite visibility setting
+        self._append_suite_paths(executor)
+
+        # append system paths
+        if self.append_sys_path:
+            executor.append_system_paths()
+
+        # add rez path so that rez commandline tools are still available within
+        # the resolved environment
+        mode = RezToolsVisibility[config.rez_tools_visibility]
+        if mode == RezToolsVisibility.append:
+            executor.append_rez_path()
+        elif mode == RezToolsVisibility.prepend:
+            executor.prepend_rez_path()
+
+        return cached_roots
+
+    def _get_cached_roots(self) -> dict[str, str]:
+        """Get the package cache roots of the resolved variants.
+
+        Note that this marks the cached variants as used, so they are not
+        evicted from the package cache while in use.
+
+        Returns:
+            dict: Cached variant roots, keyed by package name. Variants that
+            are not cached (or if package caching is off) are not present.
+        """
+        if self.package_caching and \
+                config.cache_packages_path and \
+                config.read_package_cache:
+            pkgcache = self._get_package_cache()
+        else:
+            pkgcache = None
+
+        if not pkgcache:
+            return {}
+
+        cached_roots = {}
+        for pkg in self.resolved_packages or []:
+            cached_root = pkgcache.get_cached_root(pkg)
+            if cached_root:
+                cached_roots[pkg.name] = cached_root
+
+        return cached_roots
+
+    def _execute_package_commands(self, executor: RexExecutor,
+                                  variant_bindings: dict[str, VariantBinding]) -> None:
+        resolved_pkgs = self.resolved_packages or []
+
+        # TODO this is not having any effect. Below, a RexError is getting
+        # raised on bad commands code, not a SourceCodeError
+        exc_type = SourceCodeError if config.catch_rex_errors else _NeverError
+
         for attr in ("pre_commands", "commands", "post_commands"):
             found = False
             for pkg in resolved_pkgs:
@@ -2187,7 +2402,7 @@ class ResolvedContext(object):
                 executor.bind('this', variant_binding)
                 executor.bind("version", VersionBinding(pkg.version))
                 executor.bind('root', variant_binding.root)
-                executor.bind('base', normalized(pkg.base))
+                executor.bind('base', executor.normalize_path(pkg.base))
 
                 exc = None
                 commands.set_package(pkg)
@@ -2214,32 +2429,186 @@ class ResolvedContext(object):
         for name in ("this", "version", "root", "base"):
             executor.unbind(name)
 
-        # set variables per ephemeral
-        # for eph '.foo-1.2' for eg, $REZ_EPH_FOO_REQUEST="1.2"
-        if ephemerals:
-            header_comment(executor, "ephemeral variables")
+    def _execute_package_commands_cached(self, executor: RexExecutor,
+                                         variant_bindings: dict[str, VariantBinding]) -> None:
+        """Execute package commands, replaying cached actions if possible.
 
-            for eph_req in ephemerals:
-                uname = eph_req.name[1:].upper().replace('.', '_')
-                varname = "REZ_EPH_" + uname + "_REQUEST"
-                executor.setenv(varname, str(eph_req.range))
+        Commands of a variant may depend on variables set by the variants
+        before it, so the actions of all the variants are cached as one
+        entry. The entry is reused if the parent environ variables read by the
+        commands are unchanged.
+        """
+        manager = executor.manager
+        key = self._get_rex_actions_cache_key(executor, variant_bindings)
 
-        header_comment(executor, "post system setup")
+        if key is not None:
+            with memcached_client() as client:
+                data = client.get(key)
 
-        # append suite paths based on suite visibility setting
-        self._append_suite_paths(executor)
+            if data:
+                parent_environ_reads, actions = data
+                if all(manager.parent_environ.get(k) == v
+                       for k, v in parent_environ_reads.items()):
+                    manager.replay(actions)
+                    return
 
-        # append system paths
-        if self.append_sys_path:
-            executor.append_system_paths()
+        num_actions = len(manager.actions)
 
-        # add rez path so that rez commandline tools are still available within
-        # the resolved environment
-        mode = RezToolsVisibility[config.rez_tools_visibility]
-        if mode == RezToolsVisibility.append:
-            executor.append_rez_path()
-        elif mode == RezToolsVisibility.prepend:
-            executor.prepend_rez_path()
+        with manager.recording_parent_environ() as recorder:
+            self._execute_package_commands(executor, variant_bindings)
+
+        if key is None or recorder.read_all:
+            return
+
+        data = (recorder.reads, manager.actions[num_actions:])
+        with memcached_client() as client:
+            client.set(key, data)
+
+    def _get_rex_actions_cache_key(self, executor: RexExecutor,
+                                   variant_bindings: dict[str, VariantBinding]) -> str | None:
+        """Get the cache key of the actions of the package commands.
+
+        Returns:
+            str: The key, or None if the actions cannot be cached.
+        """
+        variants = []
+
+        for pkg in self.resolved_packages or []:
+            try:
+                repo = pkg.resource._repository
+                state = repo.get_variant_state_handle(pkg.resource)
+            except (IOError, OSError):
+                return None
+
+            variants.append((pkg.uri, state, variant_bindings[pkg.name].root))
+
+        manager = executor.manager
+        interpreter = executor.interpreter
+
+        if manager.parent_variables is True:
+            parent_variables: bool | list[str] = True
+        else:
+            parent_variables = sorted(manager.parent_variables)
+
+        t = (
+            variants,
+            [str(x) for x in self._package_requests],
+            [str(x) for x in self.implicit_packages],
+            [str(x) for x in self.resolved_ephemerals or []],
+            self.building,
+            self.testing,
+            type(interpreter).__name__,
+            interpreter.pathsep,
+            system.platform,
+            system.arch,
+            system.os,
+            parent_variables,
+            sorted(manager._env_sep_map.items()),
+            sorted(manager.environ.items())
+        )
+
+        h = sha1(repr(t).encode("utf-8")).hexdigest()
+        return str(("rex_actions", __version__, h))
+
+    def _prebake_shell(self, path: str, shell: str) -> None:
+        """Write the startup script of the given shell, for a context being
+        saved to `path`.
+        """
+        sh = create_shell(shell)
+        shell_name = sh.name()
+        filename = "%s.%s.%s" % (os.path.splitext(os.path.basename(path))[0],
+                                 shell_name, sh.file_extension())
+        filepath = os.path.join(os.path.dirname(os.path.abspath(path)), filename)
+
+        executor = self._create_executor(sh, None)
+
+        with executor.manager.recording_parent_environ() as recorder:
+            executor.env.REZ_RXT_FILE = path
+            executor.env.REZ_CONTEXT_FILE = filepath
+            cached_roots = self._execute(executor)
+
+        if recorder.read_all:
+            print_debug("Cannot prebake %s context, commands read the entire "
+                        "environment", shell_name)
+            return
+
+        with open(filepath, 'w', encoding="utf-8") as f:
+            f.write(executor.get_output())
+
+        self.prebaked_shells[shell_name] = {
+            "filename": filename,
+            "environ_keys": sorted(recorder.reads),
+            "cached_roots": cached_roots,
+            "hash": self._get_prebaked_shell_hash(shell_name, path, recorder.reads)
+        }
+
+    def _get_prebaked_script(self, sh: Shell,
+                             parent_environ: Mapping[str, str] | None) -> str | None:
+        """Get the prebaked startup script of a shell, if it is still valid.
+
+        Returns:
+            str: Path to the script, or None.
+        """
+        entry = self.prebaked_shells.get(sh.name())
+        if not entry or not self.load_path:
+            return None
+
+        environ = os.environ if parent_environ is None else parent_environ
+        environ_reads = dict((k, environ.get(k)) for k in entry["environ_keys"])
+        hash_ = self._get_prebaked_shell_hash(sh.name(), self.load_path, environ_reads)
+
+        if hash_ != entry["hash"]:
+            if config.debug("shell_startup"):
+                print_debug("Prebaked %s context is stale", sh.name())
+            return None
+
+        # The script refers to package cache roots, which may since have been
+        # evicted (or, variants may have been cached since). This also marks
+        # cached variants as used, as a normal shell startup would.
+        if self._get_cached_roots() != entry.get("cached_roots", {}):
+            if config.debug("shell_startup"):
+                print_debug("Prebaked %s context has stale package cache roots",
+                            sh.name())
+            return None
+
+        filepath = os.path.join(os.path.dirname(os.path.abspath(self.load_path)),
+                                entry["filename"])
+
+        return filepath if os.path.isfile(filepath) else None
+
+    def _get_prebaked_shell_hash(self, shell_name: str, path: str,
+                                 environ_reads: Mapping[str, str | None]) -> str:
+        """Hash of the inputs that a prebaked startup script depends on,
+        other than the context itself.
+        """
+        from rez.suite import Suite
+
+        if SuiteVisibility[config.suite_visibility] == SuiteVisibility.never:
+            suite_paths = []
+        else:
+            suite_paths = Suite.visible_suite_paths()
+
+        t = (
+            __version__,
+            shell_name,
+            os.path.abspath(path),
+            system.platform,
+            system.arch,
+            system.os,
+            self.append_sys_path,
+            self.package_caching,
+            config.rez_tools_visibility,
+            config.all_parent_variables,
+            sorted(config.parent_variables),
+            sorted(config.env_var_separators.items()),
+            config.cache_packages_path,
+            config.read_package_cache,
+            config.rez_1_environment_variables and not config.disable_rez_1_compatibility,
+            suite_paths,
+            sorted(environ_reads.items(), key=lambda x: x[0])
+        )
+
+        return sha1(repr(t).encode("utf-8")).hexdigest()
 
     def _append_suite_paths(self, executor: RexExecutor) -> None:
         from rez.suite import Suite
@@ -8,18 +8,20 @@ from rez.solver import Solver, SolverCallbackReturn, SolverState, SolverStatus
 from rez.package_repository import package_repository_manager
 from rez.packages import get_variant, get_last_release_time, Package, Variant
 from rez.package_filter import PackageFilterList, TimestampRule
-from rez.utils.memcached import memcached_client, pool_memcached_connections, Client
+from rez.utils.memcached import memcached_client, pool_memcached_connections, \
+    get_cache_servers, Client
 from rez.utils.logging_ import log_duration
 from rez.config import config
-from rez.version import Requirement
+from rez.version import Requirement, Version
 from contextlib import contextmanager
 from enum import Enum
 from hashlib import sha1
-from typing import Any, Callable, Iterator, TypedDict, TYPE_CHECKING
+from typing import Any, Callable, Iterator, Optional, Tuple, TypedDict, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from rez.package_order import PackageOrderList
     from rez.resolved_context import ResolvedContext
+    from rez.solver import PackageVariantCachePool
     from rez.utils.typing import SupportsWrite
 
 
@@ -33,6 +35,11 @@ class SolverDict(TypedDict):
     ephemerals: list[str]
 
 
+# (solver dict, release times, variant states, repository generations). Note
+# that typing.Tuple is used as this is evaluated at runtime (see python 3.8)
+CachedSolve = Tuple[SolverDict, dict, dict, Optional[tuple]]
+
+
 class ResolverStatus(Enum):
     """ Enum to represent the current state of a resolver instance.  The enum
     also includes a human readable description of what the state represents.
@@ -68,7 +75,10 @@ class Resolver(object):
                  package_load_callback: Callable[[Package], Any] | None = None,
                  caching: bool = True,
                  suppress_passive: bool = False,
-                 print_stats: bool = False) -> None:
+                 print_stats: bool = False,
+                 package_cache_pool: PackageVariantCachePool | None = None,
+                 variant_seeds: dict[str, tuple[Version, int | None]] | None = None,
+                 profile: bool = False) -> None:
         """Create a Resolver.
 
         Args:
@@ -86,6 +96,14 @@ class Resolver(object):
             caching: If True, cache(s) may be used to speed the resolve. If
                 False, caches will not be used.
             print_stats (bool): If true, print advanced solver stats at the end.
+            package_cache_pool (`PackageVariantCachePool`): Variant caches to
+                share with other resolves. See `Solver`.
+            variant_seeds (dict): If provided, a solve seeded with these
+                variants is attempted first (see `Solver`). If it does not
+                succeed, a full solve is performed. Resolve caches are not
+                used for the seeded solve.
+            profile (bool): If True, profile the solve (see `Solver.profile`).
+                A resolve fetched from cache has no profile.
         """
         self.context = context
         self.package_requests = package_requests
@@ -101,6 +119,9 @@ class Resolver(object):
         self.buf = buf
         self.suppress_passive = suppress_passive
         self.print_stats = print_stats
+        self.package_cache_pool = package_cache_pool
+        self.variant_seeds = variant_seeds
+        self.profiling = profile
 
         # store hash of package orderers. This is used in the memcached key
         if package_orderers:
@@ -133,7 +154,9 @@ class Resolver(object):
         self.failure_description: str | None = None
         self.graph_: digraph | None = None
         self.from_cache = False
-        self.memcached_servers = config.memcached_uri if config.resolve_caching else None
+        self.profile: dict[str, Any] | None = None
+        self.memcached_servers = get_cache_servers() if config.resolve_caching else None
+        self._repo_generations: tuple | None = None
 
         self.solve_time: float | None = 0.0  # time spent solving
         self.load_time: float | None = 0.0   # time spent loading package resources
@@ -144,6 +167,17 @@ class Resolver(object):
     def solve(self) -> None:
         """Perform the solve.
         """
+        if self.variant_seeds:
+            solver = self._solve(variant_seeds=self.variant_seeds)
+
+            if solver.status == SolverStatus.solved:
+                self.from_cache = False
+                self.profile = solver.profile
+                self._set_result(self._solver_to_dict(solver))
+                return
+
+            self._print("Seeded solve did not succeed, performing full solve")
+
         with log_duration(self._print, "memcache get (resolve) took %s"):
             solver_dict = self._get_cached_solve()
 
@@ -153,6 +187,7 @@ class Resolver(object):
         else:
             self.from_cache = False
             solver = self._solve()
+            self.profile = solver.profile
             solver_dict = self._solver_to_dict(solver)
             self._set_result(solver_dict)
 
@@ -242,17 +277,25 @@ class Resolver(object):
         reused if the timestamp matches exactly (but this might happen a lot -
         consider a workflow where a work area is tied down to a particular
         timestamp in order to 'lock' it from any further software releases).
+
+        In all cases, if every repository provides a generation (see
+        `PackageRepository.get_generation`) and none has changed since the
+        entry was stored, then neither packages nor releases have changed, and
+        the checks for these are skipped.
         """
         if not (self.caching and self.memcached_servers):
             return None
 
+        # read before the solve (if any), so that a change during the solve
+        # results in a cache entry that is never validated by generation
+        self._repo_generations = self._get_repository_generations()
+
         # these caches avoids some potentially repeated file stats
         variant_states = {}
         last_release_times = {}
 
-        def _hit(data: tuple[SolverDict, dict, dict]) -> SolverDict:
-            solver_dict, _, _ = data
-            return solver_dict
+        def _hit(data: CachedSolve) -> SolverDict:
+            return data[0]
 
         def _miss() -> None:
             self._print("No cache key retrieved")
@@ -263,15 +306,24 @@ class Resolver(object):
                 client.delete(key)
             self._print("Discarded entry: %r", key)
 
-        def _retrieve(timestamped: bool) -> tuple[str, tuple[SolverDict, dict, dict]]:
+        def _retrieve(timestamped: bool) -> tuple[str, CachedSolve]:
             key = self._memcache_key(timestamped=timestamped)
             self._print("Retrieving memcache key: %r", key)
             with self._memcached_client() as client:
                 data = client.get(key)
             return key, data
 
-        def _packages_changed(key: str, data: tuple[SolverDict, dict, dict]) -> bool:
-            solver_dict, _, variant_states_dict = data
+        def _repos_unchanged(key: str, data: CachedSolve) -> bool:
+            if self._repo_generations is None or len(data) < 4:
+                return False
+            if data[3] != self._repo_generations:
+                self._print("Repositories have changed since entry was "
+                            "cached (entry: %r)", key)
+                return False
+            return True
+
+        def _packages_changed(key: str, data: CachedSolve) -> bool:
+            solver_dict, variant_states_dict = data[0], data[2]
             for variant_handle in solver_dict.get("variant_handles", []):
                 variant = self._get_variant(variant_handle)
                 old_state = variant_states_dict.get(variant.name)
@@ -296,8 +348,8 @@ class Resolver(object):
                     return True
             return False
 
-        def _releases_since_solve(key: str, data: tuple[SolverDict, dict, dict]) -> bool:
-            _, release_times_dict, _ = data
+        def _releases_since_solve(key: str, data: CachedSolve) -> bool:
+            release_times_dict = data[1]
             for package_name, release_time in release_times_dict.items():
                 time_ = last_release_times.get(package_name)
                 if time_ is None:
@@ -312,8 +364,8 @@ class Resolver(object):
                     return True
             return False
 
-        def _timestamp_is_earlier(key: str, data: tuple[SolverDict, dict, dict]) -> bool:
-            _, release_times_dict, _ = data
+        def _timestamp_is_earlier(key: str, data: CachedSolve) -> bool:
+            release_times_dict = data[1]
             for package_name, release_time in release_times_dict.items():
                 if self.timestamp < release_time:
                     self._print("Resolve timestamp (%d) is earlier than %r in "
@@ -326,7 +378,10 @@ class Resolver(object):
 
         if self.timestamp:
             if data:
-                if _packages_changed(key, data) or _releases_since_solve(key, data):
+                if _repos_unchanged(key, data):
+                    if not _timestamp_is_earlier(key, data):
+                        return _hit(data)
+                elif _packages_changed(key, data) or _releases_since_solve(key, data):
                     _delete_cache_entry(key)
                 elif not _timestamp_is_earlier(key, data):
                     return _hit(data)
@@ -334,6 +389,8 @@ class Resolver(object):
             key, data = _retrieve(True)
             if not data:
                 return _miss()  # type: ignore[func-returns-value]
+            if _repos_unchanged(key, data):
+                return _hit(data)
             if _packages_changed(key, data):
                 _delete_cache_entry(key)
                 return _miss()  # type: ignore[func-returns-value]
@@ -342,6 +399,8 @@ class Resolver(object):
         else:
             if not data:
                 return _miss()  # type: ignore[func-returns-value]
+            if _repos_unchanged(key, data):
+                return _hit(data)
             if _packages_changed(key, data) or _releases_since_solve(key, data):
                 _delete_cache_entry(key)
                 return _miss()  # type: ignore[func-returns-value]
@@ -397,11 +456,28 @@ class Resolver(object):
 
         timestamped = bool(self.timestamp and releases_since_solve)
         key = self._memcache_key(timestamped=timestamped)
-        data = (solver_dict, release_times_dict, variant_states_dict)
+        data = (solver_dict, release_times_dict, variant_states_dict,
+                self._repo_generations)
         with self._memcached_client() as client:
             client.set(key, data)
         self._print("Sent memcache key: %r", key)
 
+    def _get_repository_generations(self) -> tuple | None:
+        """Get the generation of each repository in the package search path.
+
+        Returns:
+            tuple: Generations, or None if any repository does not provide one.
+        """
+        generations = []
+        for path in self.package_paths:
+            repo = package_repository_manager.get_repository(path)
+            generation = repo.get_generation()
+            if generation is None:
+                return None
+            generations.append(generation)
+
+        return tuple(generations)
+
     def _memcache_key(self, timestamped: bool = False) -> str:
         """Makes a key suitable as a memcache entry."""
         request = tuple(map(str, self.package_requests))
@@ -424,7 +500,8 @@ class Resolver(object):
 
         return str(tuple(t))
 
-    def _solve(self) -> Solver:
+    def _solve(self, variant_seeds: dict[str, tuple[Version, int | None]] | None = None
+               ) -> Solver:
         solver = Solver(package_requests=self.package_requests,
                         package_paths=self.package_paths,
                         context=self.context,
@@ -437,7 +514,10 @@ class Resolver(object):
                         prune_unfailed=config.prune_failed_graph,
                         buf=self.buf,
                         suppress_passive=self.suppress_passive,
-                        print_stats=self.print_stats)
+                        print_stats=self.print_stats,
+                        package_cache_pool=self.package_cache_pool,
+                        variant_seeds=variant_seeds,
+                        profile=self.profiling)
         solver.solve()
 
         return solver
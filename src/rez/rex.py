@@ -13,7 +13,7 @@ from enum import Enum
 from contextlib import contextmanager
 from string import Formatter
 from collections.abc import MutableMapping
-from typing import Any, Iterable, Mapping
+from typing import Any, Iterable, Iterator, Mapping
 
 from rez.system import system
 from rez.config import config
@@ -446,6 +446,79 @@ class ActionManager(object):
     def _keytoken(self, key):
         return self.interpreter.get_key_token(key)
 
+    # -- recording and replay
+
+    @contextmanager
+    def recording_parent_environ(self) -> Iterator[_ParentEnvironRecorder]:
+        """Record reads of the parent environ.
+
+        Within this context, every variable looked up in the parent environ is
+        recorded, along with its value (None if it was not set). This tells
+        which parts of the parent environ affected the actions issued in the
+        context.
+
+        Returns:
+            `_ParentEnvironRecorder`: The recorder. Its `reads` attribute holds
+            the recorded values, and `read_all` is True if the whole environ
+            was iterated over.
+        """
+        parent_environ = self.parent_environ
+        recorder = _ParentEnvironRecorder(parent_environ)
+        self.parent_environ = recorder
+
+        try:
+            yield recorder
+        finally:
+            self.parent_environ = parent_environ
+
+    def replay(self, actions: Iterable[Action]) -> None:
+        """Apply actions previously recorded by an action manager.
+
+        The recorded keys and values have already been formatted, so are not
+        formatted again. They are still expanded against the current
+        environment, and applied to the interpreter as normal.
+
+        Args:
+            actions (list of `Action`): Actions to apply.
+        """
+        formatter = self.formatter
+        self.formatter = str
+
+        try:
+            for action in actions:
+                getattr(self, action.name)(*action.args)
+        finally:
+            self.formatter = formatter
+
+
+class _ParentEnvironRecorder(Mapping):
+    """Read-only environ wrapper that records the variables looked up in it.
+    """
+    def __init__(self, environ: Mapping[str, str]) -> None:
+        self.environ = environ
+        self.reads: dict[str, str | None] = {}
+        self.read_all = False
+
+    def __getitem__(self, key: str) -> str:
+        value = self.environ.get(key)
+        self.reads[key] = value
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        value = self.environ.get(key)
+        self.reads[key] = value
+        return value is not None
+
+    def __iter__(self):
+        self.read_all = True
+        return iter(self.environ)
+
+    def __len__(self) -> int:
+        self.read_all = True
+        return len(self.environ)
+
 
 #===============================================================================
 # Interpreters
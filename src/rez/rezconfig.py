@@ -133,6 +133,14 @@ package_definition_python_path = None
 # Search path for rez plugins.
 plugin_path = []
 
+# Directory to cache the results of plugin discovery to. If set, the plugins of
+# each type (and their settings) are read from this cache rather than found by
+# importing every plugin module, and a plugin is only imported when it is first
+# used. The cache is invalidated when the plugin search paths change, or when a
+# plugin module, plugin :file:`rezconfig` file or installed package changes.
+# This speeds up rez startup, especially when many plugins are installed.
+plugin_cache_path = None
+
 # Search path for bind modules. The :ref:`rez-bind` tool uses these modules to create
 # rez packages that reference existing software already installed on the system.
 bind_module_path = []
@@ -152,6 +160,20 @@ resolve_caching = True
 # changes).
 cache_package_files = True
 
+# Cache the rex actions produced by the commands of resolved packages to
+# memcached (or the local cache store, see :data:`cache_backend`), if enabled.
+# When a context is executed again (eg re-sourcing a saved context, or calling
+# get_environ), the recorded actions are replayed instead of running each
+# package's ``pre_commands``, ``commands`` and ``post_commands``. Entries are keyed
+# on the resolved variants (and their package definition files' state), the
+# target shell, platform and relevant settings, and are only reused if the parent
+# environment variables that the commands read are unchanged.
+#
+# Note that commands that depend on something else - for example, that read
+# ``os.environ`` directly, or check for files in the package payload - may not
+# be re-evaluated when they should be. This is why caching is disabled by default.
+cache_rex_actions = False
+
 # Cache directory traversals to memcached, if enabled. Updated directory entries
 # will still be read correctly (ie, the cache invalidates when the filesystem
 # changes).
@@ -162,11 +184,30 @@ cache_listdir = True
 # of unlimited size. The size refers to the number of entries, not byte count.
 resource_caching_maxsize = -1
 
+# The backend used for resolve, package file and directory listing caching.
+# Valid values are:
+#
+# - ``memcached``: Use the memcached server(s) in :data:`memcached_uri`. Caching is
+#   disabled if no servers are configured.
+# - ``local``: Use a store on local disk at :data:`local_cache_path`. This is shared
+#   by all rez processes on the host, and needs no running service. Useful on
+#   hosts (eg render farm nodes) that cannot reach a memcached server.
+cache_backend = "memcached"
+
 # Uris of running memcached server(s) to use as a file and resolve cache. For
 # example, the URI ``127.0.0.1:11211`` points to memcached running on localhost on
 # its default port. Must be either None, or a list of strings.
 memcached_uri = []
 
+# Directory of the local cache store, used when :data:`cache_backend` is ``local``.
+# This should be on local disk, and writable by all users that run rez on the
+# host.
+local_cache_path = "~/.rez/cache"
+
+# Max size of the local cache store, in megabytes. When exceeded, the least
+# recently used entries are evicted. Zero means unlimited.
+local_cache_max_size = 1024
+
 # Bytecount beyond which memcached entries are compressed, for cached package
 # files (such as package.yaml, package.py). Zero means never compress.
 memcached_package_file_min_compress_len = 16384
@@ -299,6 +340,37 @@ package_cache_same_device = False
 # to periodically run :option:`rez-pkg-cache --clean`. Set to -1 to disable.
 package_cache_clean_limit = 0.5
 
+# The maximum number of variants that the caching daemon copies into the cache at once.
+package_cache_max_concurrent_variants = 2
+
+# The number of threads used to copy the files of a variant's payload into the cache. Note
+# that this is per variant, see :data:`package_cache_max_concurrent_variants`.
+package_cache_copy_threads = 4
+
+# Payload files larger than this many bytes are split into chunks of this size, which are
+# copied concurrently. Set to 0 to disable chunking.
+package_cache_copy_chunk_size = 67108864
+
+# If True, files that are identical across cached variants (for example, the same pure python
+# package built for several python versions) are only stored once in the package cache. The
+# contents of each cached file are stored by digest in :file:`{pkg-cache-root}/.sys/blobs`, and
+# cached variants hardlink to them. The store is cleaned of contents no longer used by any variant
+# as part of cleaning the cache. The cache's filesystem must support hardlinks; where it does
+# not, files are copied as normal.
+#
+# .. note::
+#    Hardlinked files share their metadata, so the modification times of deduplicated files in
+#    a cached variant may not match those of the original payload.
+package_cache_dedup = False
+
+# If True, the package cache keeps an index of its cached variants (an sqlite
+# database, stored at :file:`{pkg-cache-root}/.sys/index.db`). This avoids walking
+# the cache directory when listing or cleaning the cache, and walking variant
+# payloads when checking cache space requirements. The index is created from the
+# cache contents the first time it is needed; if the cache is modified by other
+# means (such as an older rez version), use :option:`rez-pkg-cache --rebuild-index`.
+package_cache_index = True
+
 # Number of days of package cache logs to keep.
 # Logs are written to :file:`{pkg-cache-root}/.sys/log/{filename}.log`
 package_cache_log_days = 7
@@ -327,6 +399,33 @@ package_cache_space_buffer = 104857600
 #    in block size, allocation strategies and metadata overhead.
 package_cache_used_threshold = 80
 
+# The policy used to evict cached variants when the cache's disk fills up. When disk usage
+# exceeds :data:`package_cache_eviction_high_watermark` (or free space drops below
+# :data:`package_cache_space_buffer`), the caching daemon evicts variants until disk usage is
+# below :data:`package_cache_eviction_low_watermark`. It also evicts variants to make room for a
+# pending variant that would otherwise be skipped. Valid values are:
+#
+# - ``none``: Never evict variants. Caching stops once the cache is full.
+# - ``lru``: Evict the least recently used variants first.
+# - ``lfu``: Evict the least frequently used variants first.
+# - ``lru_size``: Evict variants with the largest payload size multiplied by time since last
+#   use first. This frees space with the fewest evictions.
+#
+# Eviction requires the package cache index (see :data:`package_cache_index`). Note that an
+# evicted variant may still be in use by a running context; see
+# :data:`package_cache_eviction_min_idle`.
+package_cache_eviction_policy = "none"
+
+# Disk usage percentage of the cache's filesystem above which variants are evicted.
+package_cache_eviction_high_watermark = 90
+
+# Disk usage percentage of the cache's filesystem that eviction brings disk usage back down to.
+# This should be lower than :data:`package_cache_used_threshold`.
+package_cache_eviction_low_watermark = 70
+
+# Variants that have been used within this many seconds are never evicted.
+package_cache_eviction_min_idle = 3600
+
 ###############################################################################
 # Package Resolution
 ###############################################################################
@@ -472,6 +571,13 @@ allow_unversioned_packages = True
 #    when this option is disabled.
 error_on_missing_variant_requires = True
 
+# Number of threads the solver uses to load package families in the background.
+# Families in the request, and families newly required during the solve, are
+# loaded ahead of time so that repository latency (such as directory listings on
+# network storage) overlaps rather than accumulates. Solve results are unaffected.
+# Set to zero to load families on demand only.
+solver_prefetch_threads = 8
+
 ###############################################################################
 # Environment Resolution
 ###############################################################################
@@ -548,6 +654,24 @@ pathed_env_vars = [
 # - "parent_priority":  Keep all suites visible and the parent takes precedence
 suite_visibility = "always"
 
+# Shells to write prebaked startup scripts for, when a suite is saved. Tools run
+# from the suite in one of these shells source the script directly, rather than
+# executing the commands of every package in the context on each launch. Scripts
+# are only used while their inputs (such as the relevant parts of the parent
+# environment, and rez settings) are unchanged. Note that a script reflects the
+# package definitions as they were when the suite was saved.
+suite_prebaked_shells = []
+
+# If True, a launch record is written for each suite tool when a suite is saved.
+# A launch record holds the environment of the tool's context and the path of
+# the tool's executable, so that the tool can be run directly, without loading
+# the suite or interpreting its context. A record is only used while its inputs
+# (the context file, the package definition files of the context, rez config
+# files and the relevant parts of the parent environment) are unchanged, and
+# when no wrapper arguments (such as ``+i``) are given. Note that tools launched
+# this way are not run within a shell.
+suite_tool_launch_records = False
+
 # Defines how Rez's command line tools are added back to ``$PATH`` within a resolved
 # environment. Valid values are:
 #
@@ -790,6 +914,12 @@ build_directory = "build"
 # during builds.
 build_thread_count = "physical_cores"
 
+# The number of variants to build at once, by default. This is the default of
+# the ``rez-build --jobs`` option. When more than one variant is built at once,
+# each variant's build output is written to a log file in the build directory,
+# and printed (in variant order) once that variant is done.
+build_variant_jobs = 1
+
 # The release hooks to run when a release occurs. Release hooks are plugins. If
 # a plugin listed here is not present, a warning message is printed. Note that a
 # release hook plugin being loaded does not mean it will run. It needs to be
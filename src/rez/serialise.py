@@ -3,7 +3,8 @@
 
 
 """
-Read and write data from file. File caching via a memcached server is supported.
+Read and write data from file. File caching via a memcached server, or the
+local cache store, is supported.
 """
 from __future__ import annotations
 
@@ -23,7 +24,7 @@ from rez.utils.sourcecode import SourceCode, early, late, include
 from rez.utils.filesystem import TempDirs
 from rez.utils.data_utils import ModifyList
 from rez.exceptions import ResourceError, InvalidPackageError
-from rez.utils.memcached import memcached
+from rez.utils.memcached import memcached, get_cache_servers
 from rez.utils.execution import add_sys_paths
 from rez.util import get_function_arg_names
 from rez.config import config
@@ -154,7 +155,7 @@ def _load_from_file__key(filepath, format_, update_data_callback):
                 int(st.st_ino), st.st_mtime))
 
 
-@memcached(servers=config.memcached_uri if config.cache_package_files else None,
+@memcached(servers=get_cache_servers() if config.cache_package_files else None,
            min_compress_len=config.memcached_package_file_min_compress_len,
            key=_load_from_file__key,
            debug=config.debug_memcache)
@@ -26,11 +26,14 @@ from rez.exceptions import PackageNotFoundError, ResolveError, \
 from rez.version import Version, VersionRange
 from rez.version import VersionedObject, Requirement, RequirementList
 from rez.utils.typing import SupportsLessThan, SupportsWrite
-from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import wraps
 from enum import Enum
 from itertools import product, chain
-from typing import cast, Any, Callable, Generator, Iterator, TypeVar, TYPE_CHECKING
+from typing import cast, Any, Callable, Generator, Iterable, Iterator, TypeVar, TYPE_CHECKING
 import copy
+import threading
 import time
 import sys
 import os
@@ -42,6 +45,7 @@ if TYPE_CHECKING:
 
 
 T = TypeVar("T")
+CallableT = TypeVar("CallableT", bound=Callable)
 
 
 # a hidden control for forcing to non-optimized solving mode. This is here as
@@ -164,6 +168,68 @@ class SolverState(object):
                 % (self.num_solves, self.num_fails, str(self.phase)))
 
 
+class _SolverProfile(object):
+    """Time spent and call counts per solver operation.
+
+    Times are inclusive - for example, the time spent loading a package family
+    during an intersection is also counted in the intersection time.
+    """
+    def __init__(self) -> None:
+        self.operations: dict[str, list] = {}  # {name: [count, secs]}
+        self.families: dict[str, dict[str, Any]] = {}
+        self.phases_pushed = 0
+        self.phases_popped = 0
+
+    @contextmanager
+    def timed(self, name: str) -> Generator:
+        t = time.time()
+        try:
+            yield
+        finally:
+            secs = time.time() - t
+            entry = self.operations.get(name)
+            if entry is None:
+                self.operations[name] = [1, secs]
+            else:
+                entry[0] += 1
+                entry[1] += secs
+
+    def add_family_load(self, name: str, secs: float, num_packages: int = 0) -> None:
+        entry = self.families.setdefault(
+            name, {"load_time": 0.0, "num_packages": 0})
+        entry["load_time"] += secs
+        entry["num_packages"] += num_packages
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operations": dict(
+                (k, {"count": v[0], "time": v[1]})
+                for k, v in self.operations.items()
+            ),
+            "families": copy.deepcopy(self.families),
+            "phases": {
+                "pushed": self.phases_pushed,
+                "popped": self.phases_popped
+            }
+        }
+
+
+def _profiled(name: str) -> Callable[[CallableT], CallableT]:
+    """Decorator that profiles a method of an object that has a solver."""
+    def decorator(fn: CallableT) -> CallableT:
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            profile = self.solver.profile_
+            if profile is None:
+                return fn(self, *args, **kwargs)
+
+            with profile.timed(name):
+                return fn(self, *args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
 class _Common(object):
     def __repr__(self) -> str:
         return "%s(%s)" % (self.__class__.__name__, str(self))
@@ -405,6 +471,7 @@ class _PackageEntry(object):
         entry.sorted = next_entry.sorted = True
         return entry, next_entry
 
+    @_profiled("sort_variants")
     def sort(self) -> None:
         """Sort variants from most correct to consume, to least.
 
@@ -473,36 +540,57 @@ class _PackageEntry(object):
 class _PackageVariantList(_Common):
     """A list of package variants, loaded lazily.
     """
-    def __init__(self, package_name: str, solver: Solver) -> None:
+    def __init__(self, package_name: str, solver: Solver,
+                 packages: list[Package] | None = None) -> None:
+        """
+        Args:
+            packages (list of `Package`): Packages in the family, if already
+                loaded (see `PackageVariantCache.prefetch`).
+        """
         self.package_name = package_name
-        self.solver = solver
 
         # note: we do not apply package filters here, because doing so might
         # cause package loads (eg, timestamp rules). We only apply filters
         # during an intersection, which minimises the amount of filtering.
         #
+        # Each entry is a [package, value] pair, where value is False if the
+        # package has not been filtered yet, None if it was filtered out, True
+        # if it passed the filter, or its list of variants once expanded.
+        #
         self.entries: list[list[Any]] = []
+        self.solver = solver
 
-        for package in iter_packages(self.package_name,
-                                     paths=self.solver.package_paths):
+        if packages is None:
+            packages = _load_family_packages(package_name, solver.package_paths)
+
+        for package in packages:
             package.set_context(solver.context)
             self.entries.append([package, False])
 
         if not self.entries:
             raise PackageFamilyNotFoundError(
                 "package family not found: %s (searched: %s)"
-                % (package_name, "; ".join(self.solver.package_paths)))
+                % (package_name, "; ".join(solver.package_paths)))
 
-    def get_intersection(self, range_: VersionRange) -> list[_PackageEntry] | None:
+    def get_intersection(self, range_: VersionRange, solver: Solver) -> list[_PackageEntry] | None:
         """Get a list of variants that intersect with the given range.
 
         Args:
             range_ (`VersionRange`): Package version range.
+            solver (`Solver`): Solver performing the intersection. This may
+                differ from the solver the list was created in, if the variant
+                cache is shared (see `PackageVariantCachePool`).
 
         Returns:
             List of `_PackageEntry` objects.
         """
+        if solver is not self.solver:
+            self._bind(solver)
+
         result = []
+        seed = None
+        if solver.variant_seeds:
+            seed = solver.variant_seeds.get(self.package_name)
 
         for entry in self.entries:
             package, value = entry
@@ -513,15 +601,24 @@ class _PackageVariantList(_Common):
             if package.version not in range_:
                 continue
 
+            if seed is not None and package.version != seed[0]:
+                continue
+
             if isinstance(value, list):
                 variants = value
-                entry_ = _PackageEntry(package, variants, self.solver)
+                if seed is not None:
+                    variants = [x for x in variants if x.index == seed[1]]
+                    if not variants:
+                        continue
+
+                entry_ = _PackageEntry(package, variants, solver)
                 result.append(entry_)
                 continue
 
             # apply package filter
-            if self.solver.package_filter:
-                rule = self.solver.package_filter.excludes(package)
+            if value is False and solver.package_filter:
+                with solver.profiled("filter"):
+                    rule = solver.package_filter.excludes(package)
                 if rule:
                     if config.debug_package_exclusions:
                         print_debug("Package '%s' was excluded by rule '%s'"
@@ -530,20 +627,48 @@ class _PackageVariantList(_Common):
                     continue
 
             # expand package entry into list of variants
-            if self.solver.package_load_callback:
-                self.solver.package_load_callback(package)
+            if solver.package_load_callback:
+                solver.package_load_callback(package)
 
+            t = time.time()
             variants_ = []
             for var in package.iter_variants():
-                variant = PackageVariant(var, self.solver.building)
+                variant = PackageVariant(var, solver.building)
                 variants_.append(variant)
 
+            if solver.profile_ is not None:
+                solver.profile_.add_family_load(self.package_name, time.time() - t)
+
             entry[1] = variants_
-            entry_ = _PackageEntry(package, variants_, self.solver)
+            if seed is not None:
+                variants_ = [x for x in variants_ if x.index == seed[1]]
+                if not variants_:
+                    continue
+
+            entry_ = _PackageEntry(package, variants_, solver)
             result.append(entry_)
 
         return result or None
 
+    def _bind(self, solver: Solver) -> None:
+        """Bind packages loaded by a previous solve to the given solver.
+
+        Packages are rewrapped in the solver's context, so that late-bound
+        attributes are evaluated in that context. Variants are expanded again,
+        so that the solver's package load callback is called. Package filter
+        results are kept.
+        """
+        for entry in self.entries:
+            package, value = entry
+            if value is None:
+                continue
+
+            entry[0] = Package(package.resource, context=solver.context)
+            if isinstance(value, list):
+                entry[1] = True
+
+        self.solver = solver
+
     def dump(self) -> None:
         print(self.package_name)
 
@@ -847,6 +972,7 @@ class _PackageVariantSlice(_Common):
             "Unexpected solver error: common family(s) still in slice being "
             "split: slice: %s, family(s): %s" % (self, str(fams)))
 
+    @_profiled("sort_versions")
     def sort_versions(self) -> None:
         """Sort entries by version.
 
@@ -937,10 +1063,79 @@ class _PackageVariantSlice(_Common):
         return s + strextr
 
 
+def _load_family_packages(package_name: str, package_paths: list[str]) -> list[Package]:
+    return list(iter_packages(package_name, paths=package_paths))
+
+
+_prefetch_executor: ThreadPoolExecutor | None = None
+_prefetch_executor_lock = threading.Lock()
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor | None:
+    """Get the thread pool shared by all solvers for loading package families.
+    """
+    global _prefetch_executor
+
+    if config.solver_prefetch_threads < 1:
+        return None
+
+    with _prefetch_executor_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(
+                max_workers=config.solver_prefetch_threads,
+                thread_name_prefix="rez-solver-prefetch"
+            )
+
+    return _prefetch_executor
+
+
+def _reset_prefetch_executor() -> None:
+    # the threads of an executor do not survive a fork
+    global _prefetch_executor, _prefetch_executor_lock
+    _prefetch_executor = None
+    _prefetch_executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_prefetch_executor)
+
+
 class PackageVariantCache(object):
     def __init__(self, solver: Solver) -> None:
         self.solver = solver
         self.variant_lists: dict[str, _PackageVariantList] = {}  # {package-name: _PackageVariantList}
+        self.prefetches: dict[str, Future] = {}  # {package-name: Future}
+
+    def prefetch(self, package_names: Iterable[str]) -> None:
+        """Start loading package families in the background.
+
+        The loaded families are picked up by `get_variant_slice`. The order in
+        which families are loaded has no effect on the solve.
+
+        Args:
+            package_names (list of str): Names of package families that are
+                likely to be needed by the solve.
+        """
+        executor = _get_prefetch_executor()
+        if executor is None:
+            return
+
+        for package_name in package_names:
+            if package_name in self.variant_lists \
+                    or package_name in self.prefetches:
+                continue
+
+            self.prefetches[package_name] = executor.submit(
+                _load_family_packages,
+                package_name,
+                self.solver.package_paths
+            )
+
+    def cancel_prefetches(self) -> None:
+        """Cancel loading of prefetched families that have not yet started."""
+        for future in self.prefetches.values():
+            future.cancel()
+        self.prefetches.clear()
 
     def get_variant_slice(self, package_name: str, range_: VersionRange) -> _PackageVariantSlice | None:
         """Get a list of variants from the cache.
@@ -955,10 +1150,26 @@ class PackageVariantCache(object):
         variant_list = self.variant_lists.get(package_name)
 
         if variant_list is None:
-            variant_list = _PackageVariantList(package_name, self.solver)
+            t = time.time()
+
+            with self.solver.profiled("load_family"):
+                packages = None
+                future = self.prefetches.pop(package_name, None)
+
+                # a cancelled prefetch is just loaded now instead
+                if future is not None and not future.cancelled():
+                    packages = future.result()
+
+                variant_list = _PackageVariantList(package_name, self.solver,
+                                                   packages=packages)
+
             self.variant_lists[package_name] = variant_list
 
-        entries = variant_list.get_intersection(range_)
+            if self.solver.profile_ is not None:
+                self.solver.profile_.add_family_load(
+                    package_name, time.time() - t, len(variant_list.entries))
+
+        entries = variant_list.get_intersection(range_, self.solver)
         if not entries:
             return None
 
@@ -968,6 +1179,52 @@ class PackageVariantCache(object):
         return slice_
 
 
+class PackageVariantCachePool(object):
+    """A set of package variant caches that are shared between solves.
+
+    Loading package families and applying package filters to them make up a
+    large part of the cost of a solve. Solvers given the same pool reuse the
+    variant cache of any previous solve that had the same package paths,
+    package filter and build mode. Only loaded packages and package filter
+    results are reused; packages are bound to each solver's context, and its
+    package load callback is called, as if the packages were just loaded.
+
+    Note that packages released after a cache is populated are not visible to
+    later solves using that cache. A pool is not thread-safe - solves sharing
+    a pool must be run sequentially.
+    """
+    def __init__(self) -> None:
+        self.caches: dict[tuple, PackageVariantCache] = {}
+
+    def get_cache(self, solver: Solver) -> PackageVariantCache:
+        """Get the variant cache to use for the given solver.
+
+        Args:
+            solver (`Solver`): Solver that will use the cache.
+
+        Returns:
+            `PackageVariantCache`: The cache, bound to `solver`.
+        """
+        package_filter = solver.package_filter
+        key = (
+            tuple(solver.package_paths),
+            package_filter.sha1 if package_filter else '',
+            solver.building
+        )
+
+        cache = self.caches.get(key)
+        if cache is None:
+            cache = PackageVariantCache(solver)
+            self.caches[key] = cache
+        else:
+            cache.solver = solver
+
+        return cache
+
+    def clear(self) -> None:
+        self.caches.clear()
+
+
 class _PackageScope(_Common):
     """Contains possible solutions for a package, such as a list of variants,
     or a conflict range. As the resolve progresses, package scopes are narrowed
@@ -999,6 +1256,7 @@ class _PackageScope(_Common):
     def is_conflict(self) -> bool:
         return bool(self.package_request and self.package_request.conflict)
 
+    @_profiled("intersect")
     def intersect(self, range_: VersionRange) -> _PackageScope | None:
         """Intersect this scope with a package range.
 
@@ -1071,6 +1329,7 @@ class _PackageScope(_Common):
         # intersection did not change the scope
         return self
 
+    @_profiled("reduce_by")
     def reduce_by(self, package_request: Requirement) -> tuple[_PackageScope | None, list[Reduction]]:
         """Reduce this scope wrt a package request.
 
@@ -1114,6 +1373,7 @@ class _PackageScope(_Common):
         # there was no reduction
         return (self, [])
 
+    @_profiled("extract")
     def extract(self) -> tuple[_PackageScope, Requirement | None]:
         """Extract a common dependency.
 
@@ -1138,6 +1398,7 @@ class _PackageScope(_Common):
             self.pr("extracted %s from %s", package_request, self)
         return (scope, package_request)
 
+    @_profiled("split")
     def split(self) -> tuple[_PackageScope, _PackageScope] | None:
         """Split the scope.
 
@@ -1380,6 +1641,10 @@ class _ResolvePhase(_Common):
                 if new_extracted_reqs:
                     self.pr.subheader("ADDING:")
 
+                    self.solver.package_cache.prefetch(
+                        x.name for x in new_extracted_reqs
+                        if not x.conflict and not x.name.startswith('.'))
+
                     for req in new_extracted_reqs:
                         try:
                             scope = _PackageScope(req, solver=self.solver)
@@ -1918,7 +2183,10 @@ class Solver(_Common):
                  package_load_callback: Callable[[Package], Any] | None = None,
                  prune_unfailed: bool = True,
                  suppress_passive: bool = False,
-                 print_stats: bool = False) -> None:
+                 print_stats: bool = False,
+                 package_cache_pool: PackageVariantCachePool | None = None,
+                 variant_seeds: dict[str, tuple[Version, int | None]] | None = None,
+                 profile: bool = False) -> None:
         """Create a Solver.
 
         Args:
@@ -1951,6 +2219,16 @@ class Solver(_Common):
                 has had no effect on the solve. This argument only has an
                 effect if `verbosity` > 2.
             print_stats (bool): If true, print advanced solver stats at the end.
+            package_cache_pool (`PackageVariantCachePool`): If provided, package
+                variants are loaded via caches shared with other solves in
+                this pool.
+            variant_seeds (dict): Variants to restrict package families to, as
+                a {name: (version, variant index)} dict. This is used to seed
+                a solve with the result of a previous solve, so that only the
+                families not in this dict are actually solved for.
+            profile (bool): If True, record time spent and call counts per
+                solver operation, and load costs per package family. See
+                `Solver.profile`.
         """
         self.package_paths = package_paths
         self.package_filter = package_filter
@@ -1960,6 +2238,8 @@ class Solver(_Common):
         self.package_load_callback = package_load_callback
         self.building = building
         self.context = context
+        self.variant_seeds = variant_seeds
+        self.profiling = profile
 
         self.pr = _Printer(verbosity, buf=buf, suppress_passive=suppress_passive)
         self.print_stats = print_stats
@@ -1997,9 +2277,14 @@ class Solver(_Common):
         self.reduction_time = [0.0]
         self.reduction_test_time = [0.0]
 
+        self.profile_: _SolverProfile | None = None
+
         self._init()
 
-        self.package_cache = PackageVariantCache(self)
+        if package_cache_pool is None:
+            self.package_cache = PackageVariantCache(self)
+        else:
+            self.package_cache = package_cache_pool.get_cache(self)
 
         # merge the request
         if self.pr:
@@ -2021,6 +2306,11 @@ class Solver(_Common):
             s = ' '.join(map(str, self.request_list.requirements))
             self.pr("merged request: %s", s)
 
+        # start loading requested families in parallel
+        self.package_cache.prefetch(
+            x.name for x in self.request_list
+            if not x.conflict and not x.name.startswith('.'))
+
         # create the initial phase
         phase = _ResolvePhase(solver=self)
         self._push_phase(phase)
@@ -2032,6 +2322,32 @@ class Solver(_Common):
         secs = time.time() - t
         target[0] += secs
 
+    def profiled(self, name: str) -> Any:
+        """Get a context manager that profiles the named operation.
+
+        It does nothing if the solver is not profiling.
+        """
+        if self.profile_ is None:
+            return nullcontext()
+        return self.profile_.timed(name)
+
+    @property
+    def profile(self) -> dict[str, Any] | None:
+        """Get the solve profile.
+
+        Returns:
+            dict: Profile containing:
+            - "operations": {name: {"count": int, "time": float}} for solver
+              operations such as "intersect", "reduce_by", "extract", "split",
+              "load_family", "filter", "sort_versions" and "sort_variants";
+            - "families": {name: {"load_time": float, "num_packages": int}};
+            - "phases": {"pushed": int, "popped": int}.
+            Or None if the solver is not profiling.
+        """
+        if self.profile_ is None:
+            return None
+        return self.profile_.to_dict()
+
     @property
     def status(self) -> SolverStatus:
         """Return the current status of the solve.
@@ -2128,10 +2444,13 @@ class Solver(_Common):
         pt1 = package_repo_stats.package_load_time
 
         # iteratively solve phases
-        while self.status == SolverStatus.unsolved:
-            self.solve_step()
-            if self.status == SolverStatus.unsolved and not self._do_callback():
-                break
+        try:
+            while self.status == SolverStatus.unsolved:
+                self.solve_step()
+                if self.status == SolverStatus.unsolved and not self._do_callback():
+                    break
+        finally:
+            self.package_cache.cancel_prefetches()
 
         self.load_time = package_repo_stats.package_load_time - pt1
         self.solve_time = time.time() - t1
@@ -2355,6 +2674,8 @@ class Solver(_Common):
         self.reduction_time = [0.0]
         self.reduction_test_time = [0.0]
 
+        self.profile_ = _SolverProfile() if self.profiling else None
+
     def _latest_nonfailed_phase(self) -> _ResolvePhase | None:
         if self.status == SolverStatus.failed:
             return None
@@ -2396,6 +2717,9 @@ class Solver(_Common):
         self.depth_counts[depth] = count
         self.phase_stack.append(phase)
 
+        if self.profile_ is not None:
+            self.profile_.phases_pushed += 1
+
         if self.pr:
             dlabel = self._depth_label()
             self.pr("pushed %s: %s", dlabel, phase)
@@ -2405,6 +2729,9 @@ class Solver(_Common):
         phase = self.phase_stack.pop()
         if self.pr:
             self.pr("popped %s: %s", dlabel, phase)
+
+        if self.profile_ is not None:
+            self.profile_.phases_popped += 1
         return phase
 
     def _get_failed_phase(self, index: int | None = None) -> tuple[_ResolvePhase, str]:
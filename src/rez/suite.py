@@ -7,6 +7,7 @@ from __future__ import annotations
 from rez.utils.execution import create_forwarding_script
 from rez.exceptions import SuiteError, ResolvedContextError
 from rez.resolved_context import ResolvedContext
+from rez.config import config
 from rez.utils.data_utils import cached_property
 from rez.utils.filesystem import safe_rmtree
 from rez.utils.formatting import columnise, PackageRequest
@@ -450,14 +451,21 @@ class Suite(object):
             s.next_priority = 1
         return s
 
-    def save(self, path, verbose: bool = False):
+    def save(self, path, verbose: bool = False, shells: list[str] | None = None):
         """Save the suite to disk.
 
         Args:
             path (str): Path to save the suite to. If a suite is already saved
                 at `path`, then it will be overwritten. Otherwise, if `path`
                 exists, an error is raised.
+            verbose (bool): Print progress.
+            shells (list of str): Shells to write prebaked startup scripts for
+                (see `ResolvedContext.save`). Defaults to
+                :data:`suite_prebaked_shells`.
         """
+        if shells is None:
+            shells = config.suite_prebaked_shells
+
         path = os.path.realpath(path)
         if os.path.exists(path):
             if self.load_path and self.load_path == path:
@@ -485,7 +493,7 @@ class Suite(object):
             filepath = self._context_path(context_name, path)
             if verbose:
                 print("writing %r..." % filepath)
-            context.save(filepath)
+            context.save(filepath, shells=shells)
 
         # create alias wrappers
         tools_path = os.path.join(path, "bin")
@@ -513,6 +521,10 @@ class Suite(object):
                                      tool_name=tool_name,
                                      prefix_char=prefix_char)
 
+        # write launch records
+        if config.suite_tool_launch_records:
+            self._create_launch_records(path, tools, verbose=verbose)
+
     @classmethod
     def load(cls, path: str) -> Suite:
         if not os.path.exists(path):
@@ -695,6 +707,23 @@ class Suite(object):
         else:
             _pr("No tools available.")
 
+    def _create_launch_records(self, path: str, tools: dict[str, Tool],
+                               verbose: bool = False) -> None:
+        from rez.utils.launch_record import create_launch_records
+
+        context_tools = defaultdict(list)
+        for d in tools.values():
+            context_name = d["context_name"]
+            prefix_char = self._context(context_name).get("prefix_char")
+            context_tools[context_name].append(
+                dict(d, prefix_char=prefix_char))
+
+        for context_name, tools_ in context_tools.items():
+            if verbose:
+                print("creating launch records for %r context..." % context_name)
+            context = self.context(context_name)
+            create_launch_records(path, context_name, context, tools_)
+
     def _context(self, name: str) -> Context:
         data = self.contexts.get(name)
         if not data:
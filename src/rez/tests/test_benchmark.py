@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the Rez Project
+
+
+"""
+unit tests for 'rez.benchmark' module
+"""
+import os.path
+import unittest
+
+from rez.benchmark import BenchmarkEnv, make_synthetic_repository, \
+    run_benchmarks, compare_results
+from rez.exceptions import RezError
+from rez.packages import iter_package_families
+from rez.tests.util import TestBase, TempdirMixin
+
+
+class TestBenchmark(TestBase, TempdirMixin):
+    @classmethod
+    def setUpClass(cls):
+        TempdirMixin.setUpClass()
+        cls.settings = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        TempdirMixin.tearDownClass()
+
+    def test_synthetic_repository(self):
+        """Test creation of a synthetic package repository."""
+        path = os.path.join(self.root, "synthetic")
+        names = make_synthetic_repository(path, num_families=10, num_versions=3)
+        self.assertEqual(names, ["pkg%d" % i for i in range(10)])
+
+        families = sorted(x.name for x in iter_package_families(paths=[path]))
+        self.assertEqual(families, sorted(names))
+
+        # the generated repository is solvable
+        env = BenchmarkEnv(os.path.join(self.root, "env"), num_families=10,
+                           num_versions=3)
+        self.assertEqual(env.families, names)
+        for request in env.requests:
+            self.assertTrue(env.resolve(request).success)
+
+    def test_run_benchmarks(self):
+        """Test running benchmark groups."""
+        env = BenchmarkEnv(os.path.join(self.root, "run"), num_families=10)
+        results = run_benchmarks(env, groups=["version", "context_io"], repeat=2)
+
+        self.assertEqual(sorted(results), ["context_io", "version"])
+        self.assertEqual(sorted(results["version"]["cases"]),
+                         ["compare", "parse", "sort"])
+        self.assertGreater(results["version"]["peak_memory"], 0)
+
+        case = results["version"]["cases"]["parse"]
+        self.assertLessEqual(case["min"], case["mean"])
+
+        with self.assertRaises(RezError):
+            run_benchmarks(env, groups=["nonexistent"])
+
+    def test_compare_results(self):
+        """Test detection of regressions."""
+        base = {
+            "version": {
+                "cases": {"parse": {"min": 1.0, "mean": 1.0},
+                          "sort": {"min": 1.0, "mean": 1.0}},
+                "peak_memory": 1000
+            }
+        }
+        new = {
+            "version": {
+                "cases": {"parse": {"min": 1.05, "mean": 2.0},
+                          "sort": {"min": 1.5, "mean": 1.5}},
+                "peak_memory": 2000
+            },
+            "resolve": {"cases": {}}
+        }
+
+        regressions = compare_results(base, new, max_regression=10.0)
+        self.assertEqual([(x["case"], x["metric"]) for x in regressions],
+                         [("sort", "time")])
+        self.assertAlmostEqual(regressions[0]["change"], 50.0)
+
+        regressions = compare_results(base, new, max_regression=100.0,
+                                      max_memory_regression=50.0)
+        self.assertEqual([(x["case"], x["metric"]) for x in regressions],
+                         [(None, "peak_memory")])
+
+
+if __name__ == '__main__':
+    unittest.main()
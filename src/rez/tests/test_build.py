@@ -18,6 +18,7 @@ from rez.utils.platform_ import platform_
 from rez.shells import create_shell
 from rez.packages import get_developer_package
 from rez.rex import RexExecutor
+from rez.utils.logging_ import print_warning
 import shutil
 import os.path
 
@@ -249,6 +250,94 @@ class TestBuild(TestBase, TempdirMixin):
         self.assertIn("5", error_msg)
         self.assertLess(error_msg.index("-3"), error_msg.index("5"))
 
+    @per_available_shell()
+    @install_dependent()
+    def test_build_parallel_variants(self, shell) -> None:
+        """Test building variants in parallel."""
+        config.override("default_shell", shell)
+        self.inject_python_repo()
+
+        self._test_build_build_util()
+        self._test_build_floob()
+        self._test_build_foo()
+
+        # bah has 2 variants: [foo-1.0] and [foo-1.1]
+        working_dir = os.path.join(self.src_root, "bah", "2.1")
+        builder = self._create_builder(working_dir)
+
+        num_built = builder.build(install_path=self.install_root, install=True,
+                                  clean=True, jobs=2)
+        self.assertEqual(num_built, 2)
+
+        self._create_context("bah==2.1", "foo==1.0.0")
+        self._create_context("bah==2.1", "foo==1.1.0")
+
+    def test_visit_variants_parallel(self) -> None:
+        """Test that variants visited in parallel have their output captured."""
+        import sys
+
+        working_dir = os.path.join(self.src_root, "bah", "2.1")
+        builder = self._create_builder(working_dir)
+        stdout = sys.stdout
+
+        def _visit(variant):
+            print("visiting variant %d" % variant.index)
+            print_warning("warning from variant %d", variant.index)
+            return variant.index
+
+        num_visited, results = builder.visit_variants(_visit, jobs=2)
+        self.assertEqual(num_visited, 2)
+        self.assertEqual(results, [0, 1])
+
+        for variant in builder.package.iter_variants():
+            log_filepath = builder.get_variant_log_filepath(variant)
+            with open(log_filepath) as f:
+                lines = f.read().splitlines()
+
+            self.assertEqual(lines[0], "visiting variant %d" % variant.index)
+            self.assertIn("warning from variant %d" % variant.index, lines[1])
+
+        # the first error (in variant order) is raised
+        def _fail(variant):
+            raise BuildError("variant %d failed" % variant.index)
+
+        with self.assertRaises(BuildError) as exc:
+            builder.visit_variants(_fail, jobs=2)
+        self.assertEqual(str(exc.exception), "variant 0 failed")
+
+        # original streams are restored
+        self.assertIs(sys.stdout, stdout)
+
+    def test_make_path_writable_shared(self) -> None:
+        """Test that variants built in parallel share a writable install path."""
+        from contextlib import contextmanager
+        from unittest.mock import patch
+        import rezplugins.build_process.local as local_bp
+
+        working_dir = os.path.join(self.src_root, "bah", "2.1")
+        builder = self._create_builder(working_dir)
+        events = []
+
+        @contextmanager
+        def _make_path_writable(path):
+            events.append("writable")
+            yield
+            events.append("restored")
+
+        with patch.object(local_bp, "make_path_writable", _make_path_writable):
+            ctxt1 = builder._make_path_writable(self.root)
+            ctxt2 = builder._make_path_writable(self.root)
+
+            ctxt1.__enter__()
+            ctxt2.__enter__()
+            ctxt1.__exit__(None, None, None)
+
+            # the mode is not restored while the second variant is using it
+            self.assertEqual(events, ["writable"])
+
+            ctxt2.__exit__(None, None, None)
+            self.assertEqual(events, ["writable", "restored"])
+
     def test_set_standard_vars_escaping(self) -> None:
         """Test that set_standard_vars properly escapes environment variables."""
         # Create a test package directory with special characters in description
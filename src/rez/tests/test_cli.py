@@ -6,6 +6,7 @@
 test running of all commandline tools (just -h on each)
 """
 from rez.tests.util import TestBase
+import rez
 import argparse
 import contextlib
 import io
@@ -62,6 +63,53 @@ class TestImports(TestBase):
             subprocess.check_output([binfile, "-h"])
 
 
+class TestImportTime(TestBase):
+    """Test that CLI startup doesn't import more than it needs to."""
+
+    # modules that are slow to import, and not needed at CLI startup
+    deferred_modules = (
+        "rez.config", "rez.plugin_managers", "rez.shells", "rez.system",
+        "rez.resolved_context", "rez.packages", "rez.vendor.yaml",
+        "importlib.metadata"
+    )
+
+    def _get_imported_modules(self, code):
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.path.dirname(os.path.dirname(rez.__file__))
+
+        proc = subprocess.run(
+            [sys.executable, "-c", code + "\nprint(' '.join(sys.modules))\n"],
+            env=env,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            check=True
+        )
+        return proc.stdout.split()
+
+    def test_entry_point_imports(self) -> None:
+        """Test that importing the CLI entry point doesn't import the config."""
+        modules = self._get_imported_modules(
+            "import sys\n"
+            "import rez.cli._main\n"
+        )
+
+        for name in self.deferred_modules:
+            self.assertNotIn(name, modules)
+
+    def test_lazy_imports(self) -> None:
+        """Test that modules are not imported when setting up a parser."""
+        modules = self._get_imported_modules(
+            "import argparse, sys\n"
+            "from rez.cli import env\n"
+            "env.setup_parser(argparse.ArgumentParser(), completions=True)\n"
+        )
+
+        # note that the config is needed for parser defaults
+        for name in self.deferred_modules:
+            if name != "rez.config":
+                self.assertNotIn(name, modules)
+
+
 class TestComplete(TestBase):
     """Test argcomplete-driven completion against the actual rez parser.
 
@@ -8,7 +8,8 @@ test configuration settings
 import unittest
 from rez.tests.util import TestBase, TempdirMixin, restore_os_environ
 from rez.exceptions import ConfigurationError
-from rez.config import Config, get_module_root_config, _replace_config, _Deprecation
+from rez.config import Config, get_module_root_config, _replace_config, _Deprecation, \
+    _load_config_py
 from rez.system import system
 from rez.utils.data_utils import RO_AttrDictWrapper
 from rez.packages import get_developer_package
@@ -18,6 +19,7 @@ import os.path
 import subprocess
 import functools
 import shutil
+import tempfile
 import unittest.mock
 
 
@@ -296,6 +298,94 @@ class TestConfig(TestBase):
                 print(error.stdout)
                 raise
 
+    def test_9(self) -> None:
+        """Test compiled config snapshots."""
+        tmpdir = tempfile.mkdtemp(prefix="rez_selftest_")
+        self.addCleanup(shutil.rmtree, tmpdir)
+
+        conf = os.path.join(tmpdir, "rezconfig.py")
+        with open(conf, 'w') as f:
+            f.write('build_directory = "snap_build"\n')
+
+        with restore_os_environ():
+            os.environ["REZ_CONFIG_SNAPSHOT_PATH"] = os.path.join(tmpdir, "snapshots")
+            os.environ.pop("REZ_BUILD_DIRECTORY", None)
+
+            # first load creates the snapshot
+            c = Config([self.root_config_file, conf])
+            self.assertEqual(c.build_directory, "snap_build")
+            self.assertTrue(os.listdir(os.environ["REZ_CONFIG_SNAPSHOT_PATH"]))
+
+            # second load uses it
+            c = Config([self.root_config_file, conf])
+            self.assertEqual(c._snapshot["values"]["build_directory"], "snap_build")
+            self.assertEqual(c.build_directory, "snap_build")
+            self.assertEqual(c.sourced_filepaths, [self.root_config_file, conf])
+            self._test_basic(c)
+            self._test_overrides(c)
+
+            # env-var overrides invalidate the snapshot
+            os.environ["REZ_BUILD_DIRECTORY"] = "env_build"
+            c = Config([self.root_config_file, conf])
+            self.assertEqual(c.build_directory, "env_build")
+            del os.environ["REZ_BUILD_DIRECTORY"]
+
+            # so do config file changes
+            with open(conf, 'w') as f:
+                f.write('build_directory = "snap_build_2"\n')
+            st = os.stat(conf)
+            os.utime(conf, (st.st_atime, st.st_mtime + 10))
+            _load_config_py.cache_clear()
+
+            c = Config([self.root_config_file, conf])
+            self.assertEqual(c.build_directory, "snap_build_2")
+
+    def test_snapshot_unmarshallable(self) -> None:
+        """Test config snapshots of settings that can't be marshalled."""
+        tmpdir = tempfile.mkdtemp(prefix="rez_selftest_")
+        self.addCleanup(shutil.rmtree, tmpdir)
+
+        conf = os.path.join(tmpdir, "rezconfig.py")
+        with open(conf, 'w') as f:
+            f.write(
+                'build_directory = "snap_build"\n'
+                '\n'
+                'def package_preprocess_function(this, data):\n'
+                '    data["foo"] = "bah"\n'
+            )
+
+        snapshot_path = os.path.join(tmpdir, "snapshots")
+
+        with restore_os_environ():
+            os.environ["REZ_CONFIG_SNAPSHOT_PATH"] = snapshot_path
+            os.environ.pop("REZ_BUILD_DIRECTORY", None)
+
+            # the snapshot is saved, without the function
+            c = Config([self.root_config_file, conf])
+            self.assertEqual(c.build_directory, "snap_build")
+            self.assertTrue(os.listdir(snapshot_path))
+
+            # the function is loaded from the config file instead
+            c = Config([self.root_config_file, conf])
+            self.assertEqual(c._snapshot["reload_keys"], ["package_preprocess_function"])
+            self.assertNotIn("package_preprocess_function", c._snapshot["data"])
+            self.assertEqual(c._snapshot["values"]["build_directory"], "snap_build")
+            self.assertEqual(c.build_directory, "snap_build")
+
+            data = {}
+            c.package_preprocess_function(None, data)
+            self.assertEqual(data, {"foo": "bah"})
+
+    def test_profile(self) -> None:
+        """Test profiling of settings evaluation."""
+        c = Config([self.root_config_file])
+        times = c._profile()
+        keys = [x[0] for x in times]
+
+        self.assertIn("(load)", keys)
+        self.assertIn("build_directory", keys)
+        self.assertEqual(times, sorted(times, key=lambda x: x[1], reverse=True))
+
 
 class TestDeprecations(TestBase, TempdirMixin):
     @classmethod
@@ -307,6 +307,178 @@ class TestContext(TestBase, TempdirMixin):
             # check types here, as not all type instances are comparable
             self.assertIs(type(v), type(r2.__dict__.get(k)))
 
+    def test_resolve_batch(self) -> None:
+        """Test resolving a batch of requests with shared caches."""
+        from rez.resolve_batch import resolve_batch
+        from rez.resolver import ResolverStatus
+
+        packages_path = self.data_path("solver", "packages")
+        requests = [
+            ["python"],
+            ["pyfoo", "python-2.6"],
+            ["pyvariants", "python"],
+            ["pyfoo-3.0", "pybah-4"],  # conflicting
+            ["python<2.7", "nada"]
+        ]
+
+        def _resolved(contexts):
+            return [
+                [x.qualified_name for x in (r.resolved_packages or [])]
+                for r in contexts
+            ]
+
+        expected = [
+            ResolvedContext(x, package_paths=[packages_path])
+            for x in requests
+        ]
+        self.assertEqual(expected[3].status, ResolverStatus.failed)
+
+        contexts = resolve_batch(requests, package_paths=[packages_path])
+        self.assertEqual(_resolved(contexts), _resolved(expected))
+        self.assertEqual([r.status for r in contexts],
+                         [r.status for r in expected])
+
+        if platform_.name != "windows":
+            contexts = resolve_batch(requests, processes=2,
+                                     package_paths=[packages_path])
+            self.assertEqual(_resolved(contexts), _resolved(expected))
+
+    def test_seed_context(self) -> None:
+        """Test resolving incrementally from a previous context."""
+        from unittest.mock import patch
+
+        kwargs = dict(package_paths=[self.data_path("solver", "packages")])
+
+        def _resolved(r):
+            return [x.qualified_name for x in r.resolved_packages]
+
+        seed = ResolvedContext(["pyvariants", "python-2.6"], **kwargs)
+        self.assertEqual(_resolved(seed), ["python-2.6.8[]", "pyvariants-2[2]"])
+
+        # unchanged packages keep their variant, where a full solve would
+        # choose a different one
+        request = ["pyvariants", "python-2.6", "nada"]
+        r = ResolvedContext(request, seed_context=seed, **kwargs)
+        self.assertEqual(_resolved(r),
+                         ["python-2.6.8[]", "pyvariants-2[2]", "nada[]"])
+        self.assertLess(r.num_loaded_packages,
+                        ResolvedContext(request, **kwargs).num_loaded_packages)
+
+        # packages released since the seed context are reopened
+        with patch("rez.resolved_context.get_last_release_time",
+                   return_value=seed.timestamp + 1):
+            r = ResolvedContext(request, seed_context=seed, **kwargs)
+        self.assertEqual(_resolved(r),
+                         ["python-2.6.8[]", "nada[]", "pyvariants-2[1]"])
+
+        # fall back to a full solve on conflict
+        seed = ResolvedContext(["python<2.7"], **kwargs)
+        r = ResolvedContext(["python<2.7", "pyfoo-3.0"], seed_context=seed,
+                            **kwargs)
+        self.assertEqual(_resolved(r), ["python-2.5.2[]", "pyfoo-3.0.0[]"])
+
+    def test_solve_profile(self) -> None:
+        """Test profiling of the solve."""
+        kwargs = dict(package_paths=[self.data_path("solver", "packages")],
+                      caching=False)
+
+        r = ResolvedContext(["pyvariants", "python"], **kwargs)
+        self.assertIsNone(r.solve_profile)
+
+        r = ResolvedContext(["pyvariants", "python"], profile_solve=True,
+                            **kwargs)
+        profile = r.solve_profile
+        self.assertEqual(profile["operations"]["load_family"]["count"], 2)
+        self.assertIn("intersect", profile["operations"])
+        self.assertEqual(set(profile["families"]), set(["pyvariants", "python"]))
+        self.assertGreater(profile["phases"]["pushed"], 0)
+
+        # profile is stored in the context
+        r2 = ResolvedContext.from_dict(r.to_dict())
+        self.assertEqual(r2.solve_profile, profile)
+
+    def test_cache_rex_actions(self) -> None:
+        """Test replay of cached package commands actions."""
+        from unittest.mock import patch
+        from rez.rex import RexExecutor
+
+        packages_path = os.path.join(self.root, "rex_cache_packages")
+        os.makedirs(os.path.join(packages_path, "foo", "1.0"))
+        with open(os.path.join(packages_path, "foo", "1.0", "package.py"), 'w') as f:
+            f.write(
+                "name = 'foo'\n"
+                "version = '1.0'\n"
+                "def commands():\n"
+                "    env.PATH.append('{root}/bin')\n"
+                "    if defined('FOO_MODE'):\n"
+                "        env.FOO_MODE_SET = getenv('FOO_MODE')\n"
+            )
+
+        self.update_settings({
+            "cache_backend": "local",
+            "local_cache_path": os.path.join(self.root, "rex_cache"),
+            "cache_rex_actions": True
+        })
+
+        r = ResolvedContext(["foo"], package_paths=[packages_path])
+        environ = r.get_environ(parent_environ={})
+        self.assertNotIn("FOO_MODE_SET", environ)
+
+        with patch.object(RexExecutor, "execute_code") as execute_code:
+            self.assertEqual(r.get_environ(parent_environ={}), environ)
+
+            # loaded contexts share the entry
+            r2 = ResolvedContext.from_dict(r.to_dict())
+            self.assertEqual(r2.get_environ(parent_environ={}), environ)
+
+            # unrelated parent variables don't invalidate the entry
+            environ2 = r.get_environ(parent_environ={"OTHER": "1"})
+            self.assertEqual(environ2["PATH"], environ["PATH"])
+            execute_code.assert_not_called()
+
+        # commands are run again if a parent variable they read changes
+        environ = r.get_environ(parent_environ={"FOO_MODE": "fast"})
+        self.assertEqual(environ["FOO_MODE_SET"], "fast")
+
+    def test_prebaked_shell(self) -> None:
+        """Test shells sourcing prebaked startup scripts."""
+        from unittest.mock import patch
+        from rez.shells import create_shell
+
+        if platform_.name == "windows":
+            self.skipTest("This test does not run on Windows due to problems"
+                          " with the automated binding of the 'hello_world'"
+                          " executable.")
+
+        sh = create_shell()
+        path = os.path.join(self.root, "prebaked", "context.rxt")
+        os.makedirs(os.path.dirname(path))
+
+        r = ResolvedContext(["hello_world"])
+        r.save(path, shells=[sh.name()])
+
+        r2 = ResolvedContext.load(path)
+        script = r2._get_prebaked_script(sh, None)
+        self.assertTrue(script and os.path.isfile(script))
+
+        with patch.object(ResolvedContext, "_execute") as execute:
+            retcode, stdout, _ = r2.execute_shell(
+                command="hello_world; echo $REZ_CONTEXT_FILE",
+                stdout=subprocess.PIPE, text=True, block=True)
+            execute.assert_not_called()
+
+        self.assertEqual(retcode, 0)
+        self.assertEqual(stdout.split(), ["Hello", "Rez", "World!", script])
+
+        # the script is not used if a package cache root it refers to is gone
+        with patch.object(ResolvedContext, "_get_cached_roots",
+                          return_value={"hello_world": "/cache/hello_world"}):
+            self.assertIsNone(r2._get_prebaked_script(sh, None))
+
+        # the script is not used if its inputs change
+        self.update_settings({"rez_tools_visibility": "never"})
+        self.assertIsNone(r2._get_prebaked_script(sh, None))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,7 +15,7 @@ from rez.build_process import create_build_process
 from rez.build_system import create_build_system
 from rez.resolved_context import ResolvedContext
 from rez.packages import get_latest_package
-from rez.package_copy import copy_package
+from rez.package_copy import copy_package, copy_packages
 from rez.exceptions import PackageCopyError
 from rez.version import VersionRange
 from rez.tests.util import TestBase, TempdirMixin
@@ -406,3 +406,42 @@ class TestCopyPackage(TestBase, TempdirMixin):
 
         # The single null-variant should have been copied without error
         self._assert_copied(result, 1, 0)
+
+    def test_11(self) -> None:
+        """Bulk package copy, with journal."""
+        self._reset_dest_repository()
+
+        journal_filepath = os.path.join(self.root, "copy_journal.json")
+        if os.path.exists(journal_filepath):
+            os.remove(journal_filepath)
+
+        src_pkgs = [
+            self._get_src_pkg("floob", "1.2.0"),
+            self._get_src_pkg("bah", "2.1")
+        ]
+        num_variants = sum(len(list(x.iter_variants())) for x in src_pkgs)
+
+        result = copy_packages(
+            packages=src_pkgs,
+            dest_repository=self.dest_install_root,
+            jobs=2,
+            journal_filepath=journal_filepath
+        )
+
+        self._assert_copied(result, num_variants, 0)
+        self.assertEqual(result["failed"], [])
+        self.assertGreater(result["size"], 0)
+
+        # check all packages were copied
+        self._get_dest_pkg("floob", "1.2.0")
+        self._get_dest_pkg("bah", "2.1")
+
+        # rerun, all variants should be skipped due to the journal
+        result = copy_packages(
+            packages=src_pkgs,
+            dest_repository=self.dest_install_root,
+            journal_filepath=journal_filepath
+        )
+
+        self._assert_copied(result, 0, 0)
+        self.assertEqual(len(result["journaled"]), num_variants)
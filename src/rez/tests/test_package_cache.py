@@ -5,6 +5,7 @@
 """
 Test package caching.
 """
+import json
 import logging
 import os
 import os.path
@@ -90,6 +91,182 @@ class TestPackageCache(TestBase, TempdirMixin):
         result = pkgcache.remove_variant(variant)
         self.assertEqual(result, PackageCache.VARIANT_NOT_FOUND)
 
+    def test_cache_index(self) -> None:
+        """Test that the cache index tracks added and removed variants."""
+        cache_path = os.path.join(self.root, "package_cache_index")
+        os.mkdir(cache_path)
+        pkgcache = PackageCache(cache_path)
+
+        package = get_package("versioned", "3.0")
+        variant = next(package.iter_variants())
+
+        rootpath, _ = pkgcache.add_variant(variant)
+        index_filepath = os.path.join(cache_path, ".sys", "index.db")
+        self.assertTrue(os.path.exists(index_filepath))
+
+        payload_size = sum(
+            os.path.getsize(os.path.join(dirpath, name))
+            for dirpath, _, names in os.walk(rootpath)
+            for name in names
+        )
+        self.assertEqual(pkgcache.get_cached_size(), payload_size)
+
+        # the source payload size is now known, so should not need a walk
+        with patch.object(pkgcache, "_get_payload_size") as mock_size:
+            size = pkgcache.get_variant_size(VIRTUAL_GIGABYTE, variant.root)
+            self.assertEqual(size, payload_size)
+            mock_size.assert_not_called()
+
+        entries = pkgcache.get_variants()
+        self.assertEqual(entries, [(variant, rootpath, PackageCache.VARIANT_FOUND)])
+
+        # a missing index is rebuilt from the cache contents
+        os.remove(index_filepath)
+        pkgcache = PackageCache(cache_path)
+        self.assertEqual(pkgcache.get_variants(), entries)
+        self.assertEqual(pkgcache.get_cached_size(), payload_size)
+
+        pkgcache.remove_variant(variant)
+        self.assertEqual(pkgcache.get_variants(), [])
+        self.assertEqual(pkgcache.get_cached_size(), 0)
+
+    def test_evict(self) -> None:
+        """Test eviction of least recently used variants."""
+        cache_path = os.path.join(self.root, "package_cache_evict")
+        os.mkdir(cache_path)
+        pkgcache = PackageCache(cache_path)
+
+        variant1 = next(get_package("timestamped", "1.2.0").iter_variants())
+        variant2 = next(get_package("versioned", "3.0").iter_variants())
+        pkgcache.add_variant(variant1)
+        pkgcache.add_variant(variant2)
+
+        # nothing is evicted with the default policy
+        self.assertEqual(pkgcache.evict(required_space=VIRTUAL_GIGABYTE), 0)
+
+        self.update_settings({
+            "package_cache_eviction_policy": "lru",
+            "package_cache_eviction_low_watermark": 70,
+            "package_cache_eviction_min_idle": 0,
+            "package_cache_space_buffer": 0
+        })
+
+        # use variant1, so that variant2 is least recently used
+        time.sleep(0.01)
+        self.assertNotEqual(pkgcache.get_cached_root(variant1), None)
+
+        # disk usage is 1 byte over the low watermark, until variant2 is evicted
+        with patch("rez.package_cache.shutil.disk_usage") as mock_du:
+            mock_du.side_effect = [(1000, 701, 299), (1000, 600, 400)]
+            self.assertEqual(pkgcache.evict(), 101)
+
+        self.assertNotEqual(pkgcache.get_cached_root(variant1), None)
+        self.assertEqual(pkgcache.get_cached_root(variant2), None)
+        self.assertEqual(os.listdir(os.path.join(cache_path, ".sys", "to_delete")), [])
+
+        # evicting variant1 frees no disk space (as if its contents were still
+        # shared with another cached variant), so variant2 is evicted as well
+        pkgcache.add_variant(variant2)
+        time.sleep(0.01)
+
+        with patch("rez.package_cache.shutil.disk_usage") as mock_du:
+            mock_du.side_effect = [(1000, 701, 299), (1000, 701, 299), (1000, 600, 400)]
+            self.assertEqual(pkgcache.evict(), 101)
+
+        self.assertEqual(pkgcache.get_cached_root(variant1), None)
+        self.assertEqual(pkgcache.get_cached_root(variant2), None)
+
+    def test_pending_queue(self) -> None:
+        """Test that pending variants are prioritised by demand."""
+        cache_path = os.path.join(self.root, "package_cache_queue")
+        os.mkdir(cache_path)
+        pkgcache = PackageCache(cache_path)
+        index = pkgcache._get_index()
+
+        variant1 = next(get_package("timestamped", "1.2.0").iter_variants())
+        variant2 = next(get_package("versioned", "3.0").iter_variants())
+
+        for i, variant in enumerate((variant1, variant2)):
+            filepath = os.path.join(pkgcache._pending_dir, "%d.json" % i)
+            with open(filepath, 'w') as f:
+                f.write(json.dumps(variant.handle.to_dict()))
+            os.utime(filepath, (i, i))
+
+        # without requests, variants are queued first come first served
+        queue = pkgcache.get_pending_queue()
+        self.assertEqual([x[0] for x in queue], [variant1, variant2])
+        self.assertEqual(queue[0][1:], (1, None, None))
+
+        index.add_requests([variant2.handle.to_dict()] * 2)
+        index.add_copy(1024, 1.0)
+        index.set_payload_size(variant2.root, os.stat(variant2.root).st_mtime, 2048)
+
+        queue = pkgcache.get_pending_queue()
+        self.assertEqual([x[0] for x in queue], [variant2, variant1])
+        self.assertEqual(queue[0][1:], (2, 2048, 2.0))
+
+        # variant1 is assumed to be of average size
+        self.assertEqual(queue[1][1:], (1, None, 4.0))
+
+        # the daemon only loads pending variants it has not loaded before
+        entries = {}
+        queue = pkgcache._get_pending_queue(entries=entries)
+        self.assertEqual([x[1] for x in queue], [variant2, variant1])
+        self.assertEqual(set(entries), set(["0.json", "1.json"]))
+
+        with patch("rez.package_cache.get_variant") as mock_get_variant:
+            # request counts are still up to date
+            index.add_requests([variant1.handle.to_dict()] * 4)
+            queue = pkgcache._get_pending_queue(entries=entries)
+            self.assertEqual([x[1] for x in queue], [variant1, variant2])
+
+            # removed pending variants are dropped
+            os.remove(os.path.join(pkgcache._pending_dir, "0.json"))
+            queue = pkgcache._get_pending_queue(entries=entries)
+            self.assertEqual([x[1] for x in queue], [variant2])
+            self.assertEqual(set(entries), set(["1.json"]))
+
+            mock_get_variant.assert_not_called()
+
+    def test_cache_dedup(self) -> None:
+        """Test deduplication of cached file contents."""
+        cache_path = os.path.join(self.root, "package_cache_dedup")
+        os.mkdir(cache_path)
+        pkgcache = PackageCache(cache_path)
+        self.update_settings({"package_cache_dedup": True})
+
+        # identical files share their contents
+        src = tempfile.mkdtemp(dir=self.root)
+        filepaths = []
+        for name in ("a", "b"):
+            filepath = os.path.join(src, name)
+            with open(filepath, 'w') as f:
+                f.write("identical")
+            filepaths.append(filepath + "_copy")
+            pkgcache._copy_file_dedup(filepath, filepaths[-1])
+
+        st_a, st_b = (os.stat(x) for x in filepaths)
+        self.assertEqual(st_a.st_ino, st_b.st_ino)
+        self.assertEqual(st_a.st_nlink, 3)
+
+        for filepath in filepaths:
+            os.remove(filepath)
+
+        # cached payloads are deduplicated, and unused contents are cleaned
+        package = get_package("versioned", "3.0")
+        variant = next(package.iter_variants())
+
+        rootpath, _ = pkgcache.add_variant(variant)
+        for dirpath, _, names in os.walk(rootpath):
+            for name in names:
+                self.assertEqual(os.stat(os.path.join(dirpath, name)).st_nlink, 2)
+
+        pkgcache.remove_variant(variant)
+        pkgcache.clean()
+
+        blobs = [names for _, _, names in os.walk(pkgcache._blobs_dir) if names]
+        self.assertEqual(blobs, [])
+
     def test_cache_fail_uncachable_variant(self) -> None:
         """Test that caching of an uncachable variant fails."""
         pkgcache = self._pkgcache()
@@ -245,6 +422,28 @@ class TestPackageCache(TestBase, TempdirMixin):
                 % (ref, cached_root, root)
             )
 
+    def test_prebaked_shell_cached_roots(self) -> None:
+        """Test that prebaked shells are not used once cached roots are gone."""
+        from rez.shells import create_shell
+
+        pkgcache = self._pkgcache()
+        sh = create_shell()
+
+        c = ResolvedContext(["timestamped-1.2.0"], package_caching=True)
+        variant = c.get_resolved_package("timestamped")
+        pkgcache.add_variant(variant)
+
+        path = os.path.join(self.root, "prebaked_cached", "context.rxt")
+        os.makedirs(os.path.dirname(path))
+        c.save(path, shells=[sh.name()])
+
+        c2 = ResolvedContext.load(path)
+        self.assertIsNotNone(c2._get_prebaked_script(sh, None))
+
+        # the script refers to the cached root, so can't be used once it's gone
+        pkgcache.remove_variant(variant)
+        self.assertIsNone(c2._get_prebaked_script(sh, None))
+
     @patch('rez.package_cache.shutil.disk_usage')
     def test_cache_near_full_true(self, mock_du):
         """cache_near_full returns True when free < buffer."""
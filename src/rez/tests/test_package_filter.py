@@ -209,3 +209,56 @@ class TestPackageFilter(TestBase):
             "pymum",
             ["1", "2", "3"]
         )
+
+    def test_compiled_rules(self) -> None:
+        """Test that combined rules match the same as separate rules
+        """
+        # several rules of each type are combined; the backreference is not
+        fltr = PackageFilter.from_pod({
+            "excludes": [
+                "glob(timestamped-1.0.*)",
+                "glob(timestamped-*.9)",
+                "regex(timestamped-2\\.1\\.5)",
+                "range(timestamped-1.1.1)",
+                "range(timestamped-3+)",
+                "range(!timestamped-1+)"
+            ]
+        })
+        fltr.add_exclusion(RegexRule(r"timestamped-(\d)\.\1\.0"))
+
+        matching_versions = set()
+        for pkg in iter_packages("timestamped"):
+            rule = fltr.excludes(pkg)
+            if not rule:
+                matching_versions.add(str(pkg.version))
+
+            # the first matching rule is still returned
+            expected = None
+            for rule_ in fltr._excludes["timestamped"]:
+                if rule_.match(pkg):
+                    expected = rule_
+                    break
+            self.assertIs(rule, expected)
+
+        self.assertEqual(matching_versions, set(["1.2.0", "2.0.0", "2.1.0"]))
+
+    def test_filter_list_results(self) -> None:
+        """Test that filter list results are cached and shared
+        """
+        fltrs = [{"excludes": ["*.0"]}]
+        fltr = PackageFilterList.from_pod(fltrs)
+        fltr2 = PackageFilterList.from_pod(fltrs)
+
+        pkgs = list(iter_packages("timestamped"))
+        excluded = [str(x.version) for x in pkgs if fltr.excludes(x)]
+        self.assertEqual(sorted(excluded), ["1.1.0", "1.2.0", "2.0.0", "2.1.0"])
+
+        self.assertIs(fltr._results, fltr2._results)
+        self.assertEqual(len(fltr._results), len(pkgs))
+
+        # adding a rule changes the results
+        fltr2.add_exclusion(RangeRule(Requirement("timestamped-1.0.5")))
+        self.assertIsNot(fltr._results, fltr2._results)
+
+        excluded = [str(x.version) for x in pkgs if fltr2.excludes(x)]
+        self.assertEqual(sorted(excluded), ["1.0.5", "1.1.0", "1.2.0", "2.0.0", "2.1.0"])
@@ -5,10 +5,15 @@
 """
 Test package repository plugin.
 """
+import os
+import time
 import unittest
+from unittest.mock import patch
 
 from rezplugins.package_repository import filesystem
 from rez.packages import create_package
+from rez.package_repository import package_repository_manager
+from rez.resolved_context import ResolvedContext
 from rez.tests.util import TestBase, TempdirMixin
 from rez.utils.platform_ import platform_
 from rez.version import Version
@@ -42,6 +47,181 @@ class TestFilesystemPackageRepository(TestBase, TempdirMixin):
             pkg_repository._create_variant(case_mismatch_variant, overrides={})
 
 
+class TestFilesystemPackageRepositoryIndex(TestBase, TempdirMixin):
+    @classmethod
+    def setUpClass(cls):
+        TempdirMixin.setUpClass()
+
+        cls.settings = {
+            "plugins": {
+                "package_repository": {
+                    "filesystem": {"use_metadata_index": True}
+                }
+            }
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        TempdirMixin.tearDownClass()
+
+    def _make_repo(self, path):
+        pool = filesystem.ResourcePool(cache_size=None)
+        return filesystem.FileSystemPackageRepository(path, pool)
+
+    def _install(self, repo, name, version_str, **data):
+        data["version"] = version_str
+        package = create_package(name, data=data)
+        variant = next(package.iter_variants())
+        return repo.install_variant(variant.resource)
+
+    def test_index_updated_on_install(self):
+        """Test that installs, ignores and removals keep the index valid."""
+        path = os.path.join(self.root, "install")
+        repo = self._make_repo(path)
+        self._install(repo, "foo", "1.0", requires=["bah"])
+        self._install(repo, "foo", "1.1")
+        self._install(repo, "bah", "2.0")
+
+        index = filesystem._PackageMetadataIndex.load(repo._index_filepath, False)
+        self.assertIsNotNone(index)
+        self.assertEqual(sorted(index.entries), ["bah", "foo"])
+        self.assertEqual(sorted(index.entries["foo"]["versions"]), ["1.0", "1.1"])
+
+        # a fresh repo reads everything from the index
+        repo2 = self._make_repo(path)
+        with patch.object(repo2, "_list_family_dirs") as list_fams, \
+                patch.object(repo2, "_list_version_dirs") as list_vers, \
+                patch.object(filesystem, "load_from_file") as load:
+            self.assertEqual(
+                sorted(x.name for x in repo2.iter_package_families()),
+                ["bah", "foo"]
+            )
+
+            pkg = repo2.get_package("foo", Version("1.0"))
+            self.assertEqual([str(x) for x in pkg.requires], ["bah"])
+
+            list_fams.assert_not_called()
+            list_vers.assert_not_called()
+            load.assert_not_called()
+
+        repo.ignore_package("foo", Version("1.1"))
+        repo3 = self._make_repo(path)
+        fam = repo3.get_package_family("foo")
+        self.assertEqual([str(x.version) for x in repo3.iter_packages(fam)], ["1.0"])
+
+    def test_indexed_timestamps(self):
+        """Test that package release times are read from the index."""
+        path = os.path.join(self.root, "timestamps")
+        repo = self._make_repo(path)
+        self._install(repo, "foo", "1.0", timestamp=1000)
+        self._install(repo, "foo", "1.1", timestamp=2000)
+
+        index = filesystem._PackageMetadataIndex.load(repo._index_filepath, False)
+        self.assertEqual(index.entries["foo"]["timestamps"], {"1.0": 1000, "1.1": 2000})
+
+        repo2 = self._make_repo(path)
+        pkg = repo2.get_package("foo", Version("1.1"))
+        self.assertEqual(pkg.timestamp, 2000)
+        self.assertNotIn("_data", pkg.__dict__)
+
+        # with the index disabled, the package is loaded
+        repo3 = self._make_repo(path)
+        repo3.use_metadata_index = False
+        pkg = repo3.get_package("foo", Version("1.1"))
+        self.assertEqual(pkg.timestamp, 2000)
+        self.assertIn("_data", pkg.__dict__)
+
+    def test_stale_index_entry(self):
+        """Test that changes made outside of rez fall back to a scan."""
+        path = os.path.join(self.root, "stale")
+        repo = self._make_repo(path)
+        self._install(repo, "foo", "1.0")
+
+        # a new version dir changes the family dir mtime
+        time.sleep(0.01)
+        other = self._make_repo(path)
+        other.use_metadata_index = False
+        self._install(other, "foo", "2.0")
+
+        repo3 = self._make_repo(path)
+        fam = repo3.get_package_family("foo")
+        self.assertEqual(
+            sorted(str(x.version) for x in repo3.iter_packages(fam)),
+            ["1.0", "2.0"]
+        )
+
+        self.assertEqual(repo3.rebuild_index(), 1)
+        index = filesystem._PackageMetadataIndex.load(repo3._index_filepath, False)
+        self.assertEqual(sorted(index.entries["foo"]["versions"]), ["1.0", "2.0"])
+
+
+class TestFilesystemPackageRepositoryGeneration(TestBase, TempdirMixin):
+    @classmethod
+    def setUpClass(cls):
+        TempdirMixin.setUpClass()
+
+        cls.settings = {
+            "cache_backend": "local",
+            "local_cache_path": os.path.join(cls.root, "cache"),
+            "resolve_caching": True,
+            "plugins": {
+                "package_repository": {
+                    "filesystem": {"use_generation_counter": True}
+                }
+            }
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        TempdirMixin.tearDownClass()
+
+    def _install(self, repo, name, version_str):
+        package = create_package(name, data={"version": version_str})
+        variant = next(package.iter_variants())
+        return repo.install_variant(variant.resource)
+
+    def test_generation_bumped_on_change(self):
+        """Test that installs and ignores change the repository generation."""
+        path = os.path.join(self.root, "bump")
+        repo = package_repository_manager.get_repository(path)
+        self.assertIsNone(repo.get_generation())
+
+        self._install(repo, "foo", "1.0")
+        gen1 = repo.get_generation()
+        self.assertIsNotNone(gen1)
+
+        self._install(repo, "foo", "1.1")
+        gen2 = repo.get_generation()
+        self.assertNotEqual(gen1, gen2)
+
+        repo.ignore_package("foo", Version("1.1"))
+        self.assertNotIn(repo.get_generation(), (gen1, gen2))
+
+        # the generation dir is not mistaken for a package family
+        self.assertEqual([x.name for x in repo.iter_package_families()], ["foo"])
+
+    def test_resolve_cache_validation(self):
+        """Test that cached resolves are validated via the generation."""
+        path = os.path.join(self.root, "resolve")
+        repo = package_repository_manager.get_repository(path)
+        self._install(repo, "foo", "1.0")
+
+        def _resolve():
+            r = ResolvedContext(["foo"], package_paths=[path])
+            return r.from_cache, [x.qualified_package_name for x in r.resolved_packages]
+
+        self.assertEqual(_resolve(), (False, ["foo-1.0"]))
+
+        with patch.object(filesystem.FileSystemPackageRepository,
+                          "get_variant_state_handle") as get_state:
+            self.assertEqual(_resolve(), (True, ["foo-1.0"]))
+            get_state.assert_not_called()
+
+        self._install(repo, "foo", "1.1")
+        self.assertEqual(_resolve(), (False, ["foo-1.1"]))
+        self.assertEqual(_resolve(), (True, ["foo-1.1"]))
+
+
 @unittest.skipIf(
     platform_.name != "windows",
     "URI normcase bug only manifests on Windows where os.path.normcase is not a no-op.",
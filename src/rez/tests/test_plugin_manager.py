@@ -8,6 +8,8 @@ test rezplugins manager behaviors
 from rez.tests.util import TestBase, TempdirMixin, restore_sys_path
 from rez.plugin_managers import plugin_manager, uncache_rezplugins_module_paths
 from rez.package_repository import package_repository_manager
+import os
+import shutil
 import sys
 import unittest
 
@@ -39,10 +41,12 @@ class TestPluginManagers(TestBase, TempdirMixin):
 
     @classmethod
     def setUpClass(cls) -> None:
+        TempdirMixin.setUpClass()
         cls.settings = {"debug_plugins": True}
 
     @classmethod
     def tearDownClass(cls) -> None:
+        TempdirMixin.tearDownClass()
         cls._reset_plugin_manager()
 
     def setUp(self) -> None:
@@ -108,6 +112,43 @@ class TestPluginManagers(TestBase, TempdirMixin):
                 "package_repository", "memory")
             self.assertEqual("bar", mem_cls.on_test)
 
+    def test_plugin_cache(self) -> None:
+        """Test loading plugins from the plugin cache"""
+        plugin_path = os.path.join(self.root, "foo")
+        shutil.copytree(self.data_path("extensions", "foo"), plugin_path)
+        modname = "rezplugins.package_repository.cloud"
+
+        self.update_settings(dict(
+            plugin_path=[plugin_path],
+            plugin_cache_path=os.path.join(self.root, "plugin_cache")
+        ))
+
+        # discover plugins, and write the cache
+        names = plugin_manager.get_plugins("package_repository")
+        self.assertIn("cloud", names)
+        self.assertIn(modname, sys.modules)
+
+        # plugins are found from the cache, and are imported on first use
+        self._reset_plugin_manager()
+        names_ = plugin_manager.get_plugins("package_repository")
+        self.assertEqual(names_, names)
+        self.assertNotIn(modname, sys.modules)
+
+        cloud_cls = plugin_manager.get_plugin_class(
+            "package_repository", "cloud")
+        self.assertEqual(cloud_cls.name(), "cloud")
+        self.assertIn(modname, sys.modules)
+
+        # changing a plugin invalidates the cache
+        self._reset_plugin_manager()
+        filepath = os.path.join(plugin_path, "rezplugins",
+                                "package_repository", "cloud.py")
+        st = os.stat(filepath)
+        os.utime(filepath, (st.st_atime, st.st_mtime + 10))
+
+        plugin_manager.get_plugins("package_repository")
+        self.assertIn(modname, sys.modules)
+
 
 if __name__ == '__main__':
     unittest.main()
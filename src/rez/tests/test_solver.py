@@ -7,7 +7,7 @@ test dependency resolving algorithm
 """
 import rez.exceptions
 from rez.version import Requirement
-from rez.solver import Solver, Cycle, SolverStatus
+from rez.solver import Solver, Cycle, SolverStatus, PackageVariantCachePool
 from rez.config import config
 import unittest
 from rez.tests.util import TestBase
@@ -273,6 +273,53 @@ class TestSolver(TestBase):
                      'python-2.6.8[]',
                      'pyfoo-3.1.0[]'])
 
+    def test_15_prefetch_determinism(self) -> None:
+        """Test that background family loading doesn't change the solve."""
+        reqs = [Requirement(x) for x in ("pyvariants", "python", "nada")]
+        results = []
+
+        for num_threads in (0, 8):
+            config.override("solver_prefetch_threads", num_threads)
+            s = Solver(reqs, self.packages_path, verbosity=solver_verbosity)
+            if num_threads:
+                self.assertEqual(set(s.package_cache.prefetches), set())
+                self.assertEqual(
+                    set(s.package_cache.variant_lists),
+                    set(["pyvariants", "python", "nada"]))
+
+            s.solve()
+            self.assertEqual(s.status, SolverStatus.solved)
+            results.append([str(x) for x in s.resolved_packages])
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], ["python-2.7.0[]", "pyvariants-2[0]", "nada[]"])
+
+    def test_16_package_cache_pool(self) -> None:
+        """Test that solves sharing variant caches are bound to each solver."""
+        reqs = [Requirement(x) for x in ("pyvariants", "python", "nada")]
+        pool = PackageVariantCachePool()
+        results = []
+
+        for context in (object(), object()):
+            loaded = []
+            s = Solver(reqs, self.packages_path, context=context,
+                       package_load_callback=loaded.append,
+                       package_cache_pool=pool,
+                       verbosity=solver_verbosity)
+            s.solve()
+            self.assertEqual(s.status, SolverStatus.solved)
+            results.append([str(x) for x in s.resolved_packages])
+
+            # packages loaded by the previous solve are reported again
+            self.assertIn("pyvariants", set(x.name for x in loaded))
+
+            for variant in s.resolved_packages:
+                self.assertIs(variant.variant.context, context)
+                self.assertIs(variant.variant.parent.context, context)
+
+        self.assertEqual(len(pool.caches), 1)
+        self.assertEqual(results[0], results[1])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -11,10 +11,15 @@ from rez.resolved_context import ResolvedContext
 from rez.suite import Suite
 from rez.config import config
 from rez.system import system
+from rez.utils.launch_record import load_launch_record, get_launch_record_path
+from rez.utils.platform_ import platform_
+import rez
+import json
 import subprocess
 import unittest
 import uuid
 import os.path
+import sys
 
 
 class TestRezSuites(TestBase, TempdirMixin):
@@ -141,6 +146,25 @@ class TestRezSuites(TestBase, TempdirMixin):
 
         self._test_serialization(s)
 
+    def test_prebaked_shells(self) -> None:
+        """Test saving a suite with prebaked shell startup scripts."""
+        from rez.shells import create_shell
+
+        sh = create_shell()
+        s = Suite()
+        s.add_context("foo", ResolvedContext(["foo"]))
+
+        path = os.path.join(self.root, "prebaked")
+        s.save(path, shells=[sh.name()])
+
+        context = Suite.load(path).context("foo")
+        script = context._get_prebaked_script(sh, None)
+        self.assertEqual(
+            script,
+            os.path.join(path, "contexts", "foo.%s.%s" % (sh.name(), sh.file_extension()))
+        )
+        self.assertTrue(os.path.isfile(script))
+
     @per_available_shell()
     @install_dependent()
     def test_executable(self, shell) -> None:
@@ -182,6 +206,67 @@ class TestRezSuites(TestBase, TempdirMixin):
                                          universal_newlines=True)
         self.assertTrue("yum yum" in output)
 
+    @unittest.skipIf(platform_.name == "windows", "not supported on windows")
+    def test_launch_records(self) -> None:
+        """Test launching a suite tool from its launch record."""
+        self.update_settings({"suite_tool_launch_records": True})
+
+        s = Suite()
+        s.add_context("pooh", ResolvedContext(["pooh"]))
+        suite_path = os.path.join(self.root, "launch_records")
+        s.save(suite_path)
+
+        wrapper = os.path.join(suite_path, "bin", "hunny")
+        record = load_launch_record(wrapper, [])
+        self.assertEqual(
+            record["executable"],
+            self.data_path("suites", "packages", "pooh", "bin", "hunny")
+        )
+        self.assertEqual(record["environ"]["REZ_RXT_FILE"],
+                         os.path.join(suite_path, "contexts", "pooh.rxt"))
+
+        # suite wrapper args require the full launch path
+        self.assertIsNone(load_launch_record(wrapper, ["+i"]))
+
+        code = (
+            "from rez.utils.launch_record import try_launch; "
+            "try_launch(['_rez_fwd', %r])" % wrapper
+        )
+        output = subprocess.check_output(
+            [sys.executable, "-c", code],
+            env=dict(os.environ, PYTHONPATH=os.path.dirname(rez.module_root_path)),
+            universal_newlines=True
+        )
+        self.assertEqual(output.strip(), "yum yum")
+
+        # records are stale once a package cache root they refer to is gone
+        record_filepath = get_launch_record_path(suite_path, "hunny")
+        with open(record_filepath) as f:
+            data = json.load(f)
+        data["cached_variants"] = [{
+            "root": os.path.join(self.root, "package_cache", "pooh", "a"),
+            "index": None,
+            "index_key": "pooh/a"
+        }]
+        with open(record_filepath, 'w') as f:
+            json.dump(data, f)
+        self.assertIsNone(load_launch_record(wrapper, []))
+
+        # using a record marks its cached variants as used
+        cached_root = data["cached_variants"][0]["root"]
+        os.makedirs(cached_root)
+        with open(cached_root + ".json", 'w') as f:
+            f.write("{}")
+        os.utime(cached_root + ".json", (0, 0))
+
+        self.assertIsNotNone(load_launch_record(wrapper, []))
+        self.assertNotEqual(os.stat(cached_root + ".json").st_mtime, 0)
+
+        # records are stale once their context has changed
+        rxt_filepath = os.path.join(suite_path, "contexts", "pooh.rxt")
+        os.utime(rxt_filepath, (0, 0))
+        self.assertIsNone(load_launch_record(wrapper, []))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,6 +5,7 @@
 """
 unit tests for 'rez.utils.filesystem' module
 """
+import errno
 import os.path
 import sys
 import tempfile
@@ -125,3 +126,34 @@ class TestFileSystem(TestBase, TempdirMixin):
         with unittest.mock.patch("shutil.rmtree", wraps=rmtree_permission_error):
             with self.assertRaises(PermissionError):
                 filesystem.safe_rmtree("._path")
+
+    def test_parallel_copytree(self) -> None:
+        src = tempfile.mkdtemp(dir=self.root)
+        os.makedirs(os.path.join(src, "a", "b"))
+
+        contents = {
+            "small.txt": b"hello",
+            os.path.join("a", "large.bin"): os.urandom(100000),
+            os.path.join("a", "b", "empty"): b"",
+        }
+        for name, data in contents.items():
+            with open(os.path.join(src, name), "wb") as f:
+                f.write(data)
+
+        def _copy_file_range(*args):
+            raise OSError(errno.ENOSYS, "Function not implemented")
+
+        # chunked copies have to work where copy_file_range is not supported
+        copy_file_ranges = [getattr(os, "copy_file_range", None), _copy_file_range]
+
+        for copy_file_range in filter(None, copy_file_ranges):
+            dst = tempfile.mkdtemp(dir=self.root)
+
+            with unittest.mock.patch("os.copy_file_range", copy_file_range, create=True):
+                size = filesystem.parallel_copytree(
+                    src, os.path.join(dst, "copy"), threads=3, chunk_size=30000)
+
+            self.assertEqual(size, sum(len(x) for x in contents.values()))
+            for name, data in contents.items():
+                with open(os.path.join(dst, "copy", name), "rb") as f:
+                    self.assertEqual(f.read(), data)
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the Rez Project
+
+
+"""
+unit tests for 'rez.utils.local_cache' module
+"""
+import os.path
+
+from rez.tests.util import TestBase, TempdirMixin
+from rez.utils import local_cache
+from rez.utils.memcached import Client, memcached
+
+
+class TestLocalCache(TestBase, TempdirMixin):
+    @classmethod
+    def setUpClass(cls) -> None:
+        TempdirMixin.setUpClass()
+        cls.settings = {}
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        TempdirMixin.tearDownClass()
+
+    def _client(self, name, max_size=0):
+        path = os.path.join(self.root, name)
+        return local_cache.LocalCacheClient(path, max_size=max_size)
+
+    def test_get_set_delete(self) -> None:
+        client = self._client("basic")
+        self.assertIsNone(client.get("foo"))
+
+        client.set("foo", {"a": [1, 2]})
+        client.set("bah", "x" * 1000, min_compress_len=10)
+        self.assertEqual(client.get("foo"), {"a": [1, 2]})
+        self.assertEqual(client.get("bah"), "x" * 1000)
+
+        # entries are visible to other clients on the same store
+        client2 = self._client("basic")
+        self.assertEqual(client2.get("foo"), {"a": [1, 2]})
+
+        client.delete("foo")
+        self.assertIsNone(client2.get("foo"))
+
+        client.flush_all()
+        self.assertIsNone(client.get("bah"))
+        self.assertEqual(client.get_stats()[0][1]["bytes"], 0)
+
+    def test_lru_eviction(self) -> None:
+        client = self._client("evict", max_size=5000)
+        for i in range(4):
+            client.set("key%d" % i, os.urandom(1000))
+
+        # touch key0 so that key1 is the least recently used
+        client.touch_interval = 0
+        client.get("key0")
+
+        client.set("key4", os.urandom(1500))
+
+        self.assertIsNotNone(client.get("key0"))
+        self.assertIsNone(client.get("key1"))
+        self.assertIsNotNone(client.get("key4"))
+        self.assertLessEqual(client.get_stats()[0][1]["bytes"], 5000)
+
+    def test_memcached_decorator(self) -> None:
+        """Test local store use via the memcached client and decorator."""
+        uri = local_cache.uri_prefix + os.path.join(self.root, "decorator")
+        calls = []
+
+        @memcached(servers=[uri])
+        def _square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual(_square(3), 9)
+        self.assertEqual(_square(3), 9)
+        self.assertEqual(calls, [3])
+
+        client = Client([uri])
+        client.set("none", None)
+        self.assertIsNone(client.get("none"))
+        self.assertIs(client.get("missing"), client.miss)
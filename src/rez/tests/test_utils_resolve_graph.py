@@ -44,6 +44,32 @@ class TestResolveGraph(TestBase):
         self.assertTrue("foo-1 --> foo-1.0.0 --> bar-0.0.1 --> !foo-1.0.0" in result)
         self.assertTrue("bar --> bar-0.0.1 --> !foo-1.0.0" in result)
 
+    def test_prune_graph(self) -> None:
+        """Tests pruning a graph to the nodes leading to a given package."""
+        g = '''
+        digraph g {
+            _1 [label="foo", fontsize="10", fillcolor="#FFFFAA", style="filled,dashed"];
+            _2 [label="baz", fontsize="10", fillcolor="#FFFFAA", style="filled,dashed"];
+            _3 [label="foo-1.0.0[]", fontsize="10", fillcolor="#AAFFAA", style="filled"];
+            _4 [label="bar-0.0.1[]", fontsize="10", fillcolor="#AAFFAA", style="filled"];
+            _5 [label="baz-2.0[]", fontsize="10", fillcolor="#AAFFAA", style="filled"];
+            _1 -> _3 [arrowsize="0.5"];
+            _3 -> _4 [arrowsize="0.5"];
+            _2 -> _5 [arrowsize="0.5"];
+        }
+        '''
+        pruned = rez.utils.graph_utils.prune_graph(g, "bar")
+        graph = rez.utils.graph_utils.read_graph_from_string(pruned)
+
+        labels = set(
+            dict(attrs)["label"].strip('"')
+            for attrs in graph.node_attr.values()
+        )
+        self.assertEqual(labels, {"foo", "foo-1.0.0[]", "bar-0.0.1[]"})
+
+        with self.assertRaises(ValueError):
+            rez.utils.graph_utils.prune_graph(g, "eek")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,10 +10,10 @@ import textwrap
 import unittest
 
 from rez.version import Version, AlphanumericVersionToken, \
-    VersionRange, reverse_sort_key
+    VersionRange, VersionToken, reverse_sort_key
 from rez.version._version import _ReversedComparable
 from rez.version import Requirement, RequirementList
-from rez.version import VersionError
+from rez.version import VersionError, parse_cache_stats, clear_parse_caches
 
 
 def _print(txt='') -> None:
@@ -169,6 +169,84 @@ class TestVersionSchema(unittest.TestCase):
         _eq2(set([b, c]) | set([c, d]), set([b, c, d]))
         _eq2(set([b, c]) & set([c, d]), set([c]))
 
+    def test_version_interning(self) -> None:
+        a = Version("1.2.alpha3")
+        self.assertIs(Version("1.2.alpha3"), a)
+        self.assertIs(Version("2.alpha3")[1], a[2])
+
+        # equal versions with different separators are separate instances
+        self.assertIsNot(Version("1-2.alpha3"), a)
+        self.assertEqual(str(Version("1-2.alpha3")), "1-2.alpha3")
+
+        # derived versions do not affect the interned instance
+        self.assertEqual(str(a.next()), "1.2.alpha3_")
+        self.assertEqual(str(a.trim(1)), "1")
+        self.assertEqual(str(a), "1.2.alpha3")
+
+    def test_version_sort_key(self) -> None:
+        # sort keys must order the same as tokens do
+        for i in range(100):
+            ver1 = self._create_random_version()
+            ver2 = self._create_random_version()
+            self.assertEqual(ver1.sort_key < ver2.sort_key,
+                             ver1.tokens < ver2.tokens)
+            self.assertEqual(ver1.sort_key == ver2.sort_key,
+                             ver1.tokens == ver2.tokens)
+
+    def test_custom_token_hash(self) -> None:
+        # a token type that doesn't implement sort_key, nor __hash__
+        class _Token(VersionToken):
+            def __init__(self, token: str) -> None:
+                self.token = token
+
+            def less_than(self, other) -> bool:
+                return self.token < other.token
+
+            def __str__(self) -> str:
+                return self.token
+
+        ver1 = Version("1.a", make_token=_Token)
+        ver2 = Version("1.a", make_token=_Token)
+        self.assertEqual(ver1, ver2)
+        self.assertEqual(hash(ver1), hash(ver2))
+        self.assertEqual(len({ver1, ver2, Version("1.b", make_token=_Token)}), 2)
+
+    def test_parse_cache(self) -> None:
+        clear_parse_caches()
+
+        range_ = VersionRange("1.2+<3")
+        self.assertEqual(VersionRange("1.2+<3"), range_)
+        self.assertEqual(VersionRange("1.2+<3", invalid_bound_error=False), range_)
+
+        req = Requirement("~foo-1.2+<3")
+        self.assertEqual(Requirement("~foo-1.2+<3"), req)
+        self.assertEqual(str(req), "~foo-1.2+<3")
+
+        # cached instances are copied, so changing one in place does not
+        # affect others parsed from the same string
+        range2 = VersionRange("1.2+<3")
+        self.assertIsNot(range2, range_)
+        range2.visit_versions(lambda v: Version("5"))
+        self.assertEqual(str(range2), "==5")
+        self.assertEqual(str(VersionRange("1.2+<3")), "1.2+<3")
+        self.assertIn(Version("1.5"), VersionRange("1.2+<3"))
+
+        req2 = Requirement("~foo-1.2+<3")
+        req2.range.visit_versions(lambda v: Version("5"))
+        self.assertEqual(str(Requirement("~foo-1.2+<3").range), str(req.range))
+
+        # operations do not modify the shared instances
+        merged = req.merged(Requirement("foo-2"))
+        self.assertEqual(str(merged), "foo-2")
+        self.assertEqual(str(req), "~foo-1.2+<3")
+        self.assertEqual(str(range_ | VersionRange("5")), "1.2+<3|5")
+        self.assertEqual(str(range_), "1.2+<3")
+
+        stats = parse_cache_stats()
+        self.assertEqual(stats["Requirement"]["hits"], 3)
+        self.assertEqual(stats["Requirement"]["misses"], 2)
+        self.assertGreaterEqual(stats["VersionRange"]["hits"], 1)
+
     def test_version_range(self) -> None:
         def _eq(a, b) -> None:
             _print("'%s' == '%s'" % (a, b))
@@ -14,6 +14,7 @@ import os
 import os.path
 import re
 import inspect
+import sys
 
 from rez.exceptions import RezError
 from rez.vendor.progress.bar import Bar
@@ -158,9 +159,15 @@ def find_last_sublist(list_, sublist):
 
 @atexit.register
 def _atexit() -> None:
+    # if contexts were never used, there are no tmpdirs to clear. Importing
+    # the module this late can also fail, as its imports may register exit
+    # handlers (which is not allowed once shutdown has started)
+    module = sys.modules.get("rez.resolved_context")
+    if module is None:
+        return
+
     try:
-        from rez.resolved_context import ResolvedContext
-        ResolvedContext.tmpdir_manager.clear()
+        module.ResolvedContext.tmpdir_manager.clear()
     except RezError:
         pass
 
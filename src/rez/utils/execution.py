@@ -8,7 +8,6 @@ Utilities related to process/script execution.
 
 from __future__ import annotations
 
-from rez.utils.yaml import dump_yaml
 from contextlib import contextmanager
 from enum import Enum
 import subprocess
@@ -231,6 +230,7 @@ def create_forwarding_script(filepath: str, module: str | tuple[str, str], func_
     even though the parent environment may not be configured to do so.
     """
     from rez.utils.platform_ import platform_
+    from rez.utils.yaml import dump_yaml
 
     if platform_.name == "windows" and \
             os.path.splitext(filepath)[-1].lower() != ".cmd":
@@ -483,6 +483,140 @@ def copytree(src: str, dst: str, symlinks: bool = False, ignore=None, hardlinks:
         raise shutil.Error(errors)
 
 
+def parallel_copytree(src: str, dst: str, threads: int = 4,
+                      chunk_size: int | None = None, copy_function=shutil.copy2) -> int:
+    """Copy a directory tree, copying files on a pool of threads.
+
+    As with `shutil.copytree`, symlinks are followed and file metadata is
+    copied. Files larger than `chunk_size` are copied as separate chunks, so a
+    single large file also benefits from concurrent copying. Where available,
+    `os.copy_file_range` is used to copy file chunks within the kernel (or
+    server side, on network filesystems that support it). Whole files are
+    copied with `shutil.copy2`, which does the same via `os.sendfile` on Linux.
+
+    Args:
+        src (str): Source directory.
+        dst (str): Destination directory; created if it does not exist.
+        threads (int): Number of threads to copy files with.
+        chunk_size (int): Files larger than this many bytes are copied in
+            chunks of this size. If None, files are never chunked.
+        copy_function (callable): Function used to copy whole (ie, unchunked)
+            files, taking the source and destination file paths.
+
+    Returns:
+        int: Number of bytes copied.
+
+    Raises:
+        `shutil.Error`: If any files failed to copy, after all other files
+        have been copied.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    errors = []
+    dirs = []
+    copies = []  # list of (future, srcname, dstname)
+    chunked_files = []  # list of (srcname, dstname)
+    total = 0
+
+    def _onerror(e):
+        errors.append((e.filename, None, str(e)))
+
+    with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+        for dirpath, _, filenames in os.walk(src, onerror=_onerror, followlinks=True):
+            destdir = os.path.normpath(os.path.join(dst, os.path.relpath(dirpath, src)))
+            os.makedirs(destdir, exist_ok=True)
+            dirs.append((dirpath, destdir))
+
+            for name in filenames:
+                srcname = os.path.join(dirpath, name)
+                dstname = os.path.join(destdir, name)
+
+                try:
+                    size = os.stat(srcname).st_size
+
+                    if chunk_size and size > chunk_size:
+                        with open(dstname, "wb") as f:
+                            f.truncate(size)
+
+                        for offset in range(0, size, chunk_size):
+                            future = executor.submit(
+                                _copy_file_chunk, srcname, dstname, offset,
+                                min(chunk_size, size - offset)
+                            )
+                            copies.append((future, srcname, dstname))
+
+                        chunked_files.append((srcname, dstname))
+                    else:
+                        future = executor.submit(copy_function, srcname, dstname)
+                        copies.append((future, srcname, dstname))
+
+                    total += size
+
+                except OSError as why:
+                    errors.append((srcname, dstname, str(why)))
+
+        failed = set()
+        for future, srcname, dstname in copies:
+            try:
+                future.result()
+            except (OSError, shutil.Error) as why:
+                if dstname not in failed:
+                    errors.append((srcname, dstname, str(why)))
+                    failed.add(dstname)
+
+    # metadata is copied last, as writing into files/dirs updates their mtimes
+    for srcname, dstname in chunked_files:
+        if dstname not in failed:
+            try:
+                shutil.copystat(srcname, dstname)
+            except OSError as why:
+                errors.append((srcname, dstname, str(why)))
+
+    for srcdir, destdir in reversed(dirs):
+        try:
+            shutil.copystat(srcdir, destdir)
+        except OSError as why:
+            errors.append((srcdir, destdir, str(why)))
+
+    if errors:
+        raise shutil.Error(errors)
+
+    return total
+
+
+def _copy_file_chunk(src: str, dst: str, offset: int, length: int) -> None:
+    """Copy a byte range of `src` into the existing file `dst`."""
+    end = offset + length
+
+    with open(src, "rb") as fsrc, open(dst, "r+b") as fdst:
+        if hasattr(os, "copy_file_range"):
+            try:
+                while offset < end:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(),
+                                           end - offset, offset, offset)
+                    if not n:
+                        return  # source file was truncated
+                    offset += n
+                return
+
+            except OSError as e:
+                # not supported between these files (eg cross-device on older
+                # kernels), so fall back to a regular copy of the remainder
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                                   errno.EOPNOTSUPP):
+                    raise
+
+        fsrc.seek(offset)
+        fdst.seek(offset)
+
+        while offset < end:
+            buf = fsrc.read(min(1024 * 1024, end - offset))
+            if not buf:
+                return
+            fdst.write(buf)
+            offset += len(buf)
+
+
 def movetree(src: str, dst: str) -> None:
     """Attempts a move, and falls back to a copy+delete if this fails
     """
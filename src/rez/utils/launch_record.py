@@ -0,0 +1,313 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the Rez Project
+
+
+"""
+Precomputed launch records for suite tools.
+
+A launch record holds everything needed to run a suite tool - the environment
+changes made by its context, and the path of the executable - so that the tool
+can be launched without importing most of rez, loading the suite, or
+interpreting the context. Records are written by `Suite.save`, and are used by
+the suite tool wrappers (see `try_launch`).
+
+A record is only used if the inputs it was created from are unchanged, and
+the package cache roots it refers to are still cached. In any other case the
+wrapper falls back to the full launch path.
+
+Note that this module is imported at tool launch time, so must only import
+from the standard library at module level.
+"""
+from __future__ import annotations
+
+import json
+import os
+import os.path
+import sys
+import time
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rez.resolved_context import ResolvedContext
+
+
+record_version = 2
+
+
+def get_launch_record_path(suite_path: str, tool_alias: str) -> str:
+    """Get the path of the launch record of a suite tool.
+
+    Args:
+        suite_path (str): Path to the suite.
+        tool_alias (str): Tool alias, as it appears in the suite's bin dir.
+
+    Returns:
+        str: Path to the record.
+    """
+    return os.path.join(suite_path, "launch", "%s.json" % tool_alias)
+
+
+def create_launch_records(suite_path: str, context_name: str,
+                          context: ResolvedContext, tools: list[dict]) -> list[str]:
+    """Write the launch records of the tools of a suite context.
+
+    Tools for which no record can be made (for example, tools that are not
+    found on the context's PATH, or tools of a context whose commands use
+    shell-specific features such as aliases) are skipped; these tools are
+    always launched via the full path.
+
+    Args:
+        suite_path (str): Path to the saved suite.
+        context_name (str): Name of the context in the suite.
+        context (`ResolvedContext`): The context, as saved into the suite.
+        tools (list of dict): Tool entries (see `Suite.get_tools`), each with
+            an extra 'prefix_char' key.
+
+    Returns:
+        list of str: Aliases of the tools that records were written for.
+    """
+    import shutil
+    from rez.config import config
+    from rez.rex import Python, Unsetenv, Alias, Command, Source
+    from rez.vendor.atomicwrites import atomic_write
+    from rez.utils._version import _rez_version
+
+    _pr = config.debug_printer("shell_startup")
+    rxt_filepath = os.path.join(suite_path, "contexts", "%s.rxt" % context_name)
+
+    # interpret the context, recording which parts of the parent environ it
+    # depends on
+    interp = Python(target_environ={}, passive=True)
+    executor = context._create_executor(interp, None)
+    manager = executor.manager
+
+    with manager.recording_parent_environ() as recorder:
+        # the tool is looked up on PATH, so always depend on it
+        manager.parent_environ.get("PATH")
+        executor.env.REZ_RXT_FILE = rxt_filepath
+        cached_roots = context._execute(executor)
+
+    if recorder.read_all:
+        _pr("Cannot create launch records for %r, commands read the entire "
+            "environment" % context_name)
+        return []
+
+    for action in manager.actions:
+        if isinstance(action, (Alias, Command, Source)):
+            _pr("Cannot create launch records for %r, commands use %s "
+                "actions" % (context_name, action.name))
+            return []
+
+    environ = dict(executor.get_output())
+    environ["REZ_SHELL_INTERACTIVE"] = "0"
+    unset = sorted(set(x.key for x in manager.actions
+                       if isinstance(x, Unsetenv)) - set(environ))
+
+    # settings can be overridden by environment variables, so these are
+    # checked also
+    environ_reads = dict(recorder.reads)
+    for key in ("REZ_CONFIG_FILE", "REZ_DISABLE_HOME_CONFIG"):
+        environ_reads[key] = os.getenv(key)
+    for key in config._schema_keys:
+        if isinstance(key, str):
+            varname = "REZ_%s" % key.upper()
+            environ_reads[varname] = os.getenv(varname)
+            environ_reads[varname + "_JSON"] = os.getenv(varname + "_JSON")
+
+    files = [rxt_filepath]
+    files.extend(config.filepaths)
+    files.extend(config.sourced_filepaths)
+    for variant in context.resolved_packages or []:
+        filepath = getattr(variant.resource.parent, "filepath", None)
+        if filepath:
+            files.append(filepath)
+
+    record = {
+        "version": record_version,
+        "rez_version": _rez_version,
+        "environ": environ,
+        "unset": unset,
+        "environ_reads": environ_reads,
+        "files": dict((x, _get_mtime(x)) for x in files),
+        "cached_variants": _get_cached_variants(context, cached_roots)
+    }
+
+    aliases = []
+    path = environ.get("PATH", os.getenv("PATH", ""))
+
+    for tool in tools:
+        executable = shutil.which(tool["tool_name"], path=path)
+        if not executable:
+            continue
+
+        prefix_char = tool["prefix_char"]
+        if prefix_char is None:
+            prefix_char = config.suite_alias_prefix_char
+
+        record.update(
+            tool_name=tool["tool_name"],
+            executable=os.path.abspath(executable),
+            prefix_char=prefix_char
+        )
+        record["files"][record["executable"]] = _get_mtime(record["executable"])
+
+        filepath = get_launch_record_path(suite_path, tool["tool_alias"])
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with atomic_write(filepath, overwrite=True) as f:
+            f.write(json.dumps(record))
+
+        del record["files"][record["executable"]]
+        aliases.append(tool["tool_alias"])
+
+    return aliases
+
+
+def load_launch_record(script: str, args: list[str]) -> dict | None:
+    """Load the launch record of a suite tool wrapper, if it can be used.
+
+    Args:
+        script (str): Path to the tool wrapper, in the suite's bin dir.
+        args (list of str): Arguments the tool is invoked with.
+
+    Returns:
+        dict: The launch record, or None if there is none, or it is stale.
+    """
+    from rez.utils._version import _rez_version
+
+    tool_alias = os.path.basename(script)
+    if sys.platform == "win32" and tool_alias.lower().endswith(".cmd"):
+        tool_alias = tool_alias[:-4]
+
+    suite_path = os.path.dirname(os.path.dirname(os.path.abspath(script)))
+    filepath = get_launch_record_path(suite_path, tool_alias)
+
+    try:
+        with open(filepath) as f:
+            record = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if record.get("version") != record_version \
+            or record.get("rez_version") != _rez_version:
+        return None
+
+    # wrapper args (eg '+i') need the full launch path
+    prefix_char = record["prefix_char"]
+    if prefix_char and any(x.startswith(prefix_char) for x in args):
+        return None
+
+    for key, value in record["environ_reads"].items():
+        if os.environ.get(key) != value:
+            return None
+
+    for path, mtime in record["files"].items():
+        if _get_mtime(path) != mtime:
+            return None
+
+    for entry in record["cached_variants"]:
+        if not _touch_cached_variant(entry):
+            return None
+
+    return record
+
+
+def try_launch(argv: list[str] | None = None) -> None:
+    """Launch a suite tool from its launch record, if possible.
+
+    This does not return if the tool is launched.
+
+    Args:
+        argv (list of str): Arguments of the tool wrapper, defaults to
+            `sys.argv`. The first argument is the wrapper script.
+    """
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2:
+        return
+
+    script, args = argv[1], argv[2:]
+
+    record = load_launch_record(script, args)
+    if record is None:
+        return
+
+    environ = dict(os.environ)
+    for key in record["unset"]:
+        environ.pop(key, None)
+    environ.update(record["environ"])
+    environ["REZ_SHELL_INIT_TIMESTAMP"] = str(int(time.time()))
+
+    cmd = [record["tool_name"]] + list(args)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    if sys.platform == "win32":
+        import subprocess
+        sys.exit(subprocess.call(cmd, executable=record["executable"], env=environ))
+    else:
+        os.execve(record["executable"], cmd, environ)
+
+
+def _get_cached_variants(context: ResolvedContext,
+                         cached_roots: dict[str, str]) -> list[dict]:
+    """Get the package cache entries of the variants remapped to the cache.
+    """
+    if not cached_roots:
+        return []
+
+    pkgcache = context._get_package_cache()
+    index = pkgcache._get_index(create=False)
+    if index is not None and os.path.exists(index.filepath):
+        index_filepath = index.filepath
+    else:
+        index_filepath = None
+
+    return [
+        {
+            "root": root,
+            "index": index_filepath,
+            "index_key": os.path.relpath(root, pkgcache.path)
+        }
+        for root in sorted(cached_roots.values())
+    ]
+
+
+def _touch_cached_variant(entry: dict) -> bool:
+    """Mark a cached variant as used, as `PackageCache.get_cached_root` does.
+
+    Returns:
+        bool: False if the variant is no longer in the package cache.
+    """
+    root = entry["root"]
+
+    try:
+        os.utime(root + ".json", None)
+    except OSError:
+        return False  # removed from the cache
+
+    if not os.path.isdir(root):
+        return False
+
+    if entry["index"]:
+        import sqlite3
+
+        try:
+            with closing(sqlite3.connect(entry["index"], timeout=1.0)) as conn:
+                with conn:
+                    conn.execute(
+                        "UPDATE variants SET last_used=?, use_count=use_count+1 "
+                        "WHERE rootpath=?",
+                        (time.time(), entry["index_key"])
+                    )
+        except sqlite3.Error:
+            pass  # eg index is locked, or not writable by this user
+
+    return True
+
+
+def _get_mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
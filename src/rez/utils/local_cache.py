@@ -0,0 +1,285 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the Rez Project
+
+
+"""
+Host-local cache store, used in place of memcached servers.
+
+Entries are stored in an sqlite database, which is safely shared between all
+rez processes on the host. The store is size bounded - when full, the least
+recently used entries are evicted.
+"""
+from __future__ import annotations
+
+import os
+import os.path
+import pickle
+import sqlite3
+import zlib
+from time import time as current_time
+
+from typing import Any
+
+
+# uri prefix identifying a local cache in a list of cache 'servers'
+uri_prefix = "local:"
+
+# this version should be changed if and when the database layout changes
+db_version = 1
+
+
+def is_local_uri(uri: str) -> bool:
+    return uri.startswith(uri_prefix)
+
+
+class LocalCacheClient(object):
+    """Local cache store.
+
+    Implements the subset of the `memcache.Client` interface used by
+    `rez.utils.memcached.Client`, so it can be used in its place.
+    """
+
+    # the fraction of max size to evict down to, when max size is exceeded
+    evict_ratio = 0.9
+
+    # last use times are only updated if older than this (in secs), so that
+    # cache hits don't usually cause a database write
+    touch_interval = 60
+
+    def __init__(self, path: str, max_size: int = 0, timeout: float = 10.0) -> None:
+        """Create a local cache client.
+
+        Args:
+            path (str): Directory containing the cache database. It is created
+                if it does not exist.
+            max_size (int): Max size of stored values in bytes, zero for
+                unlimited.
+            timeout (float): Seconds to wait for a lock held by another process.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.timeout = timeout
+        self.filepath = os.path.join(path, "cache-v%d.db" % db_version)
+        self._conn: sqlite3.Connection | None = None
+        self._stats = {
+            "cmd_get": 0,
+            "cmd_set": 0,
+            "get_hits": 0,
+            "get_misses": 0,
+            "evictions": 0
+        }
+        self._start_time = current_time()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(self.path, exist_ok=True)
+
+            conn = sqlite3.connect(
+                self.filepath,
+                timeout=self.timeout,
+                isolation_level=None  # transactions are managed explicitly
+            )
+
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB, size INTEGER, "
+                "expires REAL, atime REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_atime ON entries(atime)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)")
+            conn.execute("INSERT OR IGNORE INTO meta VALUES ('total_size', 0)")
+
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Any:
+        """Get a value.
+
+        Like memcached, an unavailable store (eg a locked or corrupt database)
+        is treated as a cache miss.
+
+        Returns:
+            The value, or None on a cache miss.
+        """
+        self._stats["cmd_get"] += 1
+        now = current_time()
+
+        try:
+            row = self.conn.execute(
+                "SELECT value, expires, atime FROM entries WHERE key=?", (key,)
+            ).fetchone()
+
+            if row is None or (row[1] and row[1] < now):
+                self._stats["get_misses"] += 1
+                return None
+
+            value, _, atime = row
+            if now - atime > self.touch_interval:
+                self.conn.execute(
+                    "UPDATE entries SET atime=? WHERE key=?", (now, key))
+
+            result = self._decode(value)
+
+        except (sqlite3.Error, OSError, pickle.UnpicklingError, zlib.error):
+            self._stats["get_misses"] += 1
+            return None
+
+        self._stats["get_hits"] += 1
+        return result
+
+    def set(self, key: str, val: Any, time: int = 0, min_compress_len: int = 0) -> bool:
+        """Store a value.
+
+        Args:
+            key (str): Key.
+            val: Value, must be picklable.
+            time (int): Expiry time, either as a delta number of seconds, or an
+                absolute unix time. Zero means no expiry.
+            min_compress_len (int): Byte count beyond which the value is
+                compressed. Zero means never compress.
+        """
+        self._stats["cmd_set"] += 1
+        value = self._encode(val, min_compress_len)
+
+        now = current_time()
+        if not time:
+            expires = 0.0
+        elif time < 60 * 60 * 24 * 30:  # same convention as memcached
+            expires = now + time
+        else:
+            expires = float(time)
+
+        try:
+            self._set(key, value, expires, now)
+        except (sqlite3.Error, OSError):
+            return False
+        return True
+
+    def _set(self, key: str, value: bytes, expires: float, now: float) -> None:
+        size = len(value)
+        conn = self.conn
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT size FROM entries WHERE key=?", (key,)).fetchone()
+            prev_size = row[0] if row else 0
+
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), size, expires, now)
+            )
+            total_size = self._add_total_size(size - prev_size)
+
+            if self.max_size and total_size > self.max_size:
+                self._evict(int(self.max_size * self.evict_ratio), total_size)
+
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def delete(self, key: str) -> int:
+        try:
+            conn = self.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT size FROM entries WHERE key=?", (key,)).fetchone()
+                if row:
+                    conn.execute("DELETE FROM entries WHERE key=?", (key,))
+                    self._add_total_size(-row[0])
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except (sqlite3.Error, OSError):
+            return 0
+
+        return 1
+
+    def flush_all(self) -> None:
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM entries")
+        conn.execute("UPDATE meta SET value=0 WHERE name='total_size'")
+        conn.execute("COMMIT")
+
+    def get_stats(self, stat_args: str | None = None) -> list[tuple[str, dict[str, Any]]]:
+        """Get statistics, in the same form as memcached server stats.
+
+        Note that hit/miss counts are those of the current process only.
+        """
+        if stat_args == "reset":
+            for k in self._stats:
+                self._stats[k] = 0
+            return []
+
+        num_items, total_size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+
+        stats: dict[str, Any] = {
+            "uptime": int(current_time() - self._start_time),
+            "curr_items": num_items,
+            "curr_connections": 1,
+            "bytes": total_size,
+            "limit_maxbytes": self.max_size
+        }
+        stats.update(self._stats)
+
+        return [(uri_prefix + self.path + " (local)", stats)]
+
+    def disconnect_all(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _add_total_size(self, delta: int) -> int:
+        self.conn.execute(
+            "UPDATE meta SET value=value+? WHERE name='total_size'", (delta,))
+        return self.conn.execute(
+            "SELECT value FROM meta WHERE name='total_size'").fetchone()[0]
+
+    def _evict(self, target_size: int, total_size: int) -> None:
+        # expired entries go first, then least recently used
+        conn = self.conn
+        rows = conn.execute(
+            "SELECT key, size FROM entries "
+            "ORDER BY (expires > 0 AND expires < ?) DESC, atime ASC",
+            (current_time(),)
+        )
+
+        evicted = []
+        for key, size in rows:
+            if total_size <= target_size:
+                break
+            evicted.append((key,))
+            total_size -= size
+
+        conn.executemany("DELETE FROM entries WHERE key=?", evicted)
+        conn.execute(
+            "UPDATE meta SET value=? WHERE name='total_size'", (total_size,))
+        self._stats["evictions"] += len(evicted)
+
+    @classmethod
+    def _encode(cls, val: Any, min_compress_len: int) -> bytes:
+        data = pickle.dumps(val, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if min_compress_len and len(data) > min_compress_len:
+            compressed = zlib.compress(data)
+            if len(compressed) < len(data):
+                return b'z' + compressed
+
+        return b'p' + data
+
+    @classmethod
+    def _decode(cls, value: bytes) -> Any:
+        value = bytes(value)
+        data = value[1:]
+        if value[:1] == b'z':
+            data = zlib.decompress(data)
+        return pickle.loads(data)
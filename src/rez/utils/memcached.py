@@ -7,6 +7,7 @@ from __future__ import annotations
 from rez.config import config
 from rez.vendor.memcache.memcache import Client as Client_, \
     SERVER_MAX_KEY_LENGTH, __version__ as memcache_client_version
+from rez.utils import local_cache
 from rez.util import get_function_arg_names
 from threading import local
 from contextlib import contextmanager
@@ -23,13 +24,28 @@ CallableT = TypeVar("CallableT", bound=Callable)
 cache_interface_version = 2
 
 
+def get_cache_servers() -> list[str]:
+    """Get the uris of the cache servers to use, as configured.
+
+    If the 'local' cache backend is configured, this returns a single uri
+    pointing to the host-local cache store (see `rez.utils.local_cache`).
+
+    Returns:
+        list of str: Server uris. An empty list means caching is disabled.
+    """
+    if config.cache_backend == "local":
+        return [local_cache.uri_prefix + config.local_cache_path]
+    return config.memcached_uri or []
+
+
 class Client(object):
     """Wrapper for memcache.Client instance.
 
     Adds the features:
     - unlimited key length;
     - hard/soft flushing;
-    - ability to cache None.
+    - ability to cache None;
+    - host-local storage in place of memcached servers (see `get_cache_servers`).
     """
     class _Miss(object):
         def __bool__(self) -> bool:
@@ -50,7 +66,7 @@ class Client(object):
         """
         self.servers = [servers] if isinstance(servers, str) else servers
         self.key_hasher = self._debug_key_hash if debug else self._key_hash
-        self._client: Client_ | None = None
+        self._client: Client_ | local_cache.LocalCacheClient | None = None
         self.debug = debug
         self.current = ''
 
@@ -58,14 +74,15 @@ class Client(object):
         return bool(self.servers)
 
     @property
-    def client(self) -> Client_:
+    def client(self) -> Client_ | local_cache.LocalCacheClient:
         """Get the native memcache client.
 
         Returns:
-            `memcache.Client` instance.
+            `memcache.Client` instance, or `LocalCacheClient` instance if this
+            client uses the local cache store.
         """
         if self._client is None:
-            self._client = Client_(self.servers)
+            self._client = self._create_client(self.servers)
         return self._client
 
     def test_servers(self) -> set[str]:
@@ -76,7 +93,7 @@ class Client(object):
         """
         responders = set()
         for server in self.servers:
-            client = Client_([server])
+            client = self._create_client([server])
             key = uuid4().hex
             client.set(key, 1)
             if client.get(key) == 1:
@@ -184,6 +201,21 @@ class Client(object):
     def _get_stats(self, stat_args=None) -> list[tuple]:
         return self.client.get_stats(stat_args=stat_args)
 
+    @classmethod
+    def _create_client(cls, servers: list[str]) -> Client_ | local_cache.LocalCacheClient:
+        local_uris = [x for x in servers if local_cache.is_local_uri(x)]
+        if not local_uris:
+            return Client_(servers)
+
+        if len(servers) > 1:
+            raise ValueError(
+                "A local cache uri cannot be combined with other servers: %r"
+                % servers)
+
+        path = local_uris[0][len(local_cache.uri_prefix):]
+        return local_cache.LocalCacheClient(
+            path, max_size=config.local_cache_max_size * 1024 * 1024)
+
     @classmethod
     def _key_hash(cls, key: str) -> str:
         return md5(key.encode("utf-8")).hexdigest()
@@ -226,9 +258,12 @@ class _ScopedInstanceManager(local):
 
 scoped_instance_manager = _ScopedInstanceManager()
 
+# default value of `memcached_client` servers arg, meaning the configured servers
+_configured_servers = object()
+
 
 @contextmanager
-def memcached_client(servers=config.memcached_uri, debug=config.debug_memcache) -> Iterator[Client]:
+def memcached_client(servers=_configured_servers, debug=config.debug_memcache) -> Iterator[Client]:
     """Get a shared memcached instance.
 
     This function shares the same memcached instance across nested invocations.
@@ -238,9 +273,17 @@ def memcached_client(servers=config.memcached_uri, debug=config.debug_memcache)
     the cache server many times - such as a resolve, or executing a context. On
     exit of the topmost scope, the memcached client is disconnected.
 
+    Args:
+        servers (list of str): Server uris. Defaults to the configured cache
+            servers (see `get_cache_servers`).
+        debug (bool): See `Client`.
+
     Returns:
         `Client`: Memcached instance.
     """
+    if servers is _configured_servers:
+        servers = get_cache_servers()
+
     key = None
     try:
         client, key = scoped_instance_manager.acquire(servers, debug=debug)
@@ -25,7 +25,8 @@ Requirements and list of requirements are represented by :class:`Requirement` an
 """
 
 from rez.version._requirement import Requirement, RequirementList, VersionedObject
-from rez.version._util import ParseException, VersionError
+from rez.version._util import ParseException, VersionError, \
+    parse_cache_stats, clear_parse_caches
 from rez.version._version import (
     AlphanumericVersionToken,
     NumericToken,
@@ -47,4 +48,6 @@ __all__ = (
     "reverse_sort_key",
     "ParseException",
     "VersionError",
+    "parse_cache_stats",
+    "clear_parse_caches",
 )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from rez.version._version import Version, VersionRange
-from rez.version._util import _Common
+from rez.version._util import _Common, _ParseCacheType
 import re
 from typing import Iterator, Iterable
 
@@ -104,7 +104,7 @@ class VersionedObject(_Common):
         return self.name_ + sep_str + ver_str
 
 
-class Requirement(_Common):
+class Requirement(_Common, metaclass=_ParseCacheType):
     """
     Defines a requirement for an object. For example, ``foo-5+`` means that you
     require any version of ``foo``, version 5 or greater. An unversioned
@@ -135,6 +135,8 @@ class Requirement(_Common):
     - ``foo-1+<4.3``
     - ``foo<3``
     - ``foo==1.0.1``
+
+    Like version ranges, requirement strings are only parsed once, and cached.
     """
     sep_regex = re.compile(r'[-@#=<>]')
 
@@ -183,6 +185,15 @@ class Requirement(_Common):
             self.name_ = s
             self.range_ = VersionRange()
 
+    def _copy_parsed(self) -> Requirement:
+        # the range is copied too, since it can be changed in place (see
+        # VersionRange.visit_versions)
+        other = object.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
+        if self.range_ is not None:
+            other.range_ = self.range_._copy_parsed()
+        return other
+
     @classmethod
     def construct(cls, name: str, range: VersionRange | None = None) -> Requirement:
         """Create a requirement directly from an object name and VersionRange.
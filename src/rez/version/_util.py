@@ -2,8 +2,11 @@
 # Copyright Contributors to the Rez Project
 
 
+from __future__ import annotations
+
+from functools import lru_cache
 from itertools import groupby
-from typing import Iterable, Iterator, TypeVar
+from typing import Any, Iterable, Iterator, TypeVar
 
 T = TypeVar("T")
 
@@ -27,6 +30,49 @@ class _Common(object):
         return "%s(%r)" % (self.__class__.__name__, str(self))
 
 
+class _ParseCacheType(type):
+    """Metaclass that memoises parsing of objects from strings.
+
+    Creating an instance from a string (plus any other hashable arguments)
+    only parses the string the first time. Subsequent calls return a copy of
+    the cached instance (see the class's `_copy_parsed` method). Copies are
+    returned rather than the cached instance itself, because some objects can
+    be changed in place (see `VersionRange.visit_versions`). The cache is
+    bounded (least recently used instances are dropped) and thread-safe.
+    """
+    parse_cache_size = 10000
+    classes: list[type] = []
+
+    def __init__(cls, name: str, bases: tuple, dict_: dict[str, Any]) -> None:
+        super().__init__(name, bases, dict_)
+        cls._parse_cache = lru_cache(maxsize=cls.parse_cache_size)(
+            super().__call__)
+        _ParseCacheType.classes.append(cls)
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        if args and type(args[0]) is str:
+            return cls._parse_cache(*args, **kwargs)._copy_parsed()
+        return super().__call__(*args, **kwargs)
+
+
+def parse_cache_stats() -> dict[str, dict[str, int]]:
+    """Get hit/miss counts of the requirement and version range parse caches.
+
+    Returns:
+        dict: Stats (hits, misses, maxsize, currsize), keyed by class name.
+    """
+    return dict(
+        (cls.__name__, cls._parse_cache.cache_info()._asdict())
+        for cls in _ParseCacheType.classes
+    )
+
+
+def clear_parse_caches() -> None:
+    """Clear the requirement and version range parse caches."""
+    for cls in _ParseCacheType.classes:
+        cls._parse_cache.cache_clear()
+
+
 def dedup(iterable: Iterable[T]) -> Iterator[T]:
     """Removes duplicates from a sorted sequence."""
     for e in groupby(iterable):
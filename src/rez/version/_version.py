@@ -5,8 +5,9 @@
 from __future__ import annotations
 
 from rez.version._util import VersionError, ParseException, _Common, \
-    dedup
+    _ParseCacheType, dedup
 from bisect import bisect_left
+from weakref import WeakValueDictionary
 import copy
 import string
 import re
@@ -20,6 +21,11 @@ CallableT = TypeVar("CallableT", bound=Callable)
 
 re_token = re.compile(r"[a-zA-Z0-9_]+")
 
+# canonical instances of versions and version tokens, keyed by string. See
+# `_VersionType`
+_interned_versions: WeakValueDictionary[str, Version] = WeakValueDictionary()
+_interned_tokens: WeakValueDictionary[str, VersionToken] = WeakValueDictionary()
+
 
 class _Comparable(_Common):
     def __gt__(self, other: _Comparable) -> bool:
@@ -102,6 +108,14 @@ class VersionToken(_Comparable):
         """Returns the next largest token."""
         raise NotImplementedError
 
+    def sort_key(self) -> Any:
+        """Get a key that compares in the same way as this token.
+
+        Subclasses should return a tuple, or other builtin type, so that
+        version comparisons are fast. By default the token itself is returned.
+        """
+        return self
+
     def __str__(self) -> str:
         raise NotImplementedError
 
@@ -143,9 +157,12 @@ class NumericToken(VersionToken):
             return NotImplemented
         return (self.n < other.n)
 
+    def sort_key(self) -> int:
+        return self.n
+
     def __next__(self) -> NumericToken:
         other = copy.copy(self)
-        other.n = self.n = 1
+        other.n = self.n + 1
         return other
 
     def next(self) -> NumericToken:
@@ -230,6 +247,13 @@ class AlphanumericVersionToken(VersionToken):
     def less_than(self, other: AlphanumericVersionToken) -> bool:
         return (self.subtokens < other.subtokens)
 
+    def sort_key(self) -> tuple[tuple, ...]:
+        # alphas sort before numbers, see class docstring
+        return tuple(
+            (0, x.s) if x.n is None else (1, x.n, x.s)
+            for x in self.subtokens
+        )
+
     def __next__(self) -> AlphanumericVersionToken:
         other = AlphanumericVersionToken(None)
         other.subtokens = self.subtokens[:]
@@ -284,7 +308,29 @@ def reverse_sort_key(comparable: _Comparable) -> _ReversedComparable:
     return _ReversedComparable(comparable)
 
 
-class Version(_Comparable):
+class _VersionType(type):
+    """Metaclass that interns versions.
+
+    Creating a `Version` from a string returns the existing instance for that
+    string, if there is one. Versions are treated as immutable, so this is
+    safe, and greatly reduces memory use when many packages and requirements
+    share the same version numbers. Only versions using the default token
+    type are interned.
+    """
+    def __call__(cls, ver_str: str | None = '',
+                 make_token: Callable[[str], VersionToken] = AlphanumericVersionToken) -> Version:
+        if not ver_str or cls is not Version \
+                or make_token is not AlphanumericVersionToken:
+            return super().__call__(ver_str, make_token)
+
+        version = _interned_versions.get(ver_str)
+        if version is None:
+            version = super().__call__(ver_str, make_token)
+            _interned_versions[ver_str] = version
+        return version
+
+
+class Version(_Comparable, metaclass=_VersionType):
     """
     A Version is a sequence of zero or more version tokens, separated by either
     a dot ``.`` or hyphen ``-`` delimiters. Note that separators only affect Version
@@ -293,6 +339,10 @@ class Version(_Comparable):
 
     The empty version ``''`` is the smallest possible version, and can be used to
     represent an unversioned resource.
+
+    Versions are interned (there is one instance per version string) and must
+    not be modified. Comparisons and hashing are done on a tuple sort key,
+    which is calculated on first use.
     """
     inf = None
 
@@ -308,6 +358,7 @@ class Version(_Comparable):
         self.seps = []
         self._str: str | None = None
         self._hash: int | None = None
+        self._key: tuple | None = None
 
         if ver_str:
             toks = re_token.findall(ver_str)
@@ -318,12 +369,21 @@ class Version(_Comparable):
             if seps[0] or seps[-1] or max(len(x) for x in seps) > 1:
                 raise VersionError("Invalid version syntax: '%s'" % ver_str)
 
+            intern_tokens = (make_token is AlphanumericVersionToken)
+
             for tok in toks:
-                try:
-                    self.tokens.append(make_token(tok))
-                except VersionError as e:
-                    raise VersionError("Invalid version '%s': %s"
-                                       % (ver_str, str(e)))
+                token = _interned_tokens.get(tok) if intern_tokens else None
+
+                if token is None:
+                    try:
+                        token = make_token(tok)
+                    except VersionError as e:
+                        raise VersionError("Invalid version '%s': %s"
+                                           % (ver_str, str(e)))
+                    if intern_tokens:
+                        _interned_tokens[tok] = token
+
+                self.tokens.append(token)
 
             self.seps = seps[1:-1]
 
@@ -434,21 +494,55 @@ class Version(_Comparable):
         """The empty version equates to False."""
         return bool(self.tokens)
 
+    @property
+    def sort_key(self) -> tuple | None:
+        """Tuple that compares in the same way as the version.
+
+        Version.inf has no sort key (None is returned).
+
+        Returns:
+            tuple:
+        """
+        if self._key is None and self.tokens is not None:
+            self._key = tuple(x.sort_key() for x in self.tokens)
+        return self._key
+
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, Version) and self.tokens == other.tokens
+        if self is other:
+            return True
+        return isinstance(other, Version) and self.sort_key == other.sort_key
 
     def __lt__(self, other: object) -> bool:
-        if self.tokens is None:
-            return False
-        elif other.tokens is None:
-            return True
-        else:
-            return (self.tokens < other.tokens)
+        key, other_key = self._key, other._key
+
+        # keys not calculated yet, or Version.inf
+        if key is None or other_key is None:
+            if self.tokens is None:
+                return False
+            elif other.tokens is None:
+                return True
+            key, other_key = self.sort_key, other.sort_key
+
+        return key < other_key
+
+    def __gt__(self, other: object) -> bool:
+        return other < self
+
+    def __le__(self, other: object) -> bool:
+        return not other < self
+
+    def __ge__(self, other: object) -> bool:
+        return not self < other
 
     def __hash__(self) -> int:
         if self._hash is None:
-            self._hash = hash(None) if self.tokens is None \
-                else hash(tuple(map(str, self.tokens)))
+            if self.tokens and any(type(x).sort_key is VersionToken.sort_key
+                                   for x in self.tokens):
+                # a custom token type with no sort key, which may not be
+                # hashable
+                self._hash = hash(tuple(map(str, self.tokens)))
+            else:
+                self._hash = hash(self.sort_key)
         return self._hash
 
     def __str__(self) -> str:
@@ -585,6 +679,14 @@ class _Bound(_Comparable):
     def __hash__(self) -> int:
         return hash((self.lower, self.upper))
 
+    def copy(self) -> _Bound:
+        lower, upper = self.lower, self.upper
+        if lower is not _LowerBound.min:
+            lower = _LowerBound(lower.version, lower.inclusive)
+        if upper is not _UpperBound.inf:
+            upper = _UpperBound(upper.version, upper.inclusive)
+        return _Bound(lower, upper, invalid_bound_error=False)
+
     def lower_bounded(self) -> bool:
         return (self.lower != _LowerBound.min)
 
@@ -865,7 +967,7 @@ class _VersionRangeParser(object):
         self.bounds.append(_Bound(lower_bound, upper_bound, self.invalid_bound_error))
 
 
-class VersionRange(_Comparable):
+class VersionRange(_Comparable, metaclass=_ParseCacheType):
     """
     A version range is a set of one or more contiguous ranges of versions. For
     example, "3.0 or greater, but less than 4" is a contiguous range that contains
@@ -921,6 +1023,9 @@ class VersionRange(_Comparable):
     also be used as an upper or lower bound, leading to some odd but perfectly
     valid version range syntax. For example, ``>`` is a valid range - read like
     ``>''``, it means ``any version greater than the empty version``.
+
+    Version range strings are only parsed once, and cached (see
+    `parse_cache_stats`).
     """
     def __init__(self, range_str: str | None = '',
                  make_token: Callable[[str], VersionToken] = AlphanumericVersionToken,
@@ -955,6 +1060,13 @@ class VersionRange(_Comparable):
         else:
             self.bounds.append(_Bound.any)
 
+    def _copy_parsed(self) -> VersionRange:
+        # bounds are copied too, since visit_versions changes them in place
+        other = VersionRange(None)
+        other.bounds = [x.copy() for x in self.bounds]
+        other._str = self._str
+        return other
+
     def is_any(self) -> bool:
         """
         Returns:
@@ -1301,6 +1413,8 @@ class VersionRange(_Comparable):
                 if isinstance(result, Version):
                     bound.upper.version = result
 
+        self._str = None
+
     def __contains__(self, version_or_range: Version | VersionRange) -> bool:
         if isinstance(version_or_range, Version):
             return self.contains_version(version_or_range)
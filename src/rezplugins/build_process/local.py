@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from rez.config import config
 from rez.package_repository import package_repository_manager
-from rez.build_process import BuildProcessHelper, BuildType
+from rez.build_process import BuildProcessHelper, BuildType, get_build_log
 from rez.build_system import BuildResult
 from rez.release_hook import ReleaseHookEvent
 from rez.exceptions import BuildError, PackageTestError
@@ -23,12 +23,14 @@ from rez.utils.sourcecode import IncludeModuleManager
 from rez.utils.filesystem import TempDirs
 from rez.package_test import PackageTestRunner, PackageTestResults
 
+from contextlib import contextmanager
 from hashlib import sha1
 from typing import cast, TYPE_CHECKING
 import json
 import shutil
 import os
 import os.path
+import threading
 
 if TYPE_CHECKING:
     from rez.packages import Variant
@@ -42,7 +44,9 @@ class LocalBuildResult(BuildResult, total=False):
 class LocalBuildProcess(BuildProcessHelper):
     """The default build process.
 
-    This process builds a package's variants sequentially and on localhost.
+    This process builds a package's variants on localhost. Variants are built
+    sequentially, unless more than one build job is requested, in which case
+    they are built concurrently.
     """
 
     # see `self._run_tests`
@@ -57,17 +61,26 @@ class LocalBuildProcess(BuildProcessHelper):
         self.ran_test_names = set()
         self.all_test_results = PackageTestResults()
 
+        # serializes package repository updates and package tests, when
+        # variants are built concurrently
+        self._lock = threading.RLock()
+
+        # paths made temporarily writable, see `self._make_path_writable`
+        self._writable_paths = {}
+
     def build(self,
               install_path: str | None = None,
               clean: bool = False,
               install: bool = False,
-              variants: list[int] | None = None) -> int:
+              variants: list[int] | None = None,
+              jobs: int = 1) -> int:
         self._print_header("Building %s..." % self.package.qualified_name)
 
         # build variants
         num_visited, build_env_scripts = self.visit_variants(
             self._build_variant,
             variants=variants,
+            jobs=jobs,
             install_path=install_path,
             clean=clean,
             install=install)
@@ -156,13 +169,12 @@ class LocalBuildProcess(BuildProcessHelper):
         # create build/install paths
         install_path = install_path or self.package.config.local_packages_path
         package_install_path = self.get_package_install_path(install_path)
-        variant_build_path = self.build_path
+        variant_build_path = self.get_variant_build_path(variant)
 
         if variant.index is None:
             variant_install_path = package_install_path
         else:
             subpath = variant._non_shortlinked_subpath
-            variant_build_path = os.path.join(variant_build_path, subpath)
             variant_install_path = os.path.join(package_install_path, subpath)
 
         # create directories (build, install)
@@ -178,44 +190,45 @@ class LocalBuildProcess(BuildProcessHelper):
                                      topmost_path=install_path)
 
         if last_dir and config.make_package_temporarily_writable:
-            ctxt = make_path_writable(last_dir)
+            ctxt = self._make_path_writable(last_dir)
         else:
             ctxt = with_noop()
 
         with ctxt:
             if install:
-                # inform package repo that a variant is about to be built/installed
-                pkg_repo = package_repository_manager.get_repository(install_path)
-                pkg_repo.pre_variant_install(variant.resource)
-
-                os.makedirs(variant_install_path, exist_ok=True)
-
-                # if hashed variants are enabled, create the variant shortlink
-                if variant.parent.hashed_variants:
-                    try:
-                        # create the dir containing all shortlinks
-                        base_shortlinks_path = os.path.join(
-                            package_install_path,
-                            variant.parent.config.variant_shortlinks_dirname
-                        )
-
-                        os.makedirs(base_shortlinks_path, exist_ok=True)
-
-                        # create the shortlink
-                        rel_variant_path = os.path.relpath(
-                            variant_install_path, base_shortlinks_path)
-                        create_unique_base26_symlink(
-                            base_shortlinks_path, rel_variant_path)
-
-                    except Exception as e:
-                        # Treat any error as warning - lack of shortlink is not
-                        # a breaking issue, it just means the variant root path
-                        # will be long.
-                        #
-                        print_warning(
-                            "Error creating variant shortlink for %s: %s: %s",
-                            variant_install_path, e.__class__.__name__, e
-                        )
+                with self._lock:
+                    # inform package repo that a variant is about to be built/installed
+                    pkg_repo = package_repository_manager.get_repository(install_path)
+                    pkg_repo.pre_variant_install(variant.resource)
+
+                    os.makedirs(variant_install_path, exist_ok=True)
+
+                    # if hashed variants are enabled, create the variant shortlink
+                    if variant.parent.hashed_variants:
+                        try:
+                            # create the dir containing all shortlinks
+                            base_shortlinks_path = os.path.join(
+                                package_install_path,
+                                variant.parent.config.variant_shortlinks_dirname
+                            )
+
+                            os.makedirs(base_shortlinks_path, exist_ok=True)
+
+                            # create the shortlink
+                            rel_variant_path = os.path.relpath(
+                                variant_install_path, base_shortlinks_path)
+                            create_unique_base26_symlink(
+                                base_shortlinks_path, rel_variant_path)
+
+                        except Exception as e:
+                            # Treat any error as warning - lack of shortlink is not
+                            # a breaking issue, it just means the variant root path
+                            # will be long.
+                            #
+                            print_warning(
+                                "Error creating variant shortlink for %s: %s: %s",
+                                variant_install_path, e.__class__.__name__, e
+                            )
 
             # Re-evaluate the variant, so that variables such as 'building' and
             # 'build_variant_index' are set, and any early-bound package attribs
@@ -300,10 +313,36 @@ class LocalBuildProcess(BuildProcessHelper):
                 # Install include modules. Note that this doesn't need to be done
                 # multiple times, but for subsequent variants it has no effect.
                 #
-                self._install_include_modules(install_path)
+                with self._lock:
+                    self._install_include_modules(install_path)
 
             return build_result
 
+    @contextmanager
+    def _make_path_writable(self, path):
+        """Temporarily make `path` writable, for as long as any variant needs it.
+
+        Variants built concurrently are installed into the same package path.
+        The first variant makes the path writable, and its original mode is
+        only restored once the last variant using it is done.
+        """
+        with self._lock:
+            entry = self._writable_paths.get(path)
+            if entry is None:
+                ctxt = make_path_writable(path)
+                ctxt.__enter__()
+                entry = self._writable_paths[path] = [ctxt, 0]
+            entry[1] += 1
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._writable_paths[path]
+                    entry[0].__exit__(None, None, None)
+
     def _install_include_modules(self, install_path: str) -> None:
         # install 'include' sourcefiles, used by funcs decorated with @include
         if not self.package.includes:
@@ -353,8 +392,9 @@ class LocalBuildProcess(BuildProcessHelper):
 
         def cancel_variant_install() -> None:
             if install:
-                pkg_repo = package_repository_manager.get_repository(install_path)
-                pkg_repo.on_variant_install_cancelled(variant.resource)
+                with self._lock:
+                    pkg_repo = package_repository_manager.get_repository(install_path)
+                    pkg_repo.on_variant_install_cancelled(variant.resource)
 
         try:
             build_result = self._build_variant_base(
@@ -372,11 +412,12 @@ class LocalBuildProcess(BuildProcessHelper):
         if install:
             # run any tests that are configured to run pre-install
             try:
-                self._run_tests(
-                    variant,
-                    run_on=["pre_install"],
-                    package_install_path=build_result["package_install_path"]
-                )
+                with self._lock:
+                    self._run_tests(
+                        variant,
+                        run_on=["pre_install"],
+                        package_install_path=build_result["package_install_path"]
+                    )
             except PackageTestError:
                 # delete the installed variant payload
                 self._rmtree(build_result["variant_install_path"])
@@ -387,7 +428,8 @@ class LocalBuildProcess(BuildProcessHelper):
                 raise
 
             # install variant into package repository (ie update target package.py)
-            variant.install(install_path)
+            with self._lock:
+                variant.install(install_path)
 
         return build_result.get("build_env_script")
 
@@ -492,11 +534,17 @@ class LocalBuildProcess(BuildProcessHelper):
         # will be used
         package_paths = [testing_repo_path] + config.packages_path
 
+        # when variants are built in parallel, test output (including that of
+        # test commands) goes to the log of the variant being built
+        build_log = get_build_log()
+
         # run the tests, and raise an exception if any fail. This will abort
         # the install/release
         runner = PackageTestRunner(
             package_request=variant.parent.as_exact_requirement(),
             package_paths=package_paths,
+            stdout=build_log,
+            stderr=build_log,
             cumulative_test_results=self.all_test_results,
             stop_on_fail=True,
             verbose=1
@@ -17,7 +17,8 @@ class RemoteBuildProcess(BuildProcessHelper):
     def name(cls) -> str:
         return "remote"
 
-    def build(self, install_path=None, clean: bool = False, install: bool = False, variants=None):
+    def build(self, install_path=None, clean: bool = False, install: bool = False, variants=None,
+              jobs: int = 1):
         raise NotImplementedError("coming soon...")
 
     def release(self, release_message=None, variants=None):
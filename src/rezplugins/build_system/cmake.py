@@ -180,7 +180,8 @@ class CMakeBuildSystem(BuildSystem):
             block=True,
             cwd=build_path,
             actions_callback=actions_callback,
-            post_actions_callback=post_actions_callback
+            post_actions_callback=post_actions_callback,
+            **self.get_command_output_args()
         )
 
         ret = BuildResult()
@@ -232,7 +233,8 @@ class CMakeBuildSystem(BuildSystem):
             block=True,
             cwd=build_path,
             actions_callback=actions_callback,
-            post_actions_callback=post_actions_callback
+            post_actions_callback=post_actions_callback,
+            **self.get_command_output_args()
         )
 
         if not retcode and install and "install" not in cmd:
@@ -245,7 +247,8 @@ class CMakeBuildSystem(BuildSystem):
                 block=True,
                 cwd=build_path,
                 actions_callback=actions_callback,
-                post_actions_callback=post_actions_callback
+                post_actions_callback=post_actions_callback,
+                **self.get_command_output_args()
             )
 
         ret["success"] = (not retcode)
@@ -230,7 +230,8 @@ class CustomBuildSystem(BuildSystem):
             block=True,
             cwd=build_path,
             actions_callback=_actions_callback,
-            post_actions_callback=post_actions_callback
+            post_actions_callback=post_actions_callback,
+            **self.get_command_output_args()
         )
 
         ret["success"] = (not retcode)
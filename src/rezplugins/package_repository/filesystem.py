@@ -11,8 +11,10 @@ from contextlib import contextmanager
 from functools import lru_cache
 import os.path
 import os
+import pickle
 import stat
 import time
+from uuid import uuid4
 
 from rez.package_repository import PackageRepository
 from rez.package_resources import PackageFamilyResource, VariantResourceHelper, \
@@ -27,7 +29,8 @@ from rez.utils.resources import ResourcePool
 from rez.utils.formatting import is_valid_package_name
 from rez.utils.resources import cached_property
 from rez.utils.logging_ import print_warning, print_info
-from rez.utils.memcached import memcached, pool_memcached_connections
+from rez.utils.memcached import memcached, pool_memcached_connections, \
+    get_cache_servers
 from rez.utils.filesystem import make_path_writable, \
     canonical_path, is_subdirectory, safe_rmtree
 from rez.utils.platform_ import platform_
@@ -35,8 +38,9 @@ from rez.utils.yaml import load_yaml
 from rez.config import config
 from rez.vendor.schema.schema import Schema, Optional, And, Use, Or
 from rez.version import Version, VersionRange
+from rez.vendor.atomicwrites import atomic_write
 
-from typing import Any, Iterator, Iterable, TYPE_CHECKING
+from typing import Any, Callable, Iterator, Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Self
@@ -86,6 +90,119 @@ class PackageDefinitionFileMissing(PackageMetadataError):
     pass
 
 
+class _PackageMetadataIndex(object):
+    """On-disk index of the contents of a filesystem package repository.
+
+    The index stores the family listing of the repository root, and per family,
+    its version listing and the loaded package definition data. Every entry
+    carries the same key used to memcache the associated directory listing
+    (see `FileSystemPackageRepository._get_version_dirs__key`), so validating
+    an entry costs a single stat of the family directory.
+
+    Package data is stored pickled, and only unpickled on access. This keeps
+    loading the index cheap, and means every caller gets its own copy of the
+    data. The release time of each package is also stored unpickled, so that
+    timestamp-based package filtering and ordering need no package loads.
+    """
+
+    # this version should be changed if and when the index layout changes
+    format_version = 2
+
+    def __init__(self, filepath: str, check_package_definition_files: bool) -> None:
+        self.filepath = filepath
+        self.check_package_definition_files = check_package_definition_files
+
+        # key of the repository root listing, and the listing itself
+        self.families_key: str | None = None
+        self.families: list[tuple[str, str | None]] = []
+
+        # family name -> {"key": str, "versions": [str],
+        #                 "packages": {version_str: (filename, ext, file_key, blob)},
+        #                 "timestamps": {version_str: int}}
+        self.entries: dict[str, dict[str, Any]] = {}
+
+        # family name -> bool, entries validated by this process
+        self._validated: dict[str, bool] = {}
+
+    @classmethod
+    def load(cls, filepath: str,
+             check_package_definition_files: bool) -> _PackageMetadataIndex | None:
+        """Load an index from disk.
+
+        Returns:
+            `_PackageMetadataIndex`: The index, or None if it does not exist, is
+            unreadable, or was written with incompatible settings.
+        """
+        try:
+            with open(filepath, "rb") as f:
+                state = pickle.load(f)
+        except Exception as e:
+            if not isinstance(e, FileNotFoundError):
+                debug_print("Ignoring unreadable package index %s: %s", filepath, e)
+            return None
+
+        if not isinstance(state, dict) \
+                or state.get("format_version") != cls.format_version \
+                or state.get("check_package_definition_files") != check_package_definition_files:
+            return None
+
+        index = cls(filepath, check_package_definition_files)
+        index.families_key = state["families_key"]
+        index.families = state["families"]
+        index.entries = state["entries"]
+        return index
+
+    def save(self, mode: int | None = None) -> None:
+        """Atomically write the index to disk."""
+        state = {
+            "format_version": self.format_version,
+            "check_package_definition_files": self.check_package_definition_files,
+            "families_key": self.families_key,
+            "families": self.families,
+            "entries": self.entries
+        }
+
+        with atomic_write(self.filepath, mode="wb", overwrite=True) as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if mode is not None:
+            os.chmod(self.filepath, mode)
+
+    def get_families(self, key: str) -> list[tuple[str, str | None]] | None:
+        if key != self.families_key:
+            return None
+        return list(self.families)
+
+    def get_family(self, name: str, key_func: Callable[[], str]) -> dict[str, Any] | None:
+        """Get a valid family entry.
+
+        Args:
+            name (str): Package family name.
+            key_func (callable): Returns the current key of the family dir. This
+                is called at most once per family, per index instance.
+        """
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+
+        valid = self._validated.get(name)
+        if valid is None:
+            try:
+                valid = (key_func() == entry["key"])
+            except OSError:
+                valid = False
+            self._validated[name] = valid
+
+        return entry if valid else None
+
+    def set_family(self, name: str, entry: dict[str, Any] | None) -> None:
+        if entry is None:
+            self.entries.pop(name, None)
+        else:
+            self.entries[name] = entry
+        self._validated.pop(name, None)
+
+
 # ------------------------------------------------------------------------------
 # resources
 # ------------------------------------------------------------------------------
@@ -156,6 +273,10 @@ class FileSystemPackageResource(PackageResourceHelper):
 
     @cached_property
     def state_handle(self) -> float | None:
+        indexed = self._indexed_package
+        if indexed:
+            return indexed[2][1]  # package file mtime at index time
+
         if self.filepath:
             return os.path.getmtime(self.filepath)
         return None
@@ -188,18 +309,41 @@ class FileSystemPackageResource(PackageResourceHelper):
 
     @cached_property
     def _filepath_and_format(self) -> tuple[str, FileFormat] | tuple[None, None]:
+        indexed = self._indexed_package
+        if indexed:
+            filename, ext = indexed[:2]
+            return os.path.join(self.path, filename), FileFormat[ext]
+
         return self._repository._get_file(self.path)
 
+    @cached_property
+    def _indexed_package(self) -> tuple | None:
+        return self._repository._get_indexed_package(self.name, self.get("version"))
+
+    @cached_property
+    def timestamp(self) -> int:
+        # read from the metadata index if possible, to avoid a package load
+        timestamp = self._repository._get_indexed_timestamp(
+            self.name, self.get("version"))
+
+        if timestamp is None:
+            return self._timestamp
+        return timestamp
+
     def _load(self) -> dict[str, Any]:
         if self.filepath is None:
             raise PackageDefinitionFileMissing(
                 "Missing package definition file: %r" % self)
 
-        data = load_from_file(
-            self.filepath,
-            self.file_format,
-            disable_memcache=self._repository.disable_memcache
-        )
+        indexed = self._indexed_package
+        if indexed and indexed[3] is not None:
+            data = pickle.loads(indexed[3])
+        else:
+            data = load_from_file(
+                self.filepath,
+                self.file_format,
+                disable_memcache=self._repository.disable_memcache
+            )
 
         check_format_version(self.filepath, data)
 
@@ -474,10 +618,14 @@ class FileSystemPackageRepository(PackageRepository):
     schema_dict = {"file_lock_timeout": int,
                    "file_lock_dir": Or(None, str),
                    "file_lock_type": Or("default", "link", "mkdir", "symlink"),
-                   "package_filenames": [str]}
+                   "package_filenames": [str],
+                   "use_metadata_index": bool,
+                   "use_generation_counter": bool}
 
     building_prefix = ".building"
     ignore_prefix = ".ignore"
+    index_dirname = ".rez_index"
+    generation_filename = "generation"
 
     package_file_mode = (
         None if os.name == "nt" else
@@ -524,6 +672,14 @@ class FileSystemPackageRepository(PackageRepository):
         global _settings
         _settings = config.plugins.package_repository.filesystem
 
+        self.use_metadata_index = local_settings.get(
+            "use_metadata_index", _settings.use_metadata_index)
+        self.use_generation_counter = local_settings.get(
+            "use_generation_counter", _settings.use_generation_counter)
+        self._metadata_index: _PackageMetadataIndex | None | bool = None
+        self._pending_index_updates: set[str] = set()
+        self._lock_depth = 0
+
         self.register_resource(FileSystemPackageFamilyResource)
         self.register_resource(FileSystemPackageResource)
         self.register_resource(FileSystemVariantResource)
@@ -541,7 +697,7 @@ class FileSystemPackageRepository(PackageRepository):
         # decorate with memcachemed memoizers unless told otherwise
         if not self.disable_memcache:
             decorator1 = memcached(
-                servers=config.memcached_uri if config.cache_listdir else None,
+                servers=get_cache_servers() if config.cache_listdir else None,
                 min_compress_len=config.memcached_listdir_min_compress_len,
                 key=self._get_family_dirs__key,
                 debug=config.debug_memcache
@@ -549,7 +705,7 @@ class FileSystemPackageRepository(PackageRepository):
             self._get_family_dirs = decorator1(self._get_family_dirs)
 
             decorator2 = memcached(
-                servers=config.memcached_uri if config.cache_listdir else None,
+                servers=get_cache_servers() if config.cache_listdir else None,
                 min_compress_len=config.memcached_listdir_min_compress_len,
                 key=self._get_version_dirs__key,
                 debug=config.debug_memcache
@@ -593,6 +749,19 @@ class FileSystemPackageRepository(PackageRepository):
     def get_last_release_time(self, package_family_resource: PackageFamilyResource):
         return package_family_resource.get_last_release_time()
 
+    def get_generation(self) -> str | None:
+        if not self.use_generation_counter:
+            return None
+
+        try:
+            with open(self._generation_filepath) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None  # nothing has changed since the counter was enabled
+        except (IOError, OSError) as e:
+            debug_print("Cannot read generation of %s: %s", self.location, e)
+            return None
+
     def get_package_from_uri(self, uri: str) -> PackageResourceHelper | None:
         """
         Example URIs:
@@ -997,6 +1166,7 @@ class FileSystemPackageRepository(PackageRepository):
 
         lock_file = os.path.join(path, filename)
         lock = LockFile(lock_file)
+        self._lock_depth += 1
 
         try:
             lock.acquire(timeout=_settings.file_lock_timeout)
@@ -1008,6 +1178,12 @@ class FileSystemPackageRepository(PackageRepository):
             except NotLocked:
                 pass
 
+            # index updates are deferred until the lockfile is gone, as it
+            # changes the mtime of the repository root
+            self._lock_depth -= 1
+            if not self._lock_depth:
+                self._flush_index_updates()
+
     def clear_caches(self) -> None:
         super(FileSystemPackageRepository, self).clear_caches()
         self.get_families.cache_clear()
@@ -1015,6 +1191,7 @@ class FileSystemPackageRepository(PackageRepository):
         self.get_packages.cache_clear()
         self.get_variants.cache_clear()
         self.get_file.cache_clear()
+        self._metadata_index = None
 
         if not self.disable_memcache:
             self._get_family_dirs.forget()
@@ -1032,8 +1209,227 @@ class FileSystemPackageRepository(PackageRepository):
 
         return path
 
+    def rebuild_index(self) -> int:
+        """Rebuild the metadata index of this repository from scratch.
+
+        This is only necessary if package definition files have been changed
+        in place. Packages installed, removed or ignored via rez keep the index
+        up to date.
+
+        Returns:
+            int: Number of package families indexed.
+        """
+        if self.disable_pkg_ignore:
+            return self._copy().rebuild_index()
+
+        os.makedirs(os.path.dirname(self._index_filepath), exist_ok=True)
+        index = _PackageMetadataIndex(
+            self._index_filepath,
+            _settings.check_package_definition_files
+        )
+
+        families = self._list_family_dirs()
+        index.families_key = self._get_family_dirs__key()
+        index.families = families
+
+        for name, ext in families:
+            if ext is None:
+                index.set_family(name, self._create_index_entry(name))
+
+        index.save(mode=self.package_file_mode)
+        self.clear_caches()
+        return len(index.entries)
+
     # -- internal
 
+    @property
+    def _index_filepath(self) -> str:
+        return os.path.join(self.location, self.index_dirname, "index")
+
+    @property
+    def _generation_filepath(self) -> str:
+        return os.path.join(self.location, self.index_dirname,
+                            self.generation_filename)
+
+    def _bump_generation(self) -> None:
+        """Increment the generation counter of the repository.
+
+        The counter is stored along with a random token, so that two processes
+        bumping the same count concurrently still produce distinct generations.
+        """
+        filepath = self._generation_filepath
+
+        try:
+            with open(filepath) as f:
+                count = int(f.read().split()[0])
+        except (IOError, OSError, ValueError, IndexError):
+            count = 0
+
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with atomic_write(filepath, overwrite=True) as f:
+                f.write("%d %s\n" % (count + 1, uuid4().hex))
+        except Exception as e:
+            print_warning("Failed to update repository generation %s: %s",
+                          filepath, e)
+
+    def _get_metadata_index(self) -> _PackageMetadataIndex | None:
+        # the index reflects package ignores, so is unusable if they're disabled
+        if not self.use_metadata_index or self.disable_pkg_ignore:
+            return None
+
+        if self._metadata_index is None:
+            self._metadata_index = _PackageMetadataIndex.load(
+                self._index_filepath,
+                _settings.check_package_definition_files
+            ) or False
+
+        return self._metadata_index or None
+
+    def _get_indexed_package(self, name: str, version_str: str | None) -> tuple | None:
+        """Get a package's entry in the metadata index.
+
+        Returns:
+            tuple: (filename, ext, file_key, blob), or None if the package is not
+            in the index, or the index entry for its family is stale. Blob is
+            the pickled package data, or None if the data failed to load at
+            index time.
+        """
+        if not version_str:
+            return None  # unversioned packages are not indexed
+
+        index = self._get_metadata_index()
+        if index is None:
+            return None
+
+        family_path = os.path.join(self.location, name)
+        entry = index.get_family(
+            name, lambda: self._get_version_dirs__key(family_path))
+
+        if entry is None:
+            return None
+        return entry["packages"].get(version_str)
+
+    def _get_indexed_timestamp(self, name: str, version_str: str | None) -> int | None:
+        """Get a package's release time from the metadata index.
+
+        Returns:
+            int: Epoch time the package was released, or None if it is not
+            in the index (for example, if it has no timestamp).
+        """
+        if not version_str:
+            return None
+
+        index = self._get_metadata_index()
+        if index is None:
+            return None
+
+        family_path = os.path.join(self.location, name)
+        entry = index.get_family(
+            name, lambda: self._get_version_dirs__key(family_path))
+
+        if entry is None:
+            return None
+        return entry["timestamps"].get(version_str)
+
+    def _create_index_entry(self, name: str,
+                            previous_entry: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        family_path = os.path.join(self.location, name)
+        if not os.path.isdir(family_path):
+            return None
+
+        # get the key first, so a change made during the scan invalidates the entry
+        key = self._get_version_dirs__key(family_path)
+        versions = self._list_version_dirs(family_path)
+
+        prev_packages = (previous_entry or {}).get("packages", {})
+        prev_timestamps = (previous_entry or {}).get("timestamps", {})
+        packages = {}
+        timestamps = {}
+
+        for version_str in versions:
+            filepath, format_ = self._get_file(os.path.join(family_path, version_str))
+            if not filepath:
+                continue
+
+            filename = os.path.basename(filepath)
+            st = os.stat(filepath)
+            file_key = (int(st.st_ino), st.st_mtime)
+
+            # reuse data of package definitions that have not changed
+            prev = prev_packages.get(version_str)
+            if prev and prev[0] == filename and prev[2] == file_key:
+                packages[version_str] = prev
+                if version_str in prev_timestamps:
+                    timestamps[version_str] = prev_timestamps[version_str]
+                continue
+
+            try:
+                data = load_from_file(filepath, format_, disable_memcache=True)
+                blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                # leave it to a normal load to report the error
+                debug_print("Not indexing package data of %s: %s", filepath, e)
+                blob = None
+            else:
+                # old format packages store their timestamp elsewhere, these
+                # are left to a normal load
+                if isinstance(data.get("timestamp"), int):
+                    timestamps[version_str] = data["timestamp"]
+
+            packages[version_str] = (filename, format_.extension, file_key, blob)
+
+        return {
+            "key": key,
+            "versions": versions,
+            "packages": packages,
+            "timestamps": timestamps
+        }
+
+    def _flush_index_updates(self) -> None:
+        """Refresh the metadata index entries of families changed so far.
+        """
+        if not self._pending_index_updates:
+            return
+
+        pkg_names = sorted(self._pending_index_updates)
+        self._pending_index_updates.clear()
+
+        try:
+            self._update_index(pkg_names)
+        except Exception as e:
+            print_warning("Failed to update package index %s: %s",
+                          self._index_filepath, e)
+
+        self.clear_caches()
+
+    def _update_index(self, pkg_names: list[str]) -> None:
+        # create the index dir before getting the root listing key, so that
+        # writing the index does not invalidate the root listing
+        os.makedirs(os.path.dirname(self._index_filepath), exist_ok=True)
+
+        index = _PackageMetadataIndex.load(
+            self._index_filepath,
+            _settings.check_package_definition_files
+        )
+
+        if index is None:
+            index = _PackageMetadataIndex(
+                self._index_filepath,
+                _settings.check_package_definition_files
+            )
+
+        index.families_key = self._get_family_dirs__key()
+        index.families = self._list_family_dirs()
+
+        for pkg_name in pkg_names:
+            index.set_family(
+                pkg_name,
+                self._create_index_entry(pkg_name, index.entries.get(pkg_name))
+            )
+
+        index.save(mode=self.package_file_mode)
+
     def _get_family_dirs__key(self) -> str:
         if os.path.isdir(self.location):
             st = os.stat(self.location)
@@ -1042,6 +1438,15 @@ class FileSystemPackageRepository(PackageRepository):
             return str(("listdir", self.location))
 
     def _get_family_dirs(self) -> list[tuple[str, str | None]]:
+        index = self._get_metadata_index()
+        if index is not None:
+            dirs = index.get_families(self._get_family_dirs__key())
+            if dirs is not None:
+                return dirs
+
+        return self._list_family_dirs()
+
+    def _list_family_dirs(self) -> list[tuple[str, str | None]]:
         dirs: list[tuple[str, str | None]] = []
         if not os.path.isdir(self.location):
             return dirs
@@ -1049,7 +1454,7 @@ class FileSystemPackageRepository(PackageRepository):
         for name in os.listdir(self.location):
             path = os.path.join(self.location, name)
 
-            if name in ("settings.yaml", self.file_lock_dir):
+            if name in ("settings.yaml", self.index_dirname, self.file_lock_dir):
                 continue  # skip reserved file/dirnames
 
             if os.path.isdir(path):
@@ -1067,6 +1472,17 @@ class FileSystemPackageRepository(PackageRepository):
         return str(("listdir", root, int(st.st_ino), st.st_mtime))
 
     def _get_version_dirs(self, root: str) -> list[str]:
+        index = self._get_metadata_index()
+        if index is not None:
+            entry = index.get_family(
+                os.path.basename(root), lambda: self._get_version_dirs__key(root))
+
+            if entry is not None:
+                return list(entry["versions"])
+
+        return self._list_version_dirs(root)
+
+    def _list_version_dirs(self, root: str) -> list[str]:
         # Ignore a version if there is a .ignore<version> file next to it
         def ignore_dir(name: str) -> bool:
             if self.disable_pkg_ignore:
@@ -1512,9 +1928,19 @@ class FileSystemPackageRepository(PackageRepository):
         if os.path.exists(family_path):
             os.utime(family_path, None)
 
+        if self.use_generation_counter:
+            self._bump_generation()
+
         # clear internal caches, otherwise change may not be visible
         self.clear_caches()
 
+        # the index reflects package ignores, so can't be updated by a repo
+        # that disables them
+        if self.use_metadata_index and not self.disable_pkg_ignore:
+            self._pending_index_updates.add(pkg_name)
+            if not self._lock_depth:
+                self._flush_index_updates()
+
     def _delete_stale_build_tagfiles(self, family_path: str) -> None:
         now = time.time()
 
@@ -44,5 +44,34 @@ filesystem = {
     #
     "package_filenames": [
         "package"
-    ]
+    ],
+
+    # If True, the repository maintains an index file (under .rez_index/) in its
+    # root directory, holding the package family names, version lists and the
+    # evaluated package definitions. The index is rewritten whenever a package
+    # is installed, removed or ignored, and is read in place of directory scans
+    # and package.py evaluation. Entries are validated against the family
+    # directory mtime, so stale entries simply fall back to a normal scan.
+    #
+    # The index also holds the release time of each package, so timestamp
+    # package filters, the soft_timestamp package orderer and resolves with a
+    # timestamp (eg rez-env --time) don't need to load any packages.
+    #
+    # Note that a package.py edited in place (ie, not via a rez install or
+    # release) will not be seen until the index is rebuilt, using the
+    # rez-pkg-index tool.
+    #
+    "use_metadata_index": False,
+
+    # If True, the repository maintains a generation counter (under .rez_index/)
+    # that is bumped whenever a package is installed, removed or ignored. Cached
+    # resolves are then validated with a single read of this file per
+    # repository, rather than a file stat per variant and family in the resolve.
+    #
+    # Note that this is only safe if every rez install that writes to the
+    # repository has this enabled - a package released by a rez that does not
+    # bump the counter would go unnoticed by cached resolves. Packages edited in
+    # place are not seen either.
+    #
+    "use_generation_counter": False,
 }